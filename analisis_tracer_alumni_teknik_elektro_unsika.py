@@ -1,8 +1,27 @@
+import copy
+import functools
+import hashlib
+import io
+import json
+import os
+import pickle
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 import streamlit as st
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
-from typing import List
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.feather as feather
+from dataclasses import asdict, dataclass, field, fields, is_dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 # --- Konfigurasi dan Konstanta ---
 DATASET_PATH: str = "Dataset - unsika_tracer_alumni_teknik_elektro.csv"
@@ -22,38 +41,432 @@ REQUIRED_COLUMNS: List[str] = [
     "level_jabatan",
     "nps_0_10",
 ]
+EMPLOYED_STATUSES: List[str] = ["Bekerja", "Wirausaha"]
+CLEANING_PARAMS: dict = {"lower_quantile": 0.05, "upper_quantile": 0.95}
+CACHE_MAX_BYTES: int = int(os.environ.get("TRACER_CACHE_MAX_MB", "512")) * 1024 * 1024
+CACHE_DIR: Optional[str] = os.environ.get("TRACER_CACHE_DIR") or None
+CACHE_DISK_MAX_BYTES: int = int(os.environ.get("TRACER_CACHE_DISK_MAX_MB", "2048")) * 1024 * 1024
+SNAPSHOT_DIR: str = os.environ.get("TRACER_SNAPSHOT_DIR", ".tracer_snapshots")
+INCREMENTAL_DIR: str = os.environ.get("TRACER_INCREMENTAL_DIR", ".tracer_incremental")
+STREAM_CHUNK_ROWS: int = 200_000
+SKETCH_RELATIVE_ACCURACY: float = 0.001
+PLOT_CACHE_MAX_BYTES: int = int(os.environ.get("TRACER_PLOT_CACHE_MAX_MB", "128")) * 1024 * 1024
+PLOT_DPI: int = 200
+CHART_BACKENDS: List[str] = ["Matplotlib (PNG ter-cache)", "Native (Vega-Lite)"]
+CUBE_DIMENSIONS: List[str] = ["angkatan_lulus", "sektor", "level_jabatan", "magang", "status_saat_ini"]
+PROFILE_TRACE_MEMORY: bool = os.environ.get("TRACER_PROFILE_MEMORY", "0") == "1"
+PROFILE_LOG_PATH: Optional[str] = os.environ.get("TRACER_PROFILE_LOG") or None
+JOB_WORKERS: int = int(os.environ.get("TRACER_JOB_WORKERS", "4"))
+INFERENCE_RESAMPLES: int = int(os.environ.get("TRACER_INFERENCE_RESAMPLES", "4000"))
+INFERENCE_ALPHA: float = 0.05
+INFERENCE_SEED: int = 42
 
-st.set_page_config(layout="wide", page_title="Analisis Tracer Study Alumni Teknik Elektro UNSIKA")
+# --- Skema Dataset ---
+@dataclass(frozen=True)
+class ColumnSpec:
+    """Tipe ringkas, rentang nilai, dan (opsional) domain nilai yang diizinkan untuk satu kolom dataset."""
+    name: str
+    dtype: str
+    min_value: Optional[float] = None
+    max_value: Optional[float] = None
+    domain: Optional[Tuple[str, ...]] = None
+
+TRACER_SCHEMA: Dict[str, ColumnSpec] = {spec.name: spec for spec in [
+    ColumnSpec("alumni_id", "string[pyarrow]"),
+    ColumnSpec("angkatan_lulus", "Int16", 1950, 2100),
+    ColumnSpec("status_saat_ini", "category", domain=("Bekerja", "Wirausaha", "Studi Lanjut", "Belum Bekerja")),
+    ColumnSpec("ipk", "float32", 0.0, 4.0),
+    ColumnSpec("magang", "boolean"),
+    ColumnSpec("sertifikasi", "boolean"),
+    ColumnSpec("projects_count", "Int16", 0, None),
+    ColumnSpec("ttfj_bulan", "float64"),  # nilai negatif ditangani oleh clean_data
+    ColumnSpec("gaji_awal_idr", "float64"),  # float32 tidak presisi untuk nominal rupiah
+    ColumnSpec("kesesuaian_bidang_1_5", "Int8", 1, 5),
+    ColumnSpec("relevansi_kurikulum_1_5", "Int8", 1, 5),
+    ColumnSpec("sektor", "category"),
+    ColumnSpec("level_jabatan", "category"),
+    ColumnSpec("nps_0_10", "Int8", 0, 10),
+]}
+
+# --- Profiling Tahap Pipeline ---
+@dataclass
+class StageRecord:
+    """Pengukuran satu tahap pipeline: waktu dalam detik, memori dalam byte."""
+    stage: str
+    parent: Optional[str]
+    depth: int
+    started_at: float
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    peak_bytes: Optional[int] = None
+    rows_in: Optional[int] = None
+    rows_out: Optional[int] = None
+    cache_hits: int = 0
+    cache_misses: int = 0
+    error: Optional[str] = None
+
+def _row_count(value) -> Optional[int]:
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return len(value)
+    total = getattr(value, 'total_responden', None)
+    return int(total) if total is not None else None
+
+def active_profiler() -> Optional["Profiler"]:
+    """Profiler yang aktif di thread ini (satu thread skrip per sesi Streamlit).
+
+    Disimpan sebagai atribut objek thread, bukan threading.local modul, karena Streamlit
+    mengeksekusi ulang skrip setiap rerun: objek ter-cache dari rerun sebelumnya (cube,
+    ResultCache) memanggil fungsi modul lama dan tetap harus menemukan profiler yang sama.
+    """
+    return getattr(threading.current_thread(), '_tracer_profiler', None)
+
+class Profiler:
+    """Pencatat waktu wall/CPU, puncak alokasi, jumlah baris, dan hit cache per tahap.
+
+    Tahap boleh bersarang; CPU diukur dengan thread_time sehingga sesi lain yang
+    berjalan bersamaan tidak ikut terhitung. tracemalloc bersifat opsional karena
+    memperlambat setiap alokasi. tracemalloc global untuk seluruh proses, jadi
+    start/stop dan reset puncak dikoordinasikan lewat ProfileRegistry bersama;
+    profiler tanpa registry memakai registry sendiri (cukup untuk CLI satu sesi).
+    """
+    def __init__(self, trace_memory: bool = False, registry: Optional["ProfileRegistry"] = None):
+        self.trace_memory = trace_memory
+        self.registry = registry if registry is not None else ProfileRegistry()
+        self.records: List[StageRecord] = []
+        self._stack: List[Tuple[StageRecord, int, List[int]]] = []
+
+    @contextmanager
+    def activate(self):
+        """Memasang profiler untuk thread ini; fungsi ber-@profiled lalu tercatat otomatis."""
+        thread = threading.current_thread()
+        previous = active_profiler()
+        thread._tracer_profiler = self
+        if self.trace_memory:
+            self.registry.start_tracing()
+        try:
+            yield self
+        finally:
+            thread._tracer_profiler = previous
+            if self.trace_memory:
+                self.registry.stop_tracing()
+
+    @contextmanager
+    def stage(self, name: str, rows_in: Optional[int] = None):
+        """Context manager (juga dapat dipakai sebagai dekorator) untuk satu tahap."""
+        parent = self._stack[-1][0].stage if self._stack else None
+        record = StageRecord(name, parent, len(self._stack), time.time(), rows_in=rows_in)
+        self.records.append(record)
+        tracing = self.trace_memory and tracemalloc.is_tracing()
+        memory_start, peak_seen = 0, [0]
+        if tracing:
+            memory_start, peak_seen = self.registry.open_peak()
+        self._stack.append((record, memory_start, peak_seen))
+        wall_start, cpu_start = time.perf_counter(), time.thread_time()
+        try:
+            yield record
+        except BaseException as exc:
+            record.error = f"{type(exc).__name__}: {exc}"
+            raise
+        finally:
+            record.wall_seconds = time.perf_counter() - wall_start
+            record.cpu_seconds = time.thread_time() - cpu_start
+            self._stack.pop()
+            if tracing:
+                record.peak_bytes = max(0, self.registry.close_peak(peak_seen) - memory_start)
+
+    def note_cache(self, hit: bool) -> None:
+        """Dipanggil ResultCache; hit/miss dihitung untuk semua tahap yang sedang terbuka."""
+        for record, _, _ in self._stack:
+            if hit:
+                record.cache_hits += 1
+            else:
+                record.cache_misses += 1
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame([asdict(record) for record in self.records])
+
+    def to_json_lines(self, **context) -> str:
+        """Satu objek JSON per tahap, ditambah konteks (mis. sidik jari dataset)."""
+        return ''.join(json.dumps({**context, **asdict(record)}, ensure_ascii=False) + '\n' for record in self.records)
+
+def profiled(name: Optional[str] = None):
+    """Dekorator tahap; tanpa profiler aktif fungsi dipanggil langsung tanpa pengukuran."""
+    def decorate(func):
+        stage_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            profiler = active_profiler()
+            if profiler is None:
+                return func(*args, **kwargs)
+            rows_in = next((len(arg) for arg in args if isinstance(arg, (pd.DataFrame, pd.Series))), None)
+            with profiler.stage(stage_name, rows_in=rows_in) as record:
+                result = func(*args, **kwargs)
+                record.rows_out = _row_count(result)
+            return result
+        return wrapper
+    return decorate
+
+def _prometheus_label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+class ProfileRegistry:
+    """Agregat profil seluruh sesi dalam satu proses server, untuk mencari jalur panas.
+
+    Registry juga pemilik tunggal tracemalloc di proses ini: start/stop dihitung
+    referensinya per profiler aktif, dan setiap reset puncak terlebih dulu menyalurkan
+    puncak berjalan ke semua tahap yang masih terbuka (dari sesi mana pun). Puncak
+    suatu tahap karena itu tidak pernah hilang, tetapi bila beberapa sesi melacak
+    memori bersamaan, nilainya adalah batas atas yang ikut memuat alokasi sesi lain.
+    """
+    METRICS = [
+        ('calls_total', 'counter', 'Jumlah eksekusi tahap.'),
+        ('wall_seconds_total', 'counter', 'Total waktu wall tahap (detik).'),
+        ('cpu_seconds_total', 'counter', 'Total waktu CPU thread tahap (detik).'),
+        ('wall_seconds_max', 'gauge', 'Waktu wall terlama satu eksekusi (detik).'),
+        ('peak_bytes_max', 'gauge', 'Puncak alokasi tracemalloc terbesar (byte).'),
+        ('rows_out_total', 'counter', 'Total baris keluaran tahap.'),
+        ('cache_hits_total', 'counter', 'Hit ResultCache selama tahap.'),
+        ('cache_misses_total', 'counter', 'Miss ResultCache selama tahap.'),
+        ('errors_total', 'counter', 'Eksekusi tahap yang berakhir dengan galat.'),
+    ]
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stages: Dict[str, Dict[str, float]] = {}
+        self._tracing_users = 0
+        self._owns_tracing = False
+        self._open_peaks: Dict[int, List[int]] = {}
+
+    def start_tracing(self) -> None:
+        with self._lock:
+            self._tracing_users += 1
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._owns_tracing = True
+
+    def stop_tracing(self) -> None:
+        """tracemalloc baru dihentikan saat profiler pelacak terakhir selesai."""
+        with self._lock:
+            self._tracing_users -= 1
+            if self._tracing_users == 0 and self._owns_tracing:
+                tracemalloc.stop()
+                self._owns_tracing = False
+                self._open_peaks.clear()
+
+    def open_peak(self) -> Tuple[int, List[int]]:
+        """Memulai pelacakan puncak satu tahap; mengembalikan (memori awal, penampung puncak)."""
+        with self._lock:
+            current, peak = tracemalloc.get_traced_memory()
+            for seen in self._open_peaks.values():
+                seen[0] = max(seen[0], peak)
+            tracemalloc.reset_peak()
+            seen = [current]
+            self._open_peaks[id(seen)] = seen
+            return current, seen
+
+    def close_peak(self, seen: List[int]) -> int:
+        """Puncak absolut sejak open_peak, termasuk puncak yang tersalur sebelum reset."""
+        with self._lock:
+            self._open_peaks.pop(id(seen), None)
+            if not tracemalloc.is_tracing():
+                return seen[0]
+            return max(seen[0], tracemalloc.get_traced_memory()[1])
+
+    def observe(self, records: Iterable[StageRecord]) -> None:
+        with self._lock:
+            for record in records:
+                stats = self._stages.setdefault(record.stage, {metric: 0 for metric, _, _ in self.METRICS})
+                stats['calls_total'] += 1
+                stats['wall_seconds_total'] += record.wall_seconds
+                stats['cpu_seconds_total'] += record.cpu_seconds
+                stats['wall_seconds_max'] = max(stats['wall_seconds_max'], record.wall_seconds)
+                stats['peak_bytes_max'] = max(stats['peak_bytes_max'], record.peak_bytes or 0)
+                stats['rows_out_total'] += record.rows_out or 0
+                stats['cache_hits_total'] += record.cache_hits
+                stats['cache_misses_total'] += record.cache_misses
+                stats['errors_total'] += record.error is not None
+
+    def to_frame(self) -> pd.DataFrame:
+        with self._lock:
+            frame = pd.DataFrame.from_dict(self._stages, orient='index')
+        return frame.sort_values('wall_seconds_total', ascending=False) if not frame.empty else frame
+
+    def to_prometheus(self, prefix: str = 'tracer_stage') -> str:
+        """Format teks eksposisi Prometheus, satu seri per tahap."""
+        with self._lock:
+            stages = {stage: dict(stats) for stage, stats in self._stages.items()}
+        lines = []
+        for metric, kind, help_text in self.METRICS:
+            lines.append(f"# HELP {prefix}_{metric} {help_text}")
+            lines.append(f"# TYPE {prefix}_{metric} {kind}")
+            for stage, stats in sorted(stages.items()):
+                lines.append(f'{prefix}_{metric}{{stage="{_prometheus_label(stage)}"}} {stats[metric]}')
+        return '\n'.join(lines) + '\n'
+
+# --- Statistik Terkelompok Tervektorisasi ---
+def _as_float(series: pd.Series) -> np.ndarray:
+    """Mengambil kolom numerik sebagai array float64 (NA -> NaN) tanpa membuat DataFrame baru."""
+    return series.to_numpy(dtype=np.float64, na_value=np.nan)
+
+def _factorize(series: pd.Series) -> Tuple[np.ndarray, pd.Index]:
+    """Mengubah kolom kategori menjadi kode grup terurut (-1 untuk NA) beserta labelnya."""
+    codes, uniques = pd.factorize(series, sort=True)
+    return codes, pd.Index(uniques, name=series.name)
+
+def _quantile_positions(counts: np.ndarray, qs: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Indeks bawah/atas (relatif terhadap awal grup) dan bobot interpolasi per (grup, q)."""
+    virtual = (counts[:, None] - 1) * qs[None, :]
+    lower = np.floor(virtual)
+    gamma = virtual - lower
+    last = np.maximum(counts - 1, 0)[:, None]
+    lower_idx = np.clip(lower, 0, last).astype(np.int64)
+    upper_idx = np.clip(lower + 1, 0, last).astype(np.int64)
+    return lower_idx, upper_idx, gamma
+
+def _interpolate(lower: np.ndarray, upper: np.ndarray, gamma: np.ndarray, average_middle: bool) -> np.ndarray:
+    if average_middle:
+        # Median pandas/NumPy: rata-rata dua nilai tengah, bukan interpolasi linear
+        return np.where(gamma == 0, lower, (lower + upper) / 2)
+    # Rumus interpolasi yang sama dengan np.quantile(method='linear')
+    diff = upper - lower
+    return np.where(gamma >= 0.5, upper - diff * (1 - gamma), lower + diff * gamma)
+
+def _partition_quantiles(segment: np.ndarray, qs: np.ndarray, average_middle: bool) -> np.ndarray:
+    """Kuantil satu segmen tanpa NaN; segmen di-partition di tempat (isinya teracak)."""
+    if segment.size == 0:
+        return np.full(qs.size, np.nan)
+    lower_idx, upper_idx, gamma = (arr[0] for arr in _quantile_positions(np.array([segment.size]), qs))
+    segment.partition(np.unique(np.concatenate([lower_idx, upper_idx])))
+    return _interpolate(segment[lower_idx], segment[upper_idx], gamma, average_middle)
+
+def _as_quantiles(qs: Iterable[float]) -> np.ndarray:
+    # Series.quantile meneruskan q * 100 ke np.percentile yang membaginya kembali dengan 100;
+    # pembulatan yang sama dipakai agar batas winsorization identik dengan versi pandas
+    return np.atleast_1d(np.asarray(list(qs), dtype=np.float64)) * 100 / 100
+
+def _small_codes(codes: np.ndarray, n_groups: int) -> np.ndarray:
+    # Sort stabil NumPy memakai radix sort untuk integer <= 16 bit: O(n), bukan O(n log n)
+    if n_groups <= np.iinfo(np.int8).max:
+        return codes.astype(np.int8)
+    return codes.astype(np.int16) if n_groups <= np.iinfo(np.int16).max else codes
+
+def group_quantiles(values: np.ndarray, codes: np.ndarray, n_groups: int, qs: Iterable[float],
+                    mask: Optional[np.ndarray] = None, average_middle: bool = False) -> np.ndarray:
+    """Semua kuantil untuk semua grup dalam satu jalan: matriks (grup x qs), NaN untuk grup kosong.
+
+    Baris dikelompokkan dengan satu radix sort atas kode grup hasil faktorisasi, lalu
+    setiap segmen grup cukup di-np.partition pada indeks yang dibutuhkan (tanpa
+    pengurutan penuh). codes = -1 dan NaN dilewati; mask memfilter baris tambahan.
+    average_middle memakai aturan median (rata-rata dua nilai tengah) untuk q = 0.5.
+    """
+    qs = _as_quantiles(qs)
+    values = np.asarray(values, dtype=np.float64)
+    valid = (codes >= 0) & ~np.isnan(values)
+    if mask is not None:
+        valid &= mask
+    group = codes[valid]
+    ordered = values[valid][np.argsort(_small_codes(group, n_groups), kind='stable')]
+    counts = np.bincount(group, minlength=n_groups)
+    ends = np.cumsum(counts)
+    result = np.full((n_groups, qs.size), np.nan)
+    for g in np.flatnonzero(counts):
+        result[g] = _partition_quantiles(ordered[ends[g] - counts[g]:ends[g]], qs, average_middle)
+    return result
+
+def histogram_quantiles(hist: np.ndarray, uniques: np.ndarray, qs: Iterable[float],
+                        average_middle: bool = False) -> np.ndarray:
+    """Kuantil setiap baris matriks histogram (grup x nilai unik terurut): matriks (grup x qs).
+
+    Nilai pada peringkat k dicari lewat searchsorted atas frekuensi kumulatif, sehingga hasilnya
+    sama dengan group_quantiles atas baris aslinya tanpa menyentuh baris; grup kosong bernilai NaN.
+    """
+    qs = _as_quantiles(qs)
+    cumulative = np.cumsum(np.atleast_2d(hist), axis=1)
+    counts = cumulative[:, -1] if cumulative.shape[1] else np.zeros(len(cumulative), dtype=np.int64)
+    lower_idx, upper_idx, gamma = _quantile_positions(counts, qs)
+    values = np.asarray(uniques, dtype=np.float64)
+    result = np.full((len(cumulative), qs.size), np.nan)
+    for g in np.flatnonzero(counts):
+        lower = values[np.searchsorted(cumulative[g], lower_idx[g], side='right')]
+        upper = values[np.searchsorted(cumulative[g], upper_idx[g], side='right')]
+        result[g] = _interpolate(lower, upper, gamma[g], average_middle)
+    return result
+
+def quantiles(values: np.ndarray, qs: Iterable[float]) -> np.ndarray:
+    """Beberapa kuantil satu array (NaN diabaikan) lewat satu np.partition; sama dengan Series.quantile."""
+    values = np.asarray(values, dtype=np.float64)
+    return _partition_quantiles(values[~np.isnan(values)], _as_quantiles(qs), average_middle=False)
+
+def median(values: np.ndarray, mask: Optional[np.ndarray] = None) -> float:
+    """Median (NaN diabaikan) lewat np.partition; sama dengan Series.median()."""
+    values = np.asarray(values, dtype=np.float64)
+    valid = ~np.isnan(values) if mask is None else mask & ~np.isnan(values)
+    return float(_partition_quantiles(values[valid], _as_quantiles([0.5]), average_middle=True)[0])
+
+def group_median(values: np.ndarray, codes: np.ndarray, labels: pd.Index, name: str) -> pd.Series:
+    """Median per grup yang muncul di `codes`, seperti groupby(observed=True).median()."""
+    present = np.bincount(codes[codes >= 0], minlength=len(labels)) > 0
+    medians = group_quantiles(values, codes, len(labels), [0.5], average_middle=True)[:, 0]
+    return pd.Series(medians[present], index=labels[present], name=name)
+
+def group_ratio(numerator: np.ndarray, codes: np.ndarray, n_groups: int,
+                mask: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Rasio (%) baris bernilai True per grup via bincount, pengganti groupby().apply(lambda).
+
+    Mengembalikan (rasio, jumlah baris per grup); grup kosong bernilai NaN.
+    """
+    valid = codes >= 0 if mask is None else mask & (codes >= 0)
+    totals = np.bincount(codes[valid], minlength=n_groups)
+    hits = np.bincount(codes[valid & numerator], minlength=n_groups)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return hits / totals * 100, totals
+
+def grouped_median(df: pd.DataFrame, by: str, columns: List[str]) -> pd.DataFrame:
+    """Median beberapa kolom per grup dengan satu faktorisasi kunci grup.
+
+    Pengganti df.groupby(by, observed=True)[columns].median() yang dipakai fungsi compute_*.
+    """
+    codes, labels = _factorize(df[by])
+    medians = {}
+    for col in columns:
+        result = group_median(_as_float(df[col]), codes, labels, col)
+        # groupby().median() mempertahankan dtype float kolom (mis. float32 untuk ipk)
+        medians[col] = result.astype(df[col].dtype) if df[col].dtype.kind == 'f' else result
+    return pd.DataFrame(medians)
 
 # --- Utilitas Analitik (Pure Functions) ---
-def clean_data(df: pd.DataFrame) -> pd.DataFrame:
-    """Membersihkan data: duplikat, missing value, dan nilai ekstrem.
-    Mengembalikan salinan DataFrame yang telah dibersihkan.
+@profiled()
+def clean_data(df: pd.DataFrame, lower_quantile: float = 0.05, upper_quantile: float = 0.95,
+               profile: Optional["DataProfile"] = None) -> pd.DataFrame:
+    """Membersihkan data: duplikat, missing value, nilai di luar rentang skema, dan nilai ekstrem.
+    Baris yang dipertahankan diambil dari mask DataProfile (dihitung bila tidak diberikan);
+    DataFrame masukan tidak diubah dan hasilnya adalah salinan baru.
     """
-    df.drop_duplicates(inplace=True)
-    df.dropna(subset=['ttfj_bulan', 'gaji_awal_idr'], inplace=True)
-    df = df[df['ttfj_bulan'] >= 0]
+    profile = profile if profile is not None else profile_data(df)
+    df = df.take(np.flatnonzero(profile.keep))
     
-    df_working = df[df['status_saat_ini'].isin(['Bekerja', 'Wirausaha'])]
-    if not df_working.empty:
-        q5 = df_working['gaji_awal_idr'].quantile(0.05)
-        q95 = df_working['gaji_awal_idr'].quantile(0.95)
+    working = df['status_saat_ini'].isin(EMPLOYED_STATUSES).to_numpy()
+    if working.any():
+        q5, q95 = quantiles(_as_float(df['gaji_awal_idr'])[working], [lower_quantile, upper_quantile])
         df['gaji_awal_idr'] = df['gaji_awal_idr'].clip(lower=q5, upper=q95)
         
     return df
 
+@profiled()
 def compute_summary_metrics(df: pd.DataFrame) -> dict:
     """Menghitung metrik ringkas utama untuk header analitik."""
     df_employed = df[df['status_saat_ini'].isin(['Bekerja', 'Wirausaha'])]
     return {
         'total_responden': int(df.shape[0]),
-        'ipk_median': float(df['ipk'].median()),
-        'ttfj_median_employed': float(df_employed['ttfj_bulan'].median()),
-        'gaji_median_employed': float(df_employed['gaji_awal_idr'].median()),
+        'ipk_median': median(_as_float(df['ipk'])),
+        'ttfj_median_employed': median(_as_float(df_employed['ttfj_bulan'])),
+        'gaji_median_employed': median(_as_float(df_employed['gaji_awal_idr'])),
         'distribusi_status': df['status_saat_ini'].value_counts(),
         'describe_awal': df.describe(include='all'),
     }
 
+@profiled()
 def compute_performance_metrics(df: pd.DataFrame) -> dict:
     """Menghitung metrik kinerja (TTFJ<=6, TTFJ/gaji per angkatan, kesesuaian, NPS)."""
     employed_mask = df['status_saat_ini'].isin(['Bekerja', 'Wirausaha'])
@@ -61,8 +474,9 @@ def compute_performance_metrics(df: pd.DataFrame) -> dict:
     employed_in_6 = int(df[employed_mask & (df['ttfj_bulan'] <= 6)].shape[0])
     proporsi_ttjf_6 = employed_in_6 / total_employed * 100
 
-    ttjf_per_angkatan = df.groupby('angkatan_lulus')['ttfj_bulan'].median()
-    gaji_per_angkatan = df.groupby('angkatan_lulus')['gaji_awal_idr'].median()
+    per_angkatan = grouped_median(df, 'angkatan_lulus', ['ttfj_bulan', 'gaji_awal_idr'])
+    ttjf_per_angkatan = per_angkatan['ttfj_bulan']
+    gaji_per_angkatan = per_angkatan['gaji_awal_idr']
 
     bidang_sesuai = int(df[employed_mask & (df['kesesuaian_bidang_1_5'] >= 4)].shape[0])
     proporsi_bidang_sesuai = bidang_sesuai / total_employed * 100
@@ -77,17 +491,1308 @@ def compute_performance_metrics(df: pd.DataFrame) -> dict:
         'nps': float(nps),
     }
 
+@profiled()
 def compute_comparison_stats(df: pd.DataFrame) -> dict:
     """Menghitung statistik perbandingan magang vs non-magang dan gaji per level."""
-    ttfj_magang = float(df[df['magang'] == 1]['ttfj_bulan'].median())
-    ttfj_non_magang = float(df[df['magang'] == 0]['ttfj_bulan'].median())
-    gaji_per_level = df.groupby('level_jabatan')['gaji_awal_idr'].median().sort_values()
+    magang = _as_float(df['magang'])
+    magang_codes = np.select([magang == 0, magang == 1], [0, 1], default=-1).astype(np.int8)
+    ttfj_non_magang, ttfj_magang = group_quantiles(_as_float(df['ttfj_bulan']), magang_codes, 2, [0.5], average_middle=True)[:, 0]
+    gaji_per_level = grouped_median(df, 'level_jabatan', ['gaji_awal_idr'])['gaji_awal_idr'].sort_values()
     return {
         'ttfj_magang': ttfj_magang,
         'ttfj_non_magang': ttfj_non_magang,
         'gaji_per_level': gaji_per_level,
     }
 
+# --- Mesin Agregasi Terpadu ---
+@dataclass(frozen=True)
+class AnalyticsResult:
+    """Hasil agregasi tunggal yang dibaca oleh seluruh bagian dashboard."""
+    total_responden: int
+    total_employed: int
+    ipk_median: float
+    ttfj_median_employed: float
+    gaji_median_employed: float
+    distribusi_status: pd.Series
+    status_per_angkatan: pd.DataFrame
+    proporsi_ttjf_6: float
+    ttjf_per_angkatan: pd.Series
+    gaji_per_angkatan: pd.Series
+    proporsi_bidang_sesuai: float
+    nps: float
+    kesesuaian_per_sektor: pd.Series
+    ttfj_distribution: pd.Series  # nilai unik TTFJ (Bekerja/Wirausaha) -> frekuensi
+    ttfj_magang: float
+    ttfj_non_magang: float
+    gaji_per_level: pd.Series
+
+def share_percent(hits: float, total: float) -> float:
+    """Persentase hits terhadap total; total 0 dianggap 1 (hasil 0%, bukan NaN)."""
+    return float(hits / (total if total > 0 else 1) * 100)
+
+def nps_score(promoters: float, detractors: float, total: float) -> float:
+    """Net Promoter Score (%): promotor (skor 9-10) dikurangi detraktor (skor 0-6) terhadap seluruh responden."""
+    return share_percent(promoters - detractors, total)
+
+def kpi_masks(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """Mask baris untuk setiap hitungan KpiCounts; satu-satunya definisi baris bekerja, TTFJ ≤ 6, dst."""
+    status_codes, status_labels = _factorize(df['status_saat_ini'])
+    employed = np.isin(status_codes, np.flatnonzero(status_labels.isin(EMPLOYED_STATUSES)))
+    nps_scores = _as_float(df['nps_0_10'])
+    return {
+        'employed': employed,
+        'ttfj_le6': employed & (_as_float(df['ttfj_bulan']) <= 6),
+        'kesesuaian_ok': employed & (_as_float(df['kesesuaian_bidang_1_5']) >= 4),
+        'promoters': nps_scores >= 9,
+        'detractors': nps_scores <= 6,
+    }
+
+@dataclass(frozen=True)
+class KpiCounts:
+    """Hitungan dasar KPI; proporsi dan NPS dashboard selalu diturunkan dari sini."""
+    total: int
+    employed: int
+    ttfj_le6: int
+    kesesuaian_ok: int
+    promoters: int
+    detractors: int
+
+    @staticmethod
+    def from_masks(total: int, masks: Dict[str, np.ndarray]) -> "KpiCounts":
+        return KpiCounts(total, **{name: int(np.count_nonzero(mask)) for name, mask in masks.items()})
+
+    @property
+    def proporsi_ttjf_6(self) -> float:
+        return share_percent(self.ttfj_le6, self.employed)
+
+    @property
+    def proporsi_bidang_sesuai(self) -> float:
+        return share_percent(self.kesesuaian_ok, self.employed)
+
+    @property
+    def nps(self) -> float:
+        return nps_score(self.promoters, self.detractors, self.total)
+
+def float32_value(value: float) -> float:
+    """Statistik kolom float32 dibulatkan ke ~7 digit bermakna (3.245, bukan 3.2449998855590820)."""
+    return float(f"{value:.7g}")
+
+def build_analytics_result(kpi: KpiCounts, status_counts: pd.Series, status_per_angkatan: pd.DataFrame,
+                           sektor_labels: pd.Index, sektor_employed: np.ndarray, sektor_ok: np.ndarray,
+                           ttfj_distribution: pd.Series, ipk_median: float, ttfj_median_employed: float,
+                           gaji_median_employed: float, ttjf_per_angkatan: pd.Series, gaji_per_angkatan: pd.Series,
+                           ttfj_magang: float, ttfj_non_magang: float, gaji_per_level: pd.Series) -> AnalyticsResult:
+    """Merakit AnalyticsResult dari hitungan dan median yang sudah dihitung oleh mesin mana pun.
+
+    Dipakai compute_analytics, AnalyticsCube.query, dan AggregateState.finalize agar rasio, NPS,
+    penyaringan grup kosong, urutan tampilan, dan pembulatan median ipk hanya didefinisikan sekali.
+    """
+    distribusi_status = status_counts[status_counts > 0].rename('count').sort_values(ascending=False, kind='stable')
+    status_per_angkatan = status_per_angkatan[status_per_angkatan['Jumlah'] > 0]
+    has_sektor = np.asarray(sektor_employed) > 0
+    kesesuaian_per_sektor = pd.Series(
+        np.asarray(sektor_ok, dtype=np.float64)[has_sektor] / np.asarray(sektor_employed)[has_sektor] * 100,
+        index=sektor_labels[has_sektor], name='kesesuaian_bidang_1_5',
+    ).sort_values(ascending=False)
+    return AnalyticsResult(
+        total_responden=kpi.total,
+        total_employed=kpi.employed,
+        ipk_median=float32_value(ipk_median),
+        ttfj_median_employed=ttfj_median_employed,
+        gaji_median_employed=gaji_median_employed,
+        distribusi_status=distribusi_status,
+        status_per_angkatan=status_per_angkatan.sort_values('Jumlah', ascending=False, kind='stable').reset_index(drop=True),
+        proporsi_ttjf_6=kpi.proporsi_ttjf_6,
+        ttjf_per_angkatan=ttjf_per_angkatan,
+        gaji_per_angkatan=gaji_per_angkatan,
+        proporsi_bidang_sesuai=kpi.proporsi_bidang_sesuai,
+        nps=kpi.nps,
+        kesesuaian_per_sektor=kesesuaian_per_sektor,
+        ttfj_distribution=ttfj_distribution,
+        ttfj_magang=float(ttfj_magang),
+        ttfj_non_magang=float(ttfj_non_magang),
+        gaji_per_level=gaji_per_level.sort_values(),
+    )
+
+@profiled()
+def compute_analytics(df: pd.DataFrame) -> AnalyticsResult:
+    """Menghitung seluruh KPI, median per grup, dan rasio per sektor dalam satu kali jalan.
+
+    Mask dan kode grup dihitung sekali dari kolom kategori, lalu setiap metrik
+    dihitung langsung dari array NumPy tanpa salinan DataFrame perantara.
+    """
+    status_codes, status_labels = _factorize(df['status_saat_ini'])
+    angkatan_codes, angkatan_labels = _factorize(df['angkatan_lulus'])
+    sektor_codes, sektor_labels = _factorize(df['sektor'])
+    level_codes, level_labels = _factorize(df['level_jabatan'])
+    masks = kpi_masks(df)
+    employed = masks['employed']
+
+    ttfj = _as_float(df['ttfj_bulan'])
+    gaji = _as_float(df['gaji_awal_idr'])
+    magang = _as_float(df['magang'])
+
+    valid_status = status_codes >= 0
+    status_counts = np.bincount(status_codes[valid_status], minlength=len(status_labels))
+
+    pair_valid = valid_status & (angkatan_codes >= 0)
+    pair_codes = angkatan_codes[pair_valid] * len(status_labels) + status_codes[pair_valid]
+    pair_counts = np.bincount(pair_codes, minlength=len(angkatan_labels) * len(status_labels))
+    pair_ids = np.flatnonzero(pair_counts)
+    status_per_angkatan = pd.DataFrame({
+        'angkatan_lulus': angkatan_labels.take(pair_ids // len(status_labels)),
+        'status_saat_ini': status_labels.take(pair_ids % len(status_labels)),
+        'Jumlah': pair_counts[pair_ids],
+    })
+
+    valid_sektor = employed & (sektor_codes >= 0)
+    sektor_employed = np.bincount(sektor_codes[valid_sektor], minlength=len(sektor_labels))
+    sektor_ok = np.bincount(sektor_codes[valid_sektor & masks['kesesuaian_ok']], minlength=len(sektor_labels))
+
+    ttfj_employed = ttfj[employed]
+    ttfj_values, ttfj_counts = np.unique(ttfj_employed[~np.isnan(ttfj_employed)], return_counts=True)
+    magang_codes = np.select([magang == 0, magang == 1], [0, 1], default=-1).astype(np.int8)
+    ttfj_non_magang, ttfj_magang = group_quantiles(ttfj, magang_codes, 2, [0.5], average_middle=True)[:, 0]
+
+    return build_analytics_result(
+        kpi=KpiCounts.from_masks(int(df.shape[0]), masks),
+        status_counts=pd.Series(status_counts, index=status_labels),
+        status_per_angkatan=status_per_angkatan,
+        sektor_labels=sektor_labels,
+        sektor_employed=sektor_employed,
+        sektor_ok=sektor_ok,
+        ttfj_distribution=pd.Series(ttfj_counts, index=pd.Index(ttfj_values, name='ttfj_bulan'), name='count'),
+        ipk_median=median(_as_float(df['ipk'])),
+        ttfj_median_employed=median(ttfj_employed),
+        gaji_median_employed=median(gaji, mask=employed),
+        ttjf_per_angkatan=group_median(ttfj, angkatan_codes, angkatan_labels, 'ttfj_bulan'),
+        gaji_per_angkatan=group_median(gaji, angkatan_codes, angkatan_labels, 'gaji_awal_idr'),
+        ttfj_magang=ttfj_magang,
+        ttfj_non_magang=ttfj_non_magang,
+        gaji_per_level=group_median(gaji, level_codes, level_labels, 'gaji_awal_idr'),
+    )
+
+# --- Inferensi Statistik (Bootstrap & Permutasi) ---
+@dataclass(frozen=True)
+class Estimate:
+    """Estimasi titik dengan interval kepercayaan bootstrap persentil."""
+    value: float
+    ci_low: float
+    ci_high: float
+    n: int
+
+@dataclass(frozen=True)
+class Comparison:
+    """Selisih statistik kelompok A - B: CI bootstrap selisih dan p-value uji permutasi dua sisi."""
+    label_a: str
+    label_b: str
+    a: Estimate
+    b: Estimate
+    difference: Estimate
+    p_value: float
+    alpha: float
+
+    @property
+    def significant(self) -> bool:
+        return bool(self.p_value < self.alpha)
+
+@dataclass(frozen=True)
+class InferenceResult:
+    """CI untuk setiap KPI dan median per angkatan, serta uji signifikansi perbandingan utama."""
+    n_resamples: int
+    alpha: float
+    kpis: Dict[str, Estimate]
+    ttfj_per_angkatan: pd.DataFrame  # indeks angkatan; kolom value, ci_low, ci_high, n
+    gaji_per_angkatan: pd.DataFrame
+    comparisons: Dict[str, Comparison]
+
+def _value_counts(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    return np.unique(values[~np.isnan(values)], return_counts=True)
+
+def _medians_from_counts(uniques: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Median setiap baris matriks hitungan (resample x nilai unik) tanpa membentuk ulang datanya."""
+    cumulative = np.cumsum(counts, axis=1)
+    n = cumulative[:, -1:]
+    lower = np.count_nonzero(cumulative <= (n - 1) // 2, axis=1)
+    upper = np.count_nonzero(cumulative <= n // 2, axis=1)
+    return (uniques[lower] + uniques[upper]) / 2
+
+def bootstrap_median(rng: np.random.Generator, uniques: np.ndarray, counts: np.ndarray, n_resamples: int) -> np.ndarray:
+    """Distribusi bootstrap median dalam O(n_resamples), berapa pun jumlah barisnya.
+
+    Statistik urutan ke-m dari n uniform berdistribusi Beta(m, n - m + 1), dan nilai
+    resample di urutan itu adalah kuantil empiris di titik tersebut; untuk n genap,
+    urutan ke-(m+1) adalah minimum (n - m) uniform di atasnya. Hasilnya sama secara
+    distribusi dengan median dari matriks indeks resample n x n_resamples.
+    """
+    n = int(counts.sum())
+    if n == 0:
+        return np.full(n_resamples, np.nan)
+    cumulative = np.cumsum(counts)
+    m = (n - 1) // 2 + 1
+    lower_u = rng.beta(m, n - m + 1, n_resamples)
+    lower = uniques[np.searchsorted(cumulative, np.minimum(lower_u * n, n - 1).astype(np.int64), side='right')]
+    if n % 2:
+        return lower
+    upper_u = lower_u + (1 - lower_u) * -np.expm1(np.log1p(-rng.random(n_resamples)) / (n - m))
+    upper = uniques[np.searchsorted(cumulative, np.minimum(upper_u * n, n - 1).astype(np.int64), side='right')]
+    return (lower + upper) / 2
+
+def permutation_median_diff(rng: np.random.Generator, uniques: np.ndarray, counts_a: np.ndarray,
+                            counts_b: np.ndarray, n_resamples: int) -> np.ndarray:
+    """Selisih median A - B di bawah permutasi label, lewat draw hipergeometrik multivariat.
+
+    Di bawah H0 kedua median terkonsentrasi di sekitar median gabungan, jadi hanya nilai
+    unik dalam +-4 sqrt(n) posisi darinya yang dibedakan; sisanya digabung menjadi dua
+    ember tepi. Bila median suatu resample jatuh di ember tepi, isi ember itu diuraikan
+    secara kondisional (hipergeometrik atas nilai unik di dalamnya), jadi hasilnya tetap eksak.
+    """
+    pooled = counts_a + counts_b
+    n_a, n = int(counts_a.sum()), int(pooled.sum())
+    cumulative = np.cumsum(pooled)
+    reach = 4 * int(np.sqrt(n)) + 1
+    first = int(np.searchsorted(cumulative, max(n // 2 - reach, 0), side='right'))
+    last = min(int(np.searchsorted(cumulative, n // 2 + reach, side='right')), uniques.size - 1)
+    below = int(cumulative[first - 1]) if first else 0
+    window = np.concatenate([[below], pooled[first:last + 1], [n - int(cumulative[last])]])
+    window_values = np.concatenate([[np.nan], uniques[first:last + 1], [np.nan]])
+    draws = rng.multivariate_hypergeometric(window, n_a, size=n_resamples)
+    diff = _medians_from_counts(window_values, draws) - _medians_from_counts(window_values, window - draws)
+    for row in np.flatnonzero(np.isnan(diff)):
+        counts = np.concatenate([
+            rng.multivariate_hypergeometric(pooled[:first], draws[row, 0]) if first else [],
+            draws[row, 1:-1],
+            rng.multivariate_hypergeometric(pooled[last + 1:], draws[row, -1]) if last + 1 < uniques.size else [],
+        ]).astype(np.int64)[None, :]
+        diff[row] = (_medians_from_counts(uniques, counts) - _medians_from_counts(uniques, pooled[None, :] - counts))[0]
+    return diff
+
+def bootstrap_share(rng: np.random.Generator, hits: int, total: int, n_resamples: int) -> np.ndarray:
+    """Distribusi bootstrap proporsi (%): jumlah hit per resample berdistribusi binomial."""
+    if total == 0:
+        return np.full(n_resamples, np.nan)
+    return rng.binomial(total, hits / total, n_resamples) / total * 100
+
+def permutation_share_diff(rng: np.random.Generator, hits_a: int, n_a: int, hits_b: int, n_b: int,
+                           n_resamples: int) -> np.ndarray:
+    """Selisih proporsi A - B (%) di bawah permutasi label: hit kelompok A berdistribusi hipergeometrik."""
+    hits = hits_a + hits_b
+    permuted_a = rng.hypergeometric(hits, n_a + n_b - hits, n_a, n_resamples)
+    return permuted_a / n_a * 100 - (hits - permuted_a) / n_b * 100
+
+def bootstrap_nps(rng: np.random.Generator, promoters: int, detractors: int, total: int, n_resamples: int) -> np.ndarray:
+    """Distribusi bootstrap NPS: satu draw multinomial (promotor, detraktor, lainnya) per resample."""
+    if total == 0:
+        return np.full(n_resamples, np.nan)
+    draws = rng.multinomial(total, np.array([promoters, detractors, total - promoters - detractors]) / total, size=n_resamples)
+    return (draws[:, 0] - draws[:, 1]) / total * 100
+
+def _estimate(value: float, distribution: np.ndarray, n: int, alpha: float) -> Estimate:
+    if n == 0 or np.isnan(distribution).all():
+        return Estimate(float(value), float('nan'), float('nan'), int(n))
+    ci_low, ci_high = np.nanquantile(distribution, [alpha / 2, 1 - alpha / 2])
+    return Estimate(float(value), float(ci_low), float(ci_high), int(n))
+
+def _p_value(observed: float, permuted: np.ndarray) -> float:
+    # Dua sisi dengan koreksi +1 sehingga p tidak pernah 0 untuk jumlah resample terbatas
+    if np.isnan(observed):
+        return float('nan')
+    extreme = np.abs(permuted) >= abs(observed) - 1e-9 * max(1.0, abs(observed))
+    return float((1 + np.count_nonzero(extreme)) / (permuted.size + 1))
+
+def _median_estimate(rng: np.random.Generator, values: np.ndarray, n_resamples: int,
+                     alpha: float) -> Tuple[Estimate, np.ndarray]:
+    uniques, counts = _value_counts(values)
+    distribution = bootstrap_median(rng, uniques, counts, n_resamples)
+    return _estimate(median(values), distribution, int(counts.sum()), alpha), distribution
+
+def _group_median_estimates(rng: np.random.Generator, values: np.ndarray, codes: np.ndarray,
+                            n_resamples: int, alpha: float) -> Dict[int, Tuple[Estimate, np.ndarray]]:
+    """Estimasi median per kode grup yang muncul (seperti group_median), beserta distribusi bootstrapnya."""
+    return {
+        int(code): _median_estimate(rng, values[codes == code], n_resamples, alpha)
+        for code in np.flatnonzero(np.bincount(codes[codes >= 0]))
+    }
+
+def _estimates_frame(estimates: Dict[int, Tuple[Estimate, np.ndarray]], labels: pd.Index) -> pd.DataFrame:
+    return pd.DataFrame([asdict(estimate) for estimate, _ in estimates.values()],
+                        index=labels[list(estimates)], columns=[f.name for f in fields(Estimate)])
+
+def _median_comparison(rng: np.random.Generator, label_a: str, a: np.ndarray, estimate_a: Tuple[Estimate, np.ndarray],
+                       label_b: str, b: np.ndarray, estimate_b: Tuple[Estimate, np.ndarray],
+                       n_resamples: int, alpha: float) -> Comparison:
+    a, b = a[~np.isnan(a)], b[~np.isnan(b)]
+    (est_a, dist_a), (est_b, dist_b) = estimate_a, estimate_b
+    observed = est_a.value - est_b.value
+    p_value = float('nan')
+    if a.size and b.size:
+        uniques = np.unique(np.concatenate([a, b]))
+        counts_a = np.bincount(np.searchsorted(uniques, a), minlength=uniques.size)
+        counts_b = np.bincount(np.searchsorted(uniques, b), minlength=uniques.size)
+        p_value = _p_value(observed, permutation_median_diff(rng, uniques, counts_a, counts_b, n_resamples))
+    difference = _estimate(observed, dist_a - dist_b, a.size + b.size, alpha)
+    return Comparison(label_a, label_b, est_a, est_b, difference, p_value, alpha)
+
+def _share_comparison(rng: np.random.Generator, label_a: str, hits_a: int, n_a: int, label_b: str, hits_b: int, n_b: int,
+                      n_resamples: int, alpha: float) -> Comparison:
+    dist_a, dist_b = bootstrap_share(rng, hits_a, n_a, n_resamples), bootstrap_share(rng, hits_b, n_b, n_resamples)
+    est_a = _estimate(hits_a / n_a * 100 if n_a else float('nan'), dist_a, n_a, alpha)
+    est_b = _estimate(hits_b / n_b * 100 if n_b else float('nan'), dist_b, n_b, alpha)
+    observed = est_a.value - est_b.value
+    p_value = _p_value(observed, permutation_share_diff(rng, hits_a, n_a, hits_b, n_b, n_resamples)) if n_a and n_b else float('nan')
+    return Comparison(label_a, label_b, est_a, est_b, _estimate(observed, dist_a - dist_b, n_a + n_b, alpha), p_value, alpha)
+
+@profiled()
+def compute_inference(df: pd.DataFrame, n_resamples: int = INFERENCE_RESAMPLES, alpha: float = INFERENCE_ALPHA,
+                      seed: int = INFERENCE_SEED) -> InferenceResult:
+    """CI bootstrap persentil untuk KPI dan median per angkatan, serta p-value uji permutasi.
+
+    Setiap statistik memakai definisi yang sama dengan compute_analytics, sehingga estimasi
+    titiknya identik dengan angka di dashboard. Resample tidak pernah dibentuk baris per
+    baris: median lewat statistik urutan, proporsi/NPS lewat draw binomial/multinomial, dan
+    permutasi lewat draw hipergeometrik atas hitungan nilai unik.
+    """
+    rng = np.random.default_rng(seed)
+    angkatan_codes, angkatan_labels = _factorize(df['angkatan_lulus'])
+    level_codes, level_labels = _factorize(df['level_jabatan'])
+    sektor_codes, sektor_labels = _factorize(df['sektor'])
+    masks = kpi_masks(df)
+    employed, kesesuaian_ok = masks['employed'], masks['kesesuaian_ok']
+    kpi = KpiCounts.from_masks(int(df.shape[0]), masks)
+    ttfj = _as_float(df['ttfj_bulan'])
+    gaji = _as_float(df['gaji_awal_idr'])
+    magang = _as_float(df['magang'])
+
+    def share_estimate(hits: int, denominator: int) -> Estimate:
+        return _estimate(share_percent(hits, denominator), bootstrap_share(rng, hits, denominator, n_resamples), denominator, alpha)
+
+    kpis = {
+        'ipk_median': _median_estimate(rng, _as_float(df['ipk']), n_resamples, alpha)[0],
+        'ttfj_median_employed': _median_estimate(rng, ttfj[employed], n_resamples, alpha)[0],
+        'gaji_median_employed': _median_estimate(rng, gaji[employed], n_resamples, alpha)[0],
+        'proporsi_ttjf_6': share_estimate(kpi.ttfj_le6, kpi.employed),
+        'proporsi_bidang_sesuai': share_estimate(kpi.kesesuaian_ok, kpi.employed),
+        'nps': _estimate(kpi.nps, bootstrap_nps(rng, kpi.promoters, kpi.detractors, kpi.total, n_resamples), kpi.total, alpha),
+    }
+
+    ttfj_angkatan = _group_median_estimates(rng, ttfj, angkatan_codes, n_resamples, alpha)
+    gaji_angkatan = _group_median_estimates(rng, gaji, angkatan_codes, n_resamples, alpha)
+    gaji_level = _group_median_estimates(rng, gaji, level_codes, n_resamples, alpha)
+    magang_codes = np.select([magang == 0, magang == 1], [0, 1], default=-1).astype(np.int8)
+    magang_groups = _group_median_estimates(rng, ttfj, magang_codes, n_resamples, alpha)
+
+    comparisons: Dict[str, Comparison] = {}
+    if len(magang_groups) == 2:
+        comparisons['ttfj_magang'] = _median_comparison(
+            rng, "Pernah magang", ttfj[magang_codes == 1], magang_groups[1],
+            "Tidak magang", ttfj[magang_codes == 0], magang_groups[0], n_resamples, alpha,
+        )
+    for key, values, estimates in (('ttfj_angkatan', ttfj, ttfj_angkatan), ('gaji_angkatan', gaji, gaji_angkatan)):
+        if len(estimates) > 1:
+            # Tren angkatan: angkatan terbaru (kode terbesar, label terurut) dibandingkan angkatan terlama
+            latest, earliest = max(estimates), min(estimates)
+            comparisons[key] = _median_comparison(
+                rng, str(angkatan_labels[latest]), values[angkatan_codes == latest], estimates[latest],
+                str(angkatan_labels[earliest]), values[angkatan_codes == earliest], estimates[earliest], n_resamples, alpha,
+            )
+    if len(gaji_level) > 1:
+        ranked = sorted(gaji_level, key=lambda code: gaji_level[code][0].value)
+        highest, lowest = ranked[-1], ranked[0]
+        comparisons['gaji_level'] = _median_comparison(
+            rng, str(level_labels[highest]), gaji[level_codes == highest], gaji_level[highest],
+            str(level_labels[lowest]), gaji[level_codes == lowest], gaji_level[lowest], n_resamples, alpha,
+        )
+    sektor_ratio, sektor_total = group_ratio(kesesuaian_ok, sektor_codes, len(sektor_labels), mask=employed)
+    if np.count_nonzero(sektor_total) > 1:
+        # Sektor dengan kesesuaian tertinggi dibandingkan gabungan sektor lainnya
+        top = int(np.nanargmax(np.where(sektor_total > 0, sektor_ratio, np.nan)))
+        in_sektor = employed & (sektor_codes >= 0)
+        hits_top = int(np.count_nonzero(in_sektor & (sektor_codes == top) & kesesuaian_ok))
+        hits_all = int(np.count_nonzero(in_sektor & kesesuaian_ok))
+        comparisons['kesesuaian_sektor'] = _share_comparison(
+            rng, str(sektor_labels[top]), hits_top, int(sektor_total[top]),
+            "Sektor lainnya", hits_all - hits_top, int(sektor_total.sum() - sektor_total[top]), n_resamples, alpha,
+        )
+
+    return InferenceResult(
+        n_resamples=n_resamples,
+        alpha=alpha,
+        kpis=kpis,
+        ttfj_per_angkatan=_estimates_frame(ttfj_angkatan, angkatan_labels),
+        gaji_per_angkatan=_estimates_frame(gaji_angkatan, angkatan_labels),
+        comparisons=comparisons,
+    )
+
+# --- Narasi Rekomendasi Berbasis Data ---
+def _fmt_bulan(value: float) -> str:
+    return f"{value:.2f} bulan"
+
+def _fmt_rupiah(value: float) -> str:
+    return f"Rp {value:,.0f}"
+
+def _fmt_persen(value: float) -> str:
+    return f"{value:.1f}%"
+
+def _format_ci(estimate: Optional[Estimate], alpha: float, fmt: Callable[[float], str]) -> str:
+    if estimate is None or np.isnan(estimate.ci_low):
+        return ""
+    return f" (CI {1 - alpha:.0%}: {fmt(estimate.ci_low)} – {fmt(estimate.ci_high)})"
+
+def _evidence(comparison: Optional[Comparison], fmt: Callable[[float], str]) -> str:
+    """Kalimat bukti statistik untuk satu perbandingan, atau ajakan mengaktifkan mode inferensi."""
+    if comparison is None:
+        return "Aktifkan *Mode inferensi statistik* di sidebar untuk menguji apakah perbedaan ini signifikan."
+    verdict = "signifikan" if comparison.significant else "belum signifikan"
+    return (f"Selisih {comparison.label_a} vs {comparison.label_b}: {fmt(comparison.difference.value)}"
+            f"{_format_ci(comparison.difference, comparison.alpha, fmt)}, p = {comparison.p_value:.3f} "
+            f"(**{verdict}** pada α = {comparison.alpha:g}).")
+
+def build_recommendations(result: AnalyticsResult, inference: Optional[InferenceResult] = None) -> List[str]:
+    """Tiga rekomendasi prioritas yang angkanya dibaca dari hasil analitik.
+
+    Klaim perbedaan hanya ditulis tegas bila uji permutasi mode inferensi signifikan;
+    tanpa inferensi, teks menyebut angka apa adanya dan tidak menyimpulkan signifikansi.
+    """
+    comparisons = inference.comparisons if inference is not None else {}
+    recommendations = []
+
+    comparison = comparisons.get('ttfj_magang')
+    if np.isnan(result.ttfj_magang) or np.isnan(result.ttfj_non_magang):
+        recommendations.append("**Penguatan Kemitraan Industri**: data magang vs non-magang tidak cukup untuk dibandingkan pada filter ini.")
+    else:
+        if comparison is not None and not comparison.significant:
+            action = "Perbedaannya belum cukup kuat untuk menjadikan perluasan magang prioritas utama; pantau kembali pada gelombang survei berikutnya."
+        elif result.ttfj_magang < result.ttfj_non_magang:
+            action = "Perluas kemitraan dengan perusahaan untuk menyediakan lebih banyak peluang magang, terutama melalui kanal \"Konversi Magang\"."
+        else:
+            action = "Alumni yang pernah magang tidak lebih cepat bekerja; evaluasi kualitas dan relevansi program magang sebelum memperluasnya."
+        recommendations.append(
+            f"**Penguatan Kemitraan Industri**: TTFJ median alumni yang pernah magang **{_fmt_bulan(result.ttfj_magang)}**, "
+            f"dibandingkan **{_fmt_bulan(result.ttfj_non_magang)}** untuk yang tidak magang. "
+            f"{_evidence(comparison, _fmt_bulan)} {action}"
+        )
+
+    sektor = result.kesesuaian_per_sektor
+    comparison = comparisons.get('kesesuaian_sektor')
+    if sektor.empty:
+        recommendations.append("**Fokus pada Sektor Relevan**: belum ada data sektor kerja pada filter ini.")
+    else:
+        top = " dan ".join(f"**{name}** ({_fmt_persen(ratio)})" for name, ratio in sektor.head(2).items())
+        if comparison is not None and not comparison.significant:
+            action = "Keunggulan sektor teratas belum signifikan, jadi penyesuaian kurikulum sebaiknya tidak bertumpu pada satu sektor saja."
+        else:
+            action = "Prodi dapat memprioritaskan kurikulum atau sertifikasi yang berfokus pada sektor-sektor ini untuk meningkatkan kesiapan lulusan."
+        recommendations.append(
+            f"**Fokus pada Sektor Relevan**: rasio kesesuaian bidang tertinggi ada di sektor {top}. "
+            f"{_evidence(comparison, _fmt_persen)} {action}"
+        )
+
+    level = result.gaji_per_level
+    comparison = comparisons.get('gaji_level')
+    if len(level) < 2:
+        recommendations.append("**Peningkatan Kompetensi Khusus**: data level jabatan tidak cukup untuk dibandingkan pada filter ini.")
+    else:
+        if comparison is not None and not comparison.significant:
+            action = "Gap antarlevel belum signifikan, sehingga penguatan kompetensi umum lebih tepat daripada jalur khusus per level."
+        else:
+            action = (f"Prodi dapat menekankan kompetensi yang dibutuhkan untuk posisi `{level.index[-1]}` sejak dini "
+                      "agar lulusan memiliki daya tawar gaji yang lebih tinggi.")
+        recommendations.append(
+            f"**Peningkatan Kompetensi Khusus**: gaji awal median naik dari **{_fmt_rupiah(level.iloc[0])}** (`{level.index[0]}`) "
+            f"hingga **{_fmt_rupiah(level.iloc[-1])}** (`{level.index[-1]}`). {_evidence(comparison, _fmt_rupiah)} {action}"
+        )
+    return recommendations
+
+def build_executive_summary(result: AnalyticsResult, inference: Optional[InferenceResult] = None) -> List[str]:
+    """Poin ringkasan eksekutif (KPI, risiko utama, langkah 90 hari) dari angka hasil analitik."""
+    kpis = inference.kpis if inference is not None else {}
+    alpha = inference.alpha if inference is not None else INFERENCE_ALPHA
+    if np.isnan(result.ttfj_median_employed) or np.isnan(result.gaji_median_employed):
+        points = ["**KPI Utama**: tidak ada alumni bekerja/wirausaha pada filter ini, sehingga TTFJ median, "
+                  "gaji awal median, dan rasio kesesuaian bidang belum dapat dihitung."]
+    else:
+        points = [
+            f"**KPI Utama**: Waktu Tunggu Kerja (TTFJ) median adalah **{_fmt_bulan(result.ttfj_median_employed)}**"
+            f"{_format_ci(kpis.get('ttfj_median_employed'), alpha, _fmt_bulan)}, median gaji awal **{_fmt_rupiah(result.gaji_median_employed)}**"
+            f"{_format_ci(kpis.get('gaji_median_employed'), alpha, _fmt_rupiah)}, dan rasio kesesuaian bidang **{_fmt_persen(result.proporsi_bidang_sesuai)}**"
+            f"{_format_ci(kpis.get('proporsi_bidang_sesuai'), alpha, _fmt_persen)}."
+        ]
+    nps = kpis.get('nps')
+    trend = inference.comparisons.get('gaji_angkatan') if inference is not None else None
+    if result.nps < 0:
+        certainty = " dan seluruh interval kepercayaannya di bawah nol" if nps is not None and nps.ci_high < 0 else ""
+        points.append(f"**Satu Risiko Utama**: NPS prodi **{_fmt_persen(result.nps)}**{_format_ci(nps, alpha, _fmt_persen)}{certainty}; "
+                      "alumni yang kecewa (detraktor) lebih banyak daripada promotor.")
+    elif trend is not None and trend.significant and trend.difference.value < 0:
+        points.append(f"**Satu Risiko Utama**: gaji awal median angkatan {trend.label_a} turun signifikan dibanding angkatan {trend.label_b}. "
+                      f"{_evidence(trend, _fmt_rupiah)}")
+    else:
+        gaji = result.gaji_per_angkatan
+        spread = f" (rentang median per angkatan {_fmt_rupiah(gaji.min())} – {_fmt_rupiah(gaji.max())})" if not gaji.empty else ""
+        points.append(f"**Satu Risiko Utama**: variasi gaji awal antar angkatan dan level jabatan{spread} "
+                      "menunjukkan ketidakstabilan pasar kerja atau variasi kualitas lulusan.")
+    sektor = " dan ".join(result.kesesuaian_per_sektor.head(2).index.astype(str)) or "mitra utama"
+    current = f" (saat ini **{_fmt_persen(result.proporsi_ttjf_6)}**)" if result.total_employed > 0 else ""
+    points.append(f"**Langkah 90 Hari**: program mentoring dan workshop industri untuk menaikkan proporsi lulusan yang bekerja "
+                  f"dalam 6 bulan{current}, serta perluasan kemitraan dengan sektor {sektor}.")
+    return points
+
+# --- Profil Kualitas Data (Hash Baris) ---
+ROW_HASH_MULTIPLIER = np.uint64(0x100000001B3)
+ISSUE_COLUMNS: List[str] = ['missing', 'di_luar_rentang', 'di_luar_domain']
+
+@dataclass(frozen=True)
+class DataProfile:
+    """Hasil satu pass profiling data mentah; dipakai bersama oleh clean_data dan laporan kualitas."""
+    rows: int
+    duplicate_count: int
+    id_conflicts: int  # baris unik yang alumni_id-nya sudah dipakai baris unik lain
+    conflicting_ids: int
+    column_issues: pd.DataFrame
+    removed_rows: Dict[str, int]  # baris yang dibuang clean_data per aturan, sesuai urutan penerapan
+    keep: np.ndarray
+
+def column_issues(df: pd.DataFrame, schema: Dict[str, ColumnSpec] = TRACER_SCHEMA) -> pd.DataFrame:
+    """Jumlah missing, nilai di luar rentang, dan nilai di luar domain skema per kolom (dapat dijumlah antar chunk)."""
+    issues = pd.DataFrame(0, index=df.columns, columns=ISSUE_COLUMNS, dtype='int64')
+    issues['missing'] = df.isnull().sum()
+    for col, count in find_schema_violations(df, schema).items():
+        issues.loc[col, 'di_luar_rentang'] = count
+    for col, spec in schema.items():
+        if spec.domain is not None and col in df.columns:
+            values = df[col]
+            issues.loc[col, 'di_luar_domain'] = int((values.notna() & ~values.isin(spec.domain)).sum())
+    return issues
+
+def _column_hashes(series: pd.Series) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """Hash 64-bit per nilai; kolom string di-hash lewat kode factorize (kode dikembalikan untuk dipakai ulang)."""
+    if isinstance(series.dtype, pd.StringDtype) or series.dtype == object:
+        # Hash langsung atas string pyarrow melewati objek Python dan jauh lebih lambat
+        codes = pd.factorize(series)[0]
+        return pd.util.hash_array(codes), codes
+    return pd.util.hash_pandas_object(series, index=False).to_numpy(), None
+
+@profiled()
+def profile_data(df: pd.DataFrame, schema: Dict[str, ColumnSpec] = TRACER_SCHEMA) -> DataProfile:
+    """Memprofil data mentah dengan satu hash 64-bit per baris.
+
+    Hash baris (lokal untuk DataFrame ini) menentukan duplikat persis; kode alumni_id dari
+    pass yang sama dipakai untuk konflik id pada baris unik, dan mask baris yang lolos
+    aturan clean_data disimpan agar pembersihan tidak membandingkan baris lagi.
+    """
+    row_hashes = np.zeros(len(df), dtype=np.uint64)
+    id_codes = None
+    for col in df.columns:
+        hashes, codes = _column_hashes(df[col])
+        row_hashes ^= hashes
+        row_hashes *= ROW_HASH_MULTIPLIER
+        if col == 'alumni_id':
+            id_codes = codes if codes is not None else pd.factorize(df[col])[0]
+    unique = ~pd.Series(row_hashes, copy=False).duplicated().to_numpy()
+
+    id_conflicts = conflicting_ids = 0
+    if id_codes is not None:
+        ids = id_codes[unique]
+        per_id = np.bincount(ids[ids >= 0])
+        id_conflicts = int(per_id.sum() - np.count_nonzero(per_id))
+        conflicting_ids = int(np.count_nonzero(per_id > 1))
+
+    ttfj = _as_float(df['ttfj_bulan'])
+    has_values = ~np.isnan(ttfj) & ~np.isnan(_as_float(df['gaji_awal_idr']))
+    plausible = unique & has_values & (ttfj >= 0)
+    keep = plausible & within_schema_range(df, schema)
+    duplicate_count = int(len(df) - np.count_nonzero(unique))
+    return DataProfile(
+        rows=len(df),
+        duplicate_count=duplicate_count,
+        id_conflicts=id_conflicts,
+        conflicting_ids=conflicting_ids,
+        column_issues=column_issues(df, schema),
+        removed_rows={
+            'duplikat': duplicate_count,
+            'missing ttfj_bulan/gaji_awal_idr': int(np.count_nonzero(unique & ~has_values)),
+            'ttfj_bulan < 0': int(np.count_nonzero(unique & has_values & ~plausible)),
+            'di luar rentang skema': int(np.count_nonzero(plausible & ~keep)),
+        },
+        keep=keep,
+    )
+
+# --- Laporan Kualitas Data ---
+@dataclass(frozen=True)
+class DataQualityReport:
+    """Ringkasan kualitas data mentah vs data bersih untuk bagian 1 dashboard dan laporan batch."""
+    raw_rows: int
+    raw_columns: int
+    raw_head: pd.DataFrame
+    missing_values: pd.Series
+    duplicate_count: int
+    clean_rows: int
+    clean_columns: int
+    clean_head: pd.DataFrame
+    memory: Optional[pd.DataFrame] = None
+    column_issues: Optional[pd.DataFrame] = None
+    id_conflicts: Optional[int] = None  # None: tidak dihitung (mode streaming)
+    conflicting_ids: Optional[int] = None
+    removed_rows: Optional[Dict[str, int]] = None
+
+@profiled()
+def build_quality_report(df_raw: pd.DataFrame, df_cleaned: pd.DataFrame,
+                         profile: Optional[DataProfile] = None) -> DataQualityReport:
+    """Membuat laporan kualitas dari DataFrame mentah, profilnya, dan hasil clean_data di memori."""
+    profile = profile if profile is not None else profile_data(df_raw)
+    return DataQualityReport(
+        raw_rows=int(df_raw.shape[0]),
+        raw_columns=int(df_raw.shape[1]),
+        raw_head=df_raw.head(),
+        missing_values=profile.column_issues['missing'],
+        duplicate_count=profile.duplicate_count,
+        clean_rows=int(df_cleaned.shape[0]),
+        clean_columns=int(df_cleaned.shape[1]),
+        clean_head=df_cleaned.head(),
+        memory=memory_report(df_raw),
+        column_issues=profile.column_issues,
+        id_conflicts=profile.id_conflicts,
+        conflicting_ids=profile.conflicting_ids,
+        removed_rows=profile.removed_rows,
+    )
+
+# --- Serialisasi State ke Disk ---
+PLAIN_CLASS_KEY = '__tracer_class__'
+# Objek yang tidak dapat di-pickle (kunci thread, fungsi lokal) atau file yang tidak dapat ditulis
+PERSIST_ERRORS = (OSError, pickle.PickleError, TypeError, AttributeError)
+
+def to_plain(value):
+    """Mengganti objek kelas modul ini dengan dict berisi nama kelas dan atributnya (rekursif).
+
+    Streamlit menjalankan skrip sebagai modul __main__ baru di setiap rerun, sehingga objek dari
+    rerun sebelumnya (mis. yang tersimpan di ResultCache) tidak dapat di-pickle lewat referensi
+    kelasnya. Bentuk ini hanya berisi tipe bawaan, NumPy, dan pandas.
+    """
+    cls = type(value)
+    if cls.__module__ == __name__ and hasattr(value, '__dict__'):
+        return {PLAIN_CLASS_KEY: cls.__qualname__, 'attrs': to_plain(vars(value))}
+    if cls is dict:
+        return {key: to_plain(item) for key, item in value.items()}
+    if cls in (list, tuple):
+        return cls(to_plain(item) for item in value)
+    return value
+
+def from_plain(value):
+    """Kebalikan to_plain: membangun ulang objek dengan kelas dari modul yang sedang berjalan."""
+    cls = type(value)
+    if cls is dict:
+        if PLAIN_CLASS_KEY in value:
+            target = globals()[value[PLAIN_CLASS_KEY]]
+            obj = object.__new__(target)
+            obj.__dict__.update(from_plain(value['attrs']))  # juga untuk dataclass frozen
+            return obj
+        return {key: from_plain(item) for key, item in value.items()}
+    if cls in (list, tuple):
+        return cls(from_plain(item) for item in value)
+    return value
+
+def write_plain(value, path: str) -> None:
+    """Menulis to_plain(value) secara atomik; file sementara unik per penulis (aman antar proses)."""
+    handle, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.tmp')
+    try:
+        with os.fdopen(handle, 'wb') as file:
+            pickle.dump(to_plain(value), file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+def read_plain(path: str):
+    with open(path, 'rb') as handle:
+        return from_plain(pickle.load(handle))
+
+# --- Pemrosesan Streaming (CSV Lebih Besar dari RAM) ---
+class QuantileSketch:
+    """Sketsa kuantil mergeable bergaya DDSketch dengan galat relatif terbatas.
+
+    Nilai dipetakan ke bucket logaritmik sehingga ukuran sketsa hanya bergantung
+    pada rentang nilai, bukan jumlah baris, dan dua sketsa dapat digabung tanpa
+    kehilangan akurasi.
+    """
+    def __init__(self, relative_accuracy: float = SKETCH_RELATIVE_ACCURACY):
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = np.log(self._gamma)
+        self.positive: Dict[int, int] = {}
+        self.negative: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def _add_buckets(self, store: Dict[int, int], values: np.ndarray) -> None:
+        keys, counts = np.unique(np.ceil(np.log(values) / self._log_gamma).astype(np.int64), return_counts=True)
+        for key, count in zip(keys.tolist(), counts.tolist()):
+            store[key] = store.get(key, 0) + count
+
+    def add(self, values: np.ndarray) -> None:
+        values = values[~np.isnan(values)]
+        if not values.size:
+            return
+        self._add_buckets(self.positive, values[values > 0])
+        self._add_buckets(self.negative, -values[values < 0])
+        self.zero_count += int(np.count_nonzero(values == 0))
+        self.count += int(values.size)
+
+    def merge(self, other: "QuantileSketch") -> None:
+        for store, other_store in ((self.positive, other.positive), (self.negative, other.negative)):
+            for key, count in other_store.items():
+                store[key] = store.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+
+    def _bucket_value(self, key: int) -> float:
+        return 2 * self._gamma ** key / (self._gamma + 1)
+
+    def quantile(self, q: float) -> float:
+        if self.count == 0:
+            return float('nan')
+        neg_keys = sorted(self.negative, reverse=True)
+        pos_keys = sorted(self.positive)
+        values = [-self._bucket_value(k) for k in neg_keys] + [0.0] + [self._bucket_value(k) for k in pos_keys]
+        counts = [self.negative[k] for k in neg_keys] + [self.zero_count] + [self.positive[k] for k in pos_keys]
+        index = int(np.searchsorted(np.cumsum(counts), q * (self.count - 1), side='right'))
+        return float(values[min(index, len(values) - 1)])
+
+def _sorted_contains(sorted_block: np.ndarray, values: np.ndarray) -> np.ndarray:
+    positions = np.minimum(np.searchsorted(sorted_block, values), len(sorted_block) - 1)
+    return sorted_block[positions] == values
+
+class RowHashSet:
+    """Himpunan hash baris 64-bit lintas chunk untuk deduplikasi streaming (8 byte per baris unik)."""
+    def __init__(self):
+        self._blocks: List[np.ndarray] = []
+
+    def __len__(self) -> int:
+        return sum(len(block) for block in self._blocks)
+
+    def contains(self, hashes: np.ndarray) -> np.ndarray:
+        found = np.zeros(len(hashes), dtype=bool)
+        for block in self._blocks:
+            found |= _sorted_contains(block, hashes)
+        return found
+
+    def add(self, hashes: np.ndarray) -> None:
+        """Menambahkan hash unik yang belum ada di himpunan."""
+        if hashes.size:
+            self._blocks.append(np.sort(hashes))
+        # Gabungkan blok berukuran serupa agar jumlah blok tetap logaritmik
+        while len(self._blocks) > 1 and len(self._blocks[-1]) >= len(self._blocks[-2]):
+            last = self._blocks.pop()
+            self._blocks[-1] = np.sort(np.concatenate([self._blocks[-1], last]))
+
+    def add_new(self, hashes: np.ndarray) -> np.ndarray:
+        """Mengembalikan mask kemunculan pertama tiap hash, lalu menambahkannya ke himpunan."""
+        is_new = np.zeros(len(hashes), dtype=bool)
+        is_new[np.unique(hashes, return_index=True)[1]] = True
+        is_new &= ~self.contains(hashes)
+        self.add(hashes[is_new])
+        return is_new
+
+@dataclass
+class GroupPartial:
+    """Agregat parsial mergeable untuk satu grup (angkatan, sektor, level jabatan, atau magang)."""
+    count: int = 0
+    employed: int = 0
+    kesesuaian_ok: int = 0  # Bekerja/Wirausaha dengan kesesuaian_bidang_1_5 >= 4
+    promoters: int = 0
+    detractors: int = 0
+    ttfj: QuantileSketch = field(default_factory=QuantileSketch)
+    gaji: QuantileSketch = field(default_factory=QuantileSketch)
+
+    def update(self, masks: Dict[str, np.ndarray], ttfj: np.ndarray, gaji: np.ndarray) -> None:
+        """Menambahkan baris satu grup; masks berasal dari kpi_masks."""
+        self.count += int(ttfj.size)
+        for attr in ('employed', 'kesesuaian_ok', 'promoters', 'detractors'):
+            setattr(self, attr, getattr(self, attr) + int(np.count_nonzero(masks[attr])))
+        self.ttfj.add(ttfj)
+        self.gaji.add(gaji)
+
+    def merge(self, other: "GroupPartial") -> None:
+        for attr in ('count', 'employed', 'kesesuaian_ok', 'promoters', 'detractors'):
+            setattr(self, attr, getattr(self, attr) + getattr(other, attr))
+        self.ttfj.merge(other.ttfj)
+        self.gaji.merge(other.gaji)
+
+    @property
+    def nps(self) -> float:
+        return nps_score(self.promoters, self.detractors, self.count)
+
+def _merge_counts(target: Dict, source: Dict) -> None:
+    for key, count in source.items():
+        target[key] = target.get(key, 0) + count
+
+class AggregateState:
+    """State agregat parsial yang dapat diperbarui per chunk dan digabung antar state.
+
+    Winsorization gaji tidak diterapkan saat update: karena clip bersifat monoton,
+    kuantil dari data yang di-clip sama dengan kuantil data asli yang di-clip,
+    sehingga batas persentil cukup diterapkan saat finalize.
+    """
+    def __init__(self):
+        self.total = 0
+        self.employed = 0
+        self.ttfj_le6 = 0
+        self.kesesuaian_ok = 0
+        self.promoters = 0
+        self.detractors = 0
+        self.status_counts: Dict[str, int] = {}
+        self.status_per_angkatan: Dict[Tuple[object, str], int] = {}
+        self.ttfj_values: Dict[float, int] = {}
+        self.ipk = QuantileSketch()
+        self.ttfj_employed = QuantileSketch()
+        self.gaji_employed = QuantileSketch()
+        self.by_angkatan: Dict[object, GroupPartial] = {}
+        self.by_sektor: Dict[object, GroupPartial] = {}
+        self.by_level: Dict[object, GroupPartial] = {}
+        self.by_magang: Dict[object, GroupPartial] = {}
+
+    @staticmethod
+    def _update_groups(groups: Dict[object, GroupPartial], series: pd.Series, masks: Dict[str, np.ndarray],
+                       ttfj: np.ndarray, gaji: np.ndarray) -> None:
+        codes, labels = _factorize(series)
+        for code, label in enumerate(labels.tolist()):
+            mask = codes == code
+            groups.setdefault(label, GroupPartial()).update(
+                {name: values[mask] for name, values in masks.items()}, ttfj[mask], gaji[mask]
+            )
+
+    def kpi(self) -> KpiCounts:
+        return KpiCounts(self.total, self.employed, self.ttfj_le6, self.kesesuaian_ok, self.promoters, self.detractors)
+
+    def update(self, df: pd.DataFrame) -> None:
+        """Menambahkan chunk yang sudah dibersihkan (tanpa winsorization) ke state."""
+        status_codes, status_labels = _factorize(df['status_saat_ini'])
+        masks = kpi_masks(df)
+        employed = masks['employed']
+        ttfj = _as_float(df['ttfj_bulan'])
+        gaji = _as_float(df['gaji_awal_idr'])
+
+        chunk = KpiCounts.from_masks(int(df.shape[0]), masks)
+        for attr in ('total', 'employed', 'ttfj_le6', 'kesesuaian_ok', 'promoters', 'detractors'):
+            setattr(self, attr, getattr(self, attr) + getattr(chunk, attr))
+
+        valid_status = status_codes >= 0
+        counts = np.bincount(status_codes[valid_status], minlength=len(status_labels))
+        _merge_counts(self.status_counts, dict(zip(status_labels.tolist(), counts.tolist())))
+        angkatan_codes, angkatan_labels = _factorize(df['angkatan_lulus'])
+        pair_valid = valid_status & (angkatan_codes >= 0)
+        pair_counts = np.bincount(angkatan_codes[pair_valid] * len(status_labels) + status_codes[pair_valid],
+                                  minlength=len(angkatan_labels) * len(status_labels))
+        angkatan_list, status_list = angkatan_labels.tolist(), status_labels.tolist()
+        _merge_counts(self.status_per_angkatan, {
+            (angkatan_list[pair // len(status_list)], status_list[pair % len(status_list)]): int(pair_counts[pair])
+            for pair in np.flatnonzero(pair_counts)
+        })
+        ttfj_employed = ttfj[employed]
+        values, counts = np.unique(ttfj_employed[~np.isnan(ttfj_employed)], return_counts=True)
+        _merge_counts(self.ttfj_values, dict(zip(values.tolist(), counts.tolist())))
+
+        self.ipk.add(_as_float(df['ipk']))
+        self.ttfj_employed.add(ttfj_employed)
+        self.gaji_employed.add(gaji[employed])
+        for groups, col in ((self.by_angkatan, 'angkatan_lulus'), (self.by_sektor, 'sektor'),
+                            (self.by_level, 'level_jabatan'), (self.by_magang, 'magang')):
+            self._update_groups(groups, df[col], masks, ttfj, gaji)
+
+    def merge(self, other: "AggregateState") -> None:
+        for attr in ('total', 'employed', 'ttfj_le6', 'kesesuaian_ok', 'promoters', 'detractors'):
+            setattr(self, attr, getattr(self, attr) + getattr(other, attr))
+        for attr in ('status_counts', 'status_per_angkatan', 'ttfj_values'):
+            _merge_counts(getattr(self, attr), getattr(other, attr))
+        for attr in ('ipk', 'ttfj_employed', 'gaji_employed'):
+            getattr(self, attr).merge(getattr(other, attr))
+        for attr in ('by_angkatan', 'by_sektor', 'by_level', 'by_magang'):
+            groups = getattr(self, attr)
+            for label, partial in getattr(other, attr).items():
+                groups.setdefault(label, GroupPartial()).merge(partial)
+
+    def winsor_bounds(self, lower_quantile: float = 0.05, upper_quantile: float = 0.95) -> Tuple[float, float]:
+        """Batas winsorization gaji dari sketsa gaji alumni Bekerja/Wirausaha."""
+        if self.gaji_employed.count == 0:
+            return -np.inf, np.inf
+        return self.gaji_employed.quantile(lower_quantile), self.gaji_employed.quantile(upper_quantile)
+
+    @profiled()
+    def finalize(self, lower_quantile: float = 0.05, upper_quantile: float = 0.95) -> AnalyticsResult:
+        """Mengubah state menjadi AnalyticsResult (median berupa perkiraan dari sketsa)."""
+        lower, upper = self.winsor_bounds(lower_quantile, upper_quantile)
+
+        def clip(value: float) -> float:
+            return value if np.isnan(value) else float(np.clip(value, lower, upper))
+
+        def group_medians(groups: Dict[object, GroupPartial], name: str, index_name: str, sketch: str, winsorize: bool) -> pd.Series:
+            labels = sorted(groups)
+            medians = [getattr(groups[label], sketch).quantile(0.5) for label in labels]
+            return pd.Series([clip(m) if winsorize else m for m in medians],
+                             index=pd.Index(labels, name=index_name), name=name, dtype=float)
+
+        status_counts = pd.Series(self.status_counts, dtype='int64')
+        status_counts.index.name = 'status_saat_ini'
+        status_per_angkatan = pd.DataFrame(
+            [(angkatan, status, count) for (angkatan, status), count in self.status_per_angkatan.items()],
+            columns=['angkatan_lulus', 'status_saat_ini', 'Jumlah'],
+        )
+        sektor_labels = sorted(self.by_sektor)
+        ttfj_values = sorted(self.ttfj_values)
+        magang = self.by_magang.get(True, GroupPartial())
+        non_magang = self.by_magang.get(False, GroupPartial())
+
+        return build_analytics_result(
+            kpi=self.kpi(),
+            status_counts=status_counts,
+            status_per_angkatan=status_per_angkatan,
+            sektor_labels=pd.Index(sektor_labels, name='sektor'),
+            sektor_employed=np.array([self.by_sektor[label].employed for label in sektor_labels], dtype=np.int64),
+            sektor_ok=np.array([self.by_sektor[label].kesesuaian_ok for label in sektor_labels], dtype=np.int64),
+            ttfj_distribution=pd.Series([self.ttfj_values[v] for v in ttfj_values],
+                                        index=pd.Index(ttfj_values, name='ttfj_bulan'), name='count', dtype='int64'),
+            ipk_median=self.ipk.quantile(0.5),
+            ttfj_median_employed=self.ttfj_employed.quantile(0.5),
+            gaji_median_employed=clip(self.gaji_employed.quantile(0.5)),
+            ttjf_per_angkatan=group_medians(self.by_angkatan, 'ttfj_bulan', 'angkatan_lulus', 'ttfj', False),
+            gaji_per_angkatan=group_medians(self.by_angkatan, 'gaji_awal_idr', 'angkatan_lulus', 'gaji', True),
+            ttfj_magang=magang.ttfj.quantile(0.5),
+            ttfj_non_magang=non_magang.ttfj.quantile(0.5),
+            gaji_per_level=group_medians(self.by_level, 'gaji_awal_idr', 'level_jabatan', 'gaji', True),
+        )
+
+@dataclass(frozen=True)
+class WaveSummary:
+    """Ringkasan satu gelombang data yang ditambahkan ke IncrementalDataset."""
+    label: str
+    rows_read: int
+    rows_added: int
+    duplicate_rows: int
+    known_alumni_rows: int
+    invalid_rows: int
+
+class IncrementalDataset:
+    """Dataset agregat yang dapat ditambah per gelombang survei tanpa memproses ulang riwayat.
+
+    Hanya state mergeable (AggregateState), indeks hash alumni_id, dan hash baris
+    yang disimpan, sehingga biaya append sebanding dengan ukuran gelombang baru.
+    Baris dengan alumni_id yang sudah ada pada gelombang sebelumnya tidak ditambahkan.
+    """
+    STATE_VERSION = 3  # 2: disimpan lewat to_plain; 3: indeks alumni_id hanya dari baris valid
+
+    def __init__(self):
+        self.state_version = IncrementalDataset.STATE_VERSION
+        self.state = AggregateState()
+        self.row_hashes = RowHashSet()
+        self.alumni_ids = RowHashSet()
+        self.raw_rows = 0
+        self.raw_columns = 0
+        self.duplicate_count = 0
+        self.column_issues: Optional[pd.DataFrame] = None
+        self.raw_head: Optional[pd.DataFrame] = None
+        self.clean_head: Optional[pd.DataFrame] = None
+        self.waves: List[WaveSummary] = []
+
+    @profiled()
+    def append(self, chunks: Iterable[pd.DataFrame], label: str = "") -> WaveSummary:
+        """Membersihkan satu gelombang chunk demi chunk dan memasukkannya ke state agregat."""
+        rows_read = rows_added = duplicate_rows = known_rows = invalid_rows = 0
+        wave_ids: List[np.ndarray] = []
+        for chunk in chunks:
+            if self.raw_head is None:
+                self.raw_head, self.raw_columns = chunk.head(), chunk.shape[1]
+            rows_read += int(chunk.shape[0])
+            chunk_issues = column_issues(chunk)
+            self.column_issues = chunk_issues if self.column_issues is None else self.column_issues.add(chunk_issues, fill_value=0)
+
+            is_new = self.row_hashes.add_new(pd.util.hash_pandas_object(chunk, index=False).to_numpy())
+            duplicate_rows += int(np.count_nonzero(~is_new))
+            has_id = chunk['alumni_id'].notna().to_numpy()
+            id_hashes = pd.util.hash_pandas_object(chunk['alumni_id'], index=False).to_numpy()
+            known = is_new & has_id & self.alumni_ids.contains(id_hashes)
+            known_rows += int(np.count_nonzero(known))
+
+            fresh = is_new & ~known
+            chunk = chunk[fresh]
+            valid = (chunk['ttfj_bulan'].notna() & chunk['gaji_awal_idr'].notna() & (chunk['ttfj_bulan'] >= 0)).to_numpy()
+            valid &= within_schema_range(chunk)
+            invalid_rows += int(np.count_nonzero(~valid))
+            # Hanya id baris yang benar-benar ditambahkan: kiriman ulang yang sudah diperbaiki pada gelombang berikutnya tetap diterima
+            wave_ids.append(id_hashes[fresh][has_id[fresh] & valid])
+            chunk = chunk[valid]
+            if self.clean_head is None or len(self.clean_head) < 5:
+                self.clean_head = chunk.head(5) if self.clean_head is None else pd.concat([self.clean_head, chunk.head(5 - len(self.clean_head))])
+            self.state.update(chunk)
+            rows_added += int(chunk.shape[0])
+
+        # Indeks alumni_id baru diperbarui setelah gelombang selesai: id berulang di dalam satu gelombang tetap diterima
+        if wave_ids:
+            self.alumni_ids.add(np.unique(np.concatenate(wave_ids)))
+        self.raw_rows += rows_read
+        self.duplicate_count += duplicate_rows
+        summary = WaveSummary(label, rows_read, rows_added, duplicate_rows, known_rows, invalid_rows)
+        self.waves.append(summary)
+        return summary
+
+    def quality_report(self, lower_quantile: float = 0.05, upper_quantile: float = 0.95) -> DataQualityReport:
+        if self.raw_head is None:
+            raise ValueError("Dataset kosong: tidak ada baris yang dapat diproses.")
+        lower, upper = self.state.winsor_bounds(lower_quantile, upper_quantile)
+        issues = self.column_issues.astype('int64')
+        return DataQualityReport(
+            raw_rows=self.raw_rows,
+            raw_columns=self.raw_columns,
+            raw_head=self.raw_head,
+            missing_values=issues['missing'],
+            duplicate_count=self.duplicate_count,
+            clean_rows=self.state.total,
+            clean_columns=self.raw_columns,
+            clean_head=self.clean_head.assign(gaji_awal_idr=self.clean_head['gaji_awal_idr'].clip(lower=lower, upper=upper)),
+            column_issues=issues,
+        )
+
+    @profiled()
+    def finalize(self, lower_quantile: float = 0.05, upper_quantile: float = 0.95) -> AnalyticsResult:
+        return self.state.finalize(lower_quantile, upper_quantile)
+
+    def save(self, path: str) -> None:
+        """Menyimpan state secara atomik sebagai data biasa (lihat to_plain)."""
+        write_plain(self, path)
+
+    @staticmethod
+    def load(path: str) -> "IncrementalDataset":
+        dataset = read_plain(path)
+        if not isinstance(dataset, IncrementalDataset) or getattr(dataset, 'state_version', None) != IncrementalDataset.STATE_VERSION:
+            raise ValueError(f"State '{path}' dibuat oleh versi lain dan harus dibangun ulang.")
+        return dataset
+
+    @staticmethod
+    def state_path(fingerprint: str) -> str:
+        return os.path.join(INCREMENTAL_DIR, f"{fingerprint[:32]}.pkl")
+
+    @staticmethod
+    def load_or_build(fingerprint: str, build: Callable[[], "IncrementalDataset"]) -> "IncrementalDataset":
+        """Memuat state tersimpan untuk sidik jari rantai gelombang; bila belum ada, membangun lalu menyimpannya."""
+        path = IncrementalDataset.state_path(fingerprint)
+        if os.path.exists(path):
+            try:
+                return IncrementalDataset.load(path)
+            except (ValueError, EOFError, KeyError, pickle.UnpicklingError) + PERSIST_ERRORS:
+                pass  # state rusak atau usang: bangun ulang
+        dataset = build()
+        try:
+            os.makedirs(INCREMENTAL_DIR, exist_ok=True)
+            dataset.save(path)
+        except PERSIST_ERRORS:
+            pass  # state tidak dapat ditulis: hanya ada di cache proses
+        return dataset
+
+@profiled()
+def stream_clean_and_aggregate(chunks: Iterable[pd.DataFrame], lower_quantile: float = 0.05,
+                               upper_quantile: float = 0.95) -> Tuple[DataQualityReport, AnalyticsResult]:
+    """Membersihkan dan mengagregasi dataset chunk demi chunk dengan memori puncak terbatas.
+
+    Setara dengan clean_data + compute_analytics: duplikat dibuang lewat hash baris
+    lintas chunk, persentil winsorization diperkirakan dengan QuantileSketch, dan
+    setiap chunk bersih langsung dimasukkan ke AggregateState.
+    """
+    dataset = IncrementalDataset()
+    dataset.append(chunks)
+    return dataset.quality_report(lower_quantile, upper_quantile), dataset.finalize(lower_quantile, upper_quantile)
+
+# --- Kubus Agregat untuk Filter Interaktif ---
+def _ranges_to_index(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """Menggabungkan rentang [start, end) menjadi satu array indeks tanpa loop Python."""
+    lengths = ends - starts
+    keep = lengths > 0
+    starts, lengths = starts[keep], lengths[keep]
+    if not lengths.size:
+        return np.empty(0, dtype=np.int64)
+    steps = np.ones(int(lengths.sum()), dtype=np.int64)
+    steps[0] = starts[0]
+    boundaries = np.cumsum(lengths)[:-1]
+    steps[boundaries] = starts[1:] - (starts[:-1] + lengths[:-1]) + 1
+    return np.cumsum(steps)
+
+# Batas sel x nilai unik untuk membangun histogram lewat bincount padat; di atasnya memakai np.unique
+HISTOGRAM_DENSE_LIMIT: int = 1 << 24
+
+class CellHistogram:
+    """Histogram nilai per sel kubus dalam format CSR: untuk tiap sel, kode nilai unik terurut dan frekuensinya.
+
+    Kolom TTFJ, gaji, dan IPK hanya punya sedikit nilai unik, sehingga jumlah entri jauh di bawah
+    jumlah baris dan median grup cukup dihitung dari histogram gabungan sel terpilih.
+    """
+    def __init__(self, values: np.ndarray, cells: np.ndarray, n_cells: int):
+        valid = ~np.isnan(values)
+        self.uniques, value_codes = np.unique(values[valid], return_inverse=True)
+        n_values = max(len(self.uniques), 1)
+        keys = cells[valid].astype(np.int64) * n_values + value_codes
+        if n_cells * n_values <= HISTOGRAM_DENSE_LIMIT:
+            dense = np.bincount(keys, minlength=n_cells * n_values)
+            keys = np.flatnonzero(dense)
+            counts = dense[keys]
+        else:
+            keys, counts = np.unique(keys, return_counts=True)
+        entry_cells = keys // n_values
+        self.offsets = np.concatenate([[0], np.cumsum(np.bincount(entry_cells, minlength=n_cells))])
+        self.codes = _small_codes(keys % n_values, n_values)
+        self.counts = counts.astype(np.int32)
+
+    def gather(self, cells: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Entri histogram sel terpilih: (posisi sel di `cells`, kode nilai, frekuensi)."""
+        starts, ends = self.offsets[cells], self.offsets[cells + 1]
+        entries = _ranges_to_index(starts, ends)
+        owner = np.repeat(np.arange(len(cells), dtype=np.int32), ends - starts)
+        return owner, self.codes[entries], self.counts[entries]
+
+    def histogram(self, gathered: Tuple[np.ndarray, np.ndarray, np.ndarray], groups: np.ndarray,
+                  n_groups: int) -> np.ndarray:
+        """Matriks (grup x nilai unik) dari hasil gather; groups = grup (>= 0) tiap sel terpilih."""
+        owner, codes, counts = gathered
+        n_values = len(self.uniques)
+        keys = (groups.astype(np.int64) * n_values)[owner] + codes
+        hist = np.bincount(keys, weights=counts, minlength=n_groups * n_values)
+        return hist.astype(np.int64).reshape(n_groups, n_values)
+
+    def medians(self, hist: np.ndarray) -> np.ndarray:
+        """Median setiap baris histogram (grup x nilai unik), sama dengan median baris aslinya."""
+        return histogram_quantiles(hist.reshape(-1, len(self.uniques)), self.uniques, [0.5], average_middle=True)[:, 0]
+
+class AnalyticsCube:
+    """Hitungan dan histogram nilai per sel atas dimensi kategori untuk filter dashboard.
+
+    Setiap sel adalah satu kombinasi kode CUBE_DIMENSIONS. KPI berbasis hitungan diperoleh
+    dengan menjumlahkan sel terpilih, dan median diperoleh dari histogram nilai sel terpilih
+    (CellHistogram); baris data bersih tidak disimpan maupun dipindai ulang saat query.
+    Karena dimensi grup median (angkatan, level, magang, status bekerja) juga dimensi kubus,
+    setiap sel masuk tepat satu grup.
+    """
+    @profiled()
+    def __init__(self, df: pd.DataFrame):
+        self.dimensions = list(CUBE_DIMENSIONS)
+        self.labels: Dict[str, pd.Index] = {}
+        codes = []
+        for dim in self.dimensions:
+            dim_codes, labels = _factorize(df[dim])
+            self.labels[dim] = labels
+            codes.append(np.where(dim_codes < 0, len(labels), dim_codes))  # NA mendapat slot sendiri
+        self.shape = tuple(len(self.labels[dim]) + 1 for dim in self.dimensions)
+        n_cells = int(np.prod(self.shape))
+        cells = np.ravel_multi_index(codes, self.shape)
+
+        def cell_counts(mask: np.ndarray) -> np.ndarray:
+            return np.bincount(cells[mask], minlength=n_cells).reshape(self.shape)
+
+        self.counts = cell_counts(np.ones(len(cells), dtype=bool))
+        self.kpi_counts = {name: cell_counts(mask) for name, mask in kpi_masks(df).items()}
+        self.employed_status = np.append(self.labels['status_saat_ini'].isin(EMPLOYED_STATUSES), False)
+        # Kode magang kubus diurutkan (False, True); slot NA dan nilai lain tidak masuk grup
+        self.magang_groups = np.full(len(self.labels['magang']) + 1, -1, dtype=np.int8)
+        for code, flag in enumerate(self.labels['magang'].tolist()):
+            if flag in (False, True):
+                self.magang_groups[code] = int(flag)
+
+        self.ipk = CellHistogram(df['ipk'].to_numpy(na_value=np.nan), cells, n_cells)
+        self.ttfj = CellHistogram(df['ttfj_bulan'].to_numpy(na_value=np.nan), cells, n_cells)
+        self.gaji = CellHistogram(df['gaji_awal_idr'].to_numpy(na_value=np.nan), cells, n_cells)
+        self.full_result = compute_analytics(df)
+
+    def _masks(self, selections: Dict[str, Iterable]) -> List[np.ndarray]:
+        masks = []
+        for dim in self.dimensions:
+            allowed = selections.get(dim)
+            if allowed is None:
+                masks.append(np.ones(len(self.labels[dim]) + 1, dtype=bool))
+            else:
+                masks.append(np.append(self.labels[dim].isin(list(allowed)), False))
+        return masks
+
+    @profiled()
+    def query(self, selections: Dict[str, Iterable]) -> AnalyticsResult:
+        """AnalyticsResult untuk kombinasi filter; dimensi yang tidak disebut berarti semua nilai."""
+        masks = self._masks(selections)
+        if all(mask.all() for mask in masks):
+            return self.full_result
+        selector = np.ix_(*[np.flatnonzero(mask) for mask in masks])
+        axes = {dim: i for i, dim in enumerate(self.dimensions)}
+        ids = {dim: np.flatnonzero(mask) for dim, mask in zip(self.dimensions, masks)}
+
+        def summed(cube: np.ndarray, *keep: str) -> np.ndarray:
+            return cube[selector].sum(axis=tuple(axes[d] for d in self.dimensions if d not in keep))
+
+        def labelled(dim: str, values: np.ndarray) -> Tuple[pd.Index, np.ndarray]:
+            # Buang slot NA agar sama dengan groupby yang mengabaikan kunci NA
+            real = ids[dim] < len(self.labels[dim])
+            return self.labels[dim][ids[dim][real]], values[real]
+
+        status_labels, status_counts = labelled('status_saat_ini', summed(self.counts, 'status_saat_ini'))
+        pairs = summed(self.counts, 'angkatan_lulus', 'status_saat_ini')
+        angkatan_real = ids['angkatan_lulus'] < len(self.labels['angkatan_lulus'])
+        status_real = ids['status_saat_ini'] < len(self.labels['status_saat_ini'])
+        pairs = pairs[np.ix_(angkatan_real, status_real)]
+        angkatan_idx, status_idx = np.nonzero(pairs)
+        status_per_angkatan = pd.DataFrame({
+            'angkatan_lulus': self.labels['angkatan_lulus'].take(ids['angkatan_lulus'][angkatan_real][angkatan_idx]),
+            'status_saat_ini': self.labels['status_saat_ini'].take(ids['status_saat_ini'][status_real][status_idx]),
+            'Jumlah': pairs[angkatan_idx, status_idx],
+        })
+        sektor_labels, sektor_employed = labelled('sektor', summed(self.kpi_counts['employed'], 'sektor'))
+        _, sektor_ok = labelled('sektor', summed(self.kpi_counts['kesesuaian_ok'], 'sektor'))
+
+        flat = masks[0]
+        for mask in masks[1:]:
+            flat = np.logical_and.outer(flat, mask)
+        cells = np.flatnonzero(flat.ravel())
+        coords = dict(zip(self.dimensions, np.unravel_index(cells, self.shape)))
+        # Entri histogram sel terpilih dikumpulkan sekali per kolom, lalu satu bincount atas grup gabungan
+        # (angkatan x level/magang x bekerja); setiap median grup cukup menjumlahkan sumbu lainnya
+        ipk, ttfj, gaji = (histogram.gather(cells) for histogram in (self.ipk, self.ttfj, self.gaji))
+        n_angkatan, n_level = self.shape[axes['angkatan_lulus']], self.shape[axes['level_jabatan']]
+        angkatan, employed = coords['angkatan_lulus'], self.employed_status[coords['status_saat_ini']]
+        magang = self.magang_groups[coords['magang']] + 1  # 0 = NA/lainnya, 1 = tidak magang, 2 = magang
+        ttfj_hist = self.ttfj.histogram(ttfj, (angkatan * 3 + magang) * 2 + employed, n_angkatan * 3 * 2)
+        ttfj_hist = ttfj_hist.reshape(n_angkatan, 3, 2, -1)
+        gaji_hist = self.gaji.histogram(gaji, (angkatan * n_level + coords['level_jabatan']) * 2 + employed,
+                                        n_angkatan * n_level * 2).reshape(n_angkatan, n_level, 2, -1)
+        ttfj_employed = ttfj_hist[:, :, 1].sum(axis=(0, 1))
+        present = ttfj_employed > 0
+        ttfj_non_magang, ttfj_magang = self.ttfj.medians(ttfj_hist[:, 1:].sum(axis=(0, 2)))
+
+        def group_medians(medians: np.ndarray, dim: str, name: str) -> pd.Series:
+            labels, group_counts = labelled(dim, summed(self.counts, dim))
+            has_rows = group_counts > 0
+            real_ids = ids[dim][ids[dim] < len(self.labels[dim])]
+            return pd.Series(medians[real_ids[has_rows]], index=labels[has_rows], name=name)
+
+        return build_analytics_result(
+            kpi=KpiCounts(int(summed(self.counts)), **{name: int(summed(cube)) for name, cube in self.kpi_counts.items()}),
+            status_counts=pd.Series(status_counts, index=status_labels),
+            status_per_angkatan=status_per_angkatan,
+            sektor_labels=sektor_labels,
+            sektor_employed=sektor_employed,
+            sektor_ok=sektor_ok,
+            ttfj_distribution=pd.Series(ttfj_employed[present], index=pd.Index(
+                self.ttfj.uniques[present].astype(np.float64), name='ttfj_bulan'), name='count'),
+            ipk_median=float(self.ipk.medians(self.ipk.histogram(ipk, np.zeros(len(cells), dtype=np.int8), 1))[0]),
+            ttfj_median_employed=float(self.ttfj.medians(ttfj_employed)[0]),
+            gaji_median_employed=float(self.gaji.medians(gaji_hist[:, :, 1].sum(axis=(0, 1)))[0]),
+            ttjf_per_angkatan=group_medians(self.ttfj.medians(ttfj_hist.sum(axis=(1, 2))), 'angkatan_lulus', 'ttfj_bulan'),
+            gaji_per_angkatan=group_medians(self.gaji.medians(gaji_hist.sum(axis=(1, 2))), 'angkatan_lulus', 'gaji_awal_idr'),
+            ttfj_magang=ttfj_magang,
+            ttfj_non_magang=ttfj_non_magang,
+            gaji_per_level=group_medians(self.gaji.medians(gaji_hist.sum(axis=(0, 2))), 'level_jabatan', 'gaji_awal_idr'),
+        )
+
+def select_rows(df: pd.DataFrame, selections: Dict[str, Iterable]) -> pd.DataFrame:
+    """Baris df yang cocok dengan pilihan filter, dengan semantik yang sama seperti AnalyticsCube.query."""
+    if not selections:
+        return df
+    mask = np.ones(len(df), dtype=bool)
+    for dim, allowed in selections.items():
+        mask &= df[dim].isin(list(allowed)).to_numpy(dtype=bool, na_value=False)
+    return df[mask]
+
+@profiled()
 def plot_status_distribution(status_counts: pd.Series):
     fig, ax = plt.subplots(figsize=(10, 6))
     status_counts.plot(kind='bar', ax=ax, color='skyblue')
@@ -98,6 +1803,7 @@ def plot_status_distribution(status_counts: pd.Series):
     plt.tight_layout()
     return fig
 
+@profiled()
 def plot_median_salary_trend(median_gaji_angkatan: pd.DataFrame):
     fig, ax = plt.subplots(figsize=(10, 6))
     ax.plot(median_gaji_angkatan['angkatan_lulus'], median_gaji_angkatan['gaji_awal_idr'], marker='o', linestyle='-')
@@ -108,15 +1814,17 @@ def plot_median_salary_trend(median_gaji_angkatan: pd.DataFrame):
     plt.tight_layout()
     return fig
 
-def plot_ttfj_hist(ttfj_values: pd.Series):
+@profiled()
+def plot_ttfj_hist(ttfj_values: pd.Series, weights: Optional[pd.Series] = None):
     fig, ax = plt.subplots(figsize=(10, 6))
-    ax.hist(ttfj_values, bins=15, edgecolor='black', color='lightgreen')
+    ax.hist(ttfj_values, bins=15, weights=weights, edgecolor='black', color='lightgreen')
     ax.set_title("Distribusi Waktu Tunggu Kerja (TTFJ) Alumni")
     ax.set_xlabel("Waktu Tunggu Kerja (Bulan)")
     ax.set_ylabel("Jumlah Responden")
     plt.tight_layout()
     return fig
 
+@profiled()
 def plot_kesesuaian_by_sektor(kesesuaian_per_sektor: pd.Series):
     fig, ax = plt.subplots(figsize=(12, 7))
     kesesuaian_per_sektor.plot(kind='bar', ax=ax, color='salmon')
@@ -127,6 +1835,7 @@ def plot_kesesuaian_by_sektor(kesesuaian_per_sektor: pd.Series):
     plt.tight_layout()
     return fig
 
+@profiled()
 def plot_gaji_per_level(gaji_per_level: pd.Series):
     fig, ax = plt.subplots(figsize=(10, 6))
     gaji_per_level.plot(kind='bar', ax=ax, color='purple')
@@ -137,24 +1846,524 @@ def plot_gaji_per_level(gaji_per_level: pd.Series):
     plt.tight_layout()
     return fig
 
+# --- Cache Hasil Ber-alamat Konten ---
+# Skema ikut disidik: snapshot, state inkremental, dan cache disk dari skema lama tidak terpakai ulang
+SCHEMA_DIGEST: bytes = hashlib.blake2b(repr(sorted(TRACER_SCHEMA.values(), key=lambda spec: spec.name)).encode('utf-8'),
+                                       digest_size=8).digest()
+
+def fingerprint_bytes(data: bytes) -> str:
+    """Sidik jari isi dataset (BLAKE2b, dengan SCHEMA_DIGEST) sebagai dasar kunci cache."""
+    digest = hashlib.blake2b(SCHEMA_DIGEST, digest_size=20)
+    digest.update(data)
+    return digest.hexdigest()
+
+_FILE_FINGERPRINTS: Dict[Tuple[str, int, int], str] = {}
+
+def fingerprint_file(path: str, block_size: int = 1 << 20) -> str:
+    """Sidik jari isi file; dihitung ulang hanya bila ukuran atau mtime file berubah."""
+    stat = os.stat(path)
+    memo_key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    cached = _FILE_FINGERPRINTS.get(memo_key)
+    if cached is None:
+        digest = hashlib.blake2b(SCHEMA_DIGEST, digest_size=20)
+        with open(path, 'rb') as handle:
+            for block in iter(lambda: handle.read(block_size), b''):
+                digest.update(block)
+        cached = _FILE_FINGERPRINTS[memo_key] = digest.hexdigest()
+    return cached
+
+def make_cache_key(namespace: str, fingerprint: str, params: Optional[dict] = None) -> str:
+    """Menggabungkan jenis hasil, sidik jari dataset, dan parameter menjadi kunci cache."""
+    payload = json.dumps([namespace, fingerprint, params or {}], sort_keys=True, default=str)
+    return namespace + '-' + hashlib.blake2b(payload.encode('utf-8'), digest_size=20).hexdigest()
+
+def _estimate_nbytes(value) -> int:
+    """Perkiraan ukuran objek di memori untuk batas eviksi cache."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum()) if isinstance(usage, pd.Series) else int(usage)
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if is_dataclass(value):
+        return sum(_estimate_nbytes(getattr(value, f.name)) for f in fields(value))
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(_estimate_nbytes(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(_estimate_nbytes(v) for v in value)
+    if hasattr(value, '__dict__'):
+        return sys.getsizeof(value) + _estimate_nbytes(vars(value))
+    return sys.getsizeof(value)
+
+class ResultCache:
+    """Cache LRU berbatas ukuran untuk data bersih dan hasil analitik, opsional disimpan ke disk.
+
+    Kunci berasal dari sidik jari isi dataset dan parameter pembersihan, sehingga
+    unggahan identik dari sesi atau pengguna berbeda memakai entri yang sama.
+    Direktori disk dapat dipakai bersama beberapa proses server: setiap entri ditulis
+    atomik lewat write_plain, gagal tulis hanya dilewati, dan total ukurannya dibatasi
+    disk_max_bytes dengan membuang file yang paling lama tidak dipakai.
+    """
+    def __init__(self, max_bytes: int = CACHE_MAX_BYTES, disk_dir: Optional[str] = None,
+                 disk_max_bytes: int = CACHE_DISK_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.disk_max_bytes = disk_max_bytes
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+        self._entries: "OrderedDict[str, Tuple[object, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_evictions = 0
+        self.disk_errors = 0
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, key + '.pkl')
+
+    def get(self, key: str):
+        """Mengambil entri (memori lalu disk); None bila tidak ada."""
+        value = self._lookup(key)
+        profiler = active_profiler()
+        if profiler is not None:
+            profiler.note_cache(value is not None)
+        return value
+
+    def _lookup(self, key: str):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+        if self.disk_dir and os.path.exists(self._disk_path(key)):
+            try:
+                value = read_plain(self._disk_path(key))
+            except (EOFError, KeyError, pickle.UnpicklingError) + PERSIST_ERRORS:
+                value = None
+            else:
+                try:
+                    os.utime(self._disk_path(key))  # urutan LRU untuk _trim_disk
+                except OSError:
+                    pass  # sudah dihapus proses lain
+            if value is not None:
+                with self._lock:
+                    self.disk_hits += 1
+                self._store(key, value)
+                return value
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, value) -> None:
+        """Menyimpan entri ke memori (dan ke disk bila diaktifkan)."""
+        self._store(key, value)
+        if self.disk_dir:
+            try:
+                write_plain(value, self._disk_path(key))
+            except PERSIST_ERRORS:
+                # Disk penuh/tidak dapat ditulis atau nilai tidak dapat diserialisasi: entri hanya ada di memori
+                with self._lock:
+                    self.disk_errors += 1
+                return
+            self._trim_disk()
+
+    def _trim_disk(self) -> None:
+        """Menghapus file cache yang paling lama tidak dipakai sampai total ukurannya <= disk_max_bytes."""
+        entries = []
+        try:
+            with os.scandir(self.disk_dir) as scan:
+                for entry in scan:
+                    if entry.name.endswith('.pkl'):
+                        try:
+                            info = entry.stat()
+                        except FileNotFoundError:
+                            continue  # dihapus proses lain
+                        entries.append((info.st_mtime, info.st_size, entry.path))
+        except OSError:
+            return
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.disk_max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass  # sudah dihapus proses lain
+            except OSError:
+                continue
+            total -= size
+            with self._lock:
+                self.disk_evictions += 1
+
+    def _store(self, key: str, value) -> None:
+        nbytes = _estimate_nbytes(value)
+        if nbytes > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.current_bytes -= previous[1]
+            self._entries[key] = (value, nbytes)
+            self.current_bytes += nbytes
+            while self.current_bytes > self.max_bytes and self._entries:
+                _, (_, evicted_bytes) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_bytes
+                self.evictions += 1
+
+    def get_or_compute(self, key: str, compute: Callable[[], object]):
+        """Mengembalikan entri cache, atau menghitung lalu menyimpannya bila belum ada."""
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self) -> dict:
+        """Statistik hit/miss dan pemakaian memori untuk penentuan ukuran cache."""
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'memory_bytes': self.current_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'disk_evictions': self.disk_evictions,
+                'disk_errors': self.disk_errors,
+                'hit_rate': (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+                'disk_dir': self.disk_dir,
+            }
+
+@st.cache_resource(show_spinner=False)
+def get_result_cache() -> ResultCache:
+    """Satu instance cache per proses server, dipakai bersama oleh semua sesi."""
+    return ResultCache(CACHE_MAX_BYTES, CACHE_DIR, CACHE_DISK_MAX_BYTES)
+
+# --- Antrian Job Latar Belakang ---
+def completed_future(value) -> Future:
+    """Future yang sudah selesai, untuk hasil yang tersedia tanpa perlu dijadwalkan."""
+    future = Future()
+    future.set_result(value)
+    return future
+
+class JobQueue:
+    """Pool thread per proses server untuk ingest, pembersihan, dan analitik di latar belakang.
+
+    Job diidentifikasi oleh kuncinya (kunci ResultCache yang memuat sidik jari dataset);
+    job dengan kunci sama yang masih berjalan dipakai bersama oleh semua sesi. Job baru
+    dijadwalkan lewat callback setelah semua dependensinya selesai, sehingga worker tidak
+    pernah menunggu job lain. Grafik Matplotlib memakai jalur satu worker karena pyplot
+    tidak thread-safe.
+    """
+    def __init__(self, max_workers: int = JOB_WORKERS, registry: Optional[ProfileRegistry] = None):
+        self._executors = {
+            'compute': ThreadPoolExecutor(max_workers, thread_name_prefix='tracer-job'),
+            'plot': ThreadPoolExecutor(1, thread_name_prefix='tracer-plot'),
+        }
+        self.registry = registry
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.deduplicated = 0
+        self.failed = 0
+
+    def submit(self, key: str, fn: Callable, *deps: Future, lane: str = 'compute', trace_memory: bool = False) -> Future:
+        """Menjadwalkan fn(*hasil_deps); mengembalikan Future job yang sedang berjalan bila kunci sama.
+
+        trace_memory mengikuti pengaturan profiler sesi yang pertama kali mengirim job ini.
+        """
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                self.deduplicated += 1
+                return future
+            future = self._inflight[key] = Future()
+            self.submitted += 1
+        pending = [len(deps)]
+
+        def dependency_done(_):
+            with self._lock:
+                pending[0] -= 1
+                ready = pending[0] == 0
+            if ready:
+                self._executors[lane].submit(self._execute, key, future, fn, deps, trace_memory)
+
+        if not deps:
+            self._executors[lane].submit(self._execute, key, future, fn, deps, trace_memory)
+        for dep in deps:
+            dep.add_done_callback(dependency_done)
+        return future
+
+    def _execute(self, key: str, future: Future, fn: Callable, deps: Tuple[Future, ...], trace_memory: bool) -> None:
+        profiler = Profiler(trace_memory, self.registry)
+        value, error = None, None
+        try:
+            error = next((dep.exception() for dep in deps if dep.exception() is not None), None)
+            if error is None:
+                with profiler.activate(), profiler.stage(f"JobQueue[{key.split('-', 1)[0]}]"):
+                    value = fn(*(dep.result() for dep in deps))
+        except BaseException as exc:
+            error = exc
+        # Tahap job dicatat ke registry sekali di sini; sesi yang menunggu hanya menampilkannya
+        future.stage_records = profiler.records
+        if self.registry is not None:
+            self.registry.observe(profiler.records)
+        # Kunci dilepas sebelum Future selesai: permintaan berikutnya dilayani ResultCache
+        with self._lock:
+            self._inflight.pop(key, None)
+            if error is not None:
+                self.failed += 1
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(value)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'in_flight': len(self._inflight),
+                'submitted': self.submitted,
+                'deduplicated': self.deduplicated,
+                'failed': self.failed,
+            }
+
+@st.cache_resource(show_spinner=False)
+def get_job_queue() -> JobQueue:
+    """Satu antrian job per proses server; deduplikasi berlaku lintas sesi."""
+    return JobQueue(JOB_WORKERS, get_profile_registry())
+
 # --- Layanan Berorientasi Objek ---
+def _coerce_column(series: pd.Series, spec: ColumnSpec) -> pd.Series:
+    """Mengonversi satu kolom ke dtype skema; ValueError bila ada nilai yang tidak dapat dikonversi."""
+    if spec.dtype.startswith('string'):
+        return series.astype(spec.dtype)
+    if spec.dtype == 'category':
+        return series if isinstance(series.dtype, pd.CategoricalDtype) else series.astype('category')
+    if series.dtype == spec.dtype:
+        return series
+    numeric = pd.to_numeric(series, errors='coerce')
+    invalid = int((numeric.isna() & series.notna()).sum())
+    if invalid:
+        raise ValueError(f"Kolom '{spec.name}' berisi {invalid} nilai non-numerik.")
+    if spec.dtype == 'boolean':
+        invalid = int((numeric.notna() & ~numeric.isin([0, 1])).sum())
+        if invalid:
+            raise ValueError(f"Kolom '{spec.name}' hanya boleh bernilai 0/1 ({invalid} nilai lain).")
+        return numeric.astype('boolean')
+    if spec.dtype.startswith('Int'):
+        info = np.iinfo(spec.dtype.lower())
+        invalid = int((numeric.notna() & ((numeric % 1 != 0) | (numeric < info.min) | (numeric > info.max))).sum())
+        if invalid:
+            raise ValueError(f"Kolom '{spec.name}' berisi {invalid} nilai yang bukan bilangan bulat {spec.dtype}.")
+    return numeric.astype(spec.dtype)
+
+def apply_schema(df: pd.DataFrame, schema: Dict[str, ColumnSpec] = TRACER_SCHEMA) -> pd.DataFrame:
+    """Menerapkan dtype ringkas dari skema ke kolom yang tersedia pada DataFrame."""
+    for col, spec in schema.items():
+        if col in df.columns:
+            df[col] = _coerce_column(df[col], spec)
+    return df
+
+def _range_violations(df: pd.DataFrame, schema: Dict[str, ColumnSpec]) -> Iterator[Tuple[str, np.ndarray]]:
+    """Mask nilai di luar rentang skema untuk setiap kolom yang punya rentang (NA tidak dihitung)."""
+    for col, spec in schema.items():
+        if col not in df.columns or (spec.min_value is None and spec.max_value is None):
+            continue
+        values = _as_float(df[col])
+        outside = np.zeros(len(values), dtype=bool)
+        if spec.min_value is not None:
+            outside |= values < spec.min_value
+        if spec.max_value is not None:
+            outside |= values > spec.max_value
+        yield col, outside
+
+def find_schema_violations(df: pd.DataFrame, schema: Dict[str, ColumnSpec] = TRACER_SCHEMA) -> Dict[str, int]:
+    """Menghitung jumlah nilai di luar rentang skema per kolom (NA tidak dihitung)."""
+    violations = {}
+    for col, outside in _range_violations(df, schema):
+        count = int(np.count_nonzero(outside))
+        if count:
+            violations[col] = count
+    return violations
+
+def within_schema_range(df: pd.DataFrame, schema: Dict[str, ColumnSpec] = TRACER_SCHEMA) -> np.ndarray:
+    """Mask baris yang seluruh nilainya berada di dalam rentang skema; baris lain dibuang clean_data."""
+    inside = np.ones(len(df), dtype=bool)
+    for _, outside in _range_violations(df, schema):
+        inside &= ~outside
+    return inside
+
 def validate_dataset_columns(df: pd.DataFrame, required_columns: List[str]) -> None:
-    """Validasi ketersediaan kolom-kolom penting pada dataset."""
+    """Validasi ketersediaan kolom-kolom penting.
+
+    Nilai di luar rentang skema tidak menggagalkan pemuatan: nilai tersebut dilaporkan oleh
+    profile_data dan barisnya dibuang oleh clean_data.
+    """
     missing = [col for col in required_columns if col not in df.columns]
     if missing:
         raise ValueError(
             "Kolom berikut tidak ditemukan pada dataset: " + ", ".join(missing)
         )
 
+def _naive_nbytes(series: pd.Series) -> int:
+    """Ukuran kolom bila dimuat dengan dtype bawaan pandas (object/float64/int64).
+
+    Kolom object = pointer 8 byte per baris + sys.getsizeof tiap objek; untuk kategori dan string ASCII
+    pyarrow ukuran itu dihitung dari kode/panjang byte tanpa membuat objek Python per baris.
+    """
+    rows = len(series)
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        sizes = np.array([sys.getsizeof(value) for value in series.cat.categories.astype(object)] + [sys.getsizeof(np.nan)])
+        return int(8 * rows + sizes[series.cat.codes.to_numpy()].sum())
+    if isinstance(series.dtype, pd.StringDtype) and series.dtype.storage == 'pyarrow':
+        values = pa.chunked_array(series.array.__arrow_array__())
+        if pc.all(pc.string_is_ascii(values)).as_py() is not False:
+            nulls = values.null_count
+            text_bytes = pc.sum(pc.binary_length(values)).as_py() or 0
+            return int(8 * rows + (rows - nulls) * sys.getsizeof('') + text_bytes + nulls * sys.getsizeof(pd.NA))
+    if isinstance(series.dtype, (pd.CategoricalDtype, pd.StringDtype)) or series.dtype == object:
+        return int(series.astype(object).memory_usage(deep=True, index=False))
+    return int(rows * 8)
+
+def memory_report(df: pd.DataFrame) -> pd.DataFrame:
+    """Laporan byte per kolom: dtype bawaan pandas (sebelum) vs dtype skema (sesudah)."""
+    report = pd.DataFrame({
+        'dtype': df.dtypes.astype(str),
+        'bytes_sebelum': [_naive_nbytes(df[col]) for col in df.columns],
+        'bytes_sesudah': df.memory_usage(deep=True, index=False),
+    })
+    report.loc['TOTAL'] = ['', report['bytes_sebelum'].sum(), report['bytes_sesudah'].sum()]
+    report['rasio'] = report['bytes_sebelum'] / report['bytes_sesudah'].where(report['bytes_sesudah'] > 0)
+    return report
+
 class DataLoader:
-    """Layanan pemuatan data dengan validasi dan cache."""
+    """Layanan pemuatan data dengan validasi dan snapshot kolumnar.
+
+    CSV di-parse sekali dengan dtype dari TRACER_SCHEMA; hasilnya disimpan sebagai snapshot Feather (Arrow IPC)
+    tanpa kompresi yang dibuka secara memory-mapped pada start berikutnya, sehingga CSV tidak di-parse ulang.
+    Kolom tetap dimaterialisasi ke dtype pandas (category/Int8/boolean) di setiap proses, jadi frame
+    hasilnya bukan memori bersama antar worker.
+    """
+    @staticmethod
+    def _parse_dtypes(schema: Dict[str, ColumnSpec]) -> dict:
+        # Kolom kategori langsung di-parse sebagai category agar string tidak pernah menjadi objek Python
+        parse_dtypes = {col: 'category' for col, spec in schema.items() if spec.dtype == 'category'}
+        parse_dtypes['alumni_id'] = str
+        return parse_dtypes
+
+    @staticmethod
+    @profiled()
+    def read_csv(source, required_columns: List[str], schema: Dict[str, ColumnSpec] = TRACER_SCHEMA) -> pd.DataFrame:
+        df = pd.read_csv(source, dtype=DataLoader._parse_dtypes(schema), usecols=lambda col: col in required_columns)
+        df = apply_schema(df, schema)
+        validate_dataset_columns(df, required_columns)
+        return df
+
+    @staticmethod
+    def iter_chunks(source, required_columns: List[str], chunksize: int = STREAM_CHUNK_ROWS,
+                    schema: Dict[str, ColumnSpec] = TRACER_SCHEMA) -> Iterator[pd.DataFrame]:
+        """Membaca CSV per chunk; setiap chunk sudah dikonversi ke skema dan divalidasi."""
+        with pd.read_csv(source, dtype=DataLoader._parse_dtypes(schema), usecols=lambda col: col in required_columns,
+                         chunksize=chunksize) as reader:
+            for chunk in reader:
+                chunk = apply_schema(chunk, schema)
+                validate_dataset_columns(chunk, required_columns)
+                yield chunk
+
     @staticmethod
-    @st.cache_data(show_spinner=False)
-    def load(path: str, required_columns: List[str]) -> pd.DataFrame:
-        df = pd.read_csv(path, dtype={'alumni_id': str})
+    def append_wave(dataset: IncrementalDataset, source, required_columns: List[str] = REQUIRED_COLUMNS,
+                    label: str = "") -> WaveSummary:
+        """Menambahkan satu gelombang CSV ke IncrementalDataset secara streaming."""
+        return dataset.append(DataLoader.iter_chunks(source, required_columns), label=label)
+
+    SOURCE_METADATA_KEY = b'tracer_source'
+
+    @staticmethod
+    def _snapshot_prefix(path: str) -> str:
+        # Nama file saja bisa sama untuk CSV berbeda (mis. data/*/tracer.csv): sertakan hash path absolutnya
+        source = os.path.abspath(path)
+        base = os.path.splitext(os.path.basename(source))[0]
+        return f"{base}.{hashlib.sha1(source.encode('utf-8')).hexdigest()[:12]}."
+
+    @staticmethod
+    def snapshot_path(path: str, fingerprint: str) -> str:
+        return os.path.join(SNAPSHOT_DIR, f"{DataLoader._snapshot_prefix(path)}{fingerprint[:16]}.feather")
+
+    @staticmethod
+    def _snapshot_source(snapshot: str) -> Optional[str]:
+        """Path sumber yang tercatat di metadata snapshot (None bila tidak terbaca)."""
+        try:
+            metadata = feather.read_table(snapshot, columns=[], memory_map=True).schema.metadata or {}
+        except (pa.ArrowException, OSError):
+            return None
+        source = metadata.get(DataLoader.SOURCE_METADATA_KEY)
+        return source.decode('utf-8') if source is not None else None
+
+    @staticmethod
+    def read_snapshot(snapshot: str, required_columns: List[str]) -> pd.DataFrame:
+        table = feather.read_table(snapshot, columns=list(required_columns), memory_map=True)
+        df = apply_schema(table.to_pandas(split_blocks=True))
         validate_dataset_columns(df, required_columns)
         return df
 
+    @staticmethod
+    def write_snapshot(df: pd.DataFrame, snapshot: str, source: str) -> None:
+        """Menulis snapshot secara atomik lalu menghapus snapshot lama yang tercatat dari file sumber yang sama."""
+        directory = os.path.dirname(snapshot)
+        source = os.path.abspath(source)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            table = pa.Table.from_pandas(df.reset_index(drop=True), preserve_index=False)
+            table = table.replace_schema_metadata({**(table.schema.metadata or {}),
+                                                  DataLoader.SOURCE_METADATA_KEY: source.encode('utf-8')})
+            # File sementara unik per penulis: worker paralel tidak saling menimpa
+            handle, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            os.close(handle)
+            try:
+                feather.write_feather(table, tmp_path, compression='uncompressed')
+                os.replace(tmp_path, snapshot)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+            prefix = DataLoader._snapshot_prefix(source)
+            for name in os.listdir(directory):
+                stale = os.path.join(directory, name)
+                if (name.startswith(prefix) and name.endswith('.feather') and stale != snapshot
+                        and DataLoader._snapshot_source(stale) == source):
+                    try:
+                        os.remove(stale)
+                    except FileNotFoundError:
+                        pass  # sudah dihapus worker lain
+        except OSError:
+            # Direktori snapshot tidak dapat ditulis: tetap lanjut dengan data hasil parse CSV
+            pass
+
+    @staticmethod
+    @profiled()
+    def load(path: str, required_columns: List[str], fingerprint: Optional[str] = None) -> pd.DataFrame:
+        fingerprint = fingerprint or fingerprint_file(path)
+        snapshot = DataLoader.snapshot_path(path, fingerprint)
+        if os.path.exists(snapshot):
+            try:
+                return DataLoader.read_snapshot(snapshot, required_columns)
+            except (pa.ArrowException, OSError, ValueError):
+                pass  # snapshot rusak atau skema berubah: bangun ulang dari CSV
+        df = DataLoader.read_csv(path, required_columns)
+        DataLoader.write_snapshot(df, snapshot, path)
+        return df
+
 class AnalyticsService:
     """Layanan analitik yang memanggil fungsi-fungsi pure compute_* yang ada."""
     def summary(self, df: pd.DataFrame) -> dict:
@@ -163,20 +2372,83 @@ class AnalyticsService:
         return compute_performance_metrics(df)
     def comparison(self, df: pd.DataFrame) -> dict:
         return compute_comparison_stats(df)
+    def compute(self, df: pd.DataFrame) -> AnalyticsResult:
+        return compute_analytics(df)
+
+def _hash_plot_input(*values) -> str:
+    """Sidik jari isi Series/DataFrame (nilai, indeks, dan nama) sebagai kunci cache gambar."""
+    digest = hashlib.blake2b(digest_size=20)
+    for value in values:
+        if value is None:
+            digest.update(b'none')
+            continue
+        digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+        names = list(value.columns) if isinstance(value, pd.DataFrame) else [value.name]
+        digest.update(repr((names, value.index.names)).encode('utf-8'))
+    return digest.hexdigest()
+
+@st.cache_resource(show_spinner=False)
+def get_plot_cache() -> ResultCache:
+    """Cache gambar grafik per proses server, dipakai bersama oleh semua sesi."""
+    return ResultCache(PLOT_CACHE_MAX_BYTES)
 
 class VisualizationService:
-    """Layanan visualisasi yang membungkus fungsi plot_* yang ada."""
+    """Layanan visualisasi yang membungkus fungsi plot_* yang ada.
+
+    submit_png merender plot sebagai job latar belakang dan menyimpan PNG-nya di cache LRU
+    dengan kunci hash data masukan + parameter plot, sehingga tampilan berulang tidak
+    menggambar ulang. chart_data menyiapkan data pra-agregasi untuk backend grafik native browser.
+    """
+    def __init__(self, cache: Optional[ResultCache] = None):
+        self.cache = cache if cache is not None else ResultCache(PLOT_CACHE_MAX_BYTES)
+
     def status_distribution(self, status_counts: pd.Series):
         return plot_status_distribution(status_counts)
     def median_salary_trend(self, median_gaji_angkatan: pd.DataFrame):
         return plot_median_salary_trend(median_gaji_angkatan)
-    def ttfj_hist(self, ttfj_values: pd.Series):
-        return plot_ttfj_hist(ttfj_values)
+    def ttfj_hist(self, ttfj_values: pd.Series, weights: Optional[pd.Series] = None):
+        return plot_ttfj_hist(ttfj_values, weights)
     def kesesuaian_by_sektor(self, kesesuaian_per_sektor: pd.Series):
         return plot_kesesuaian_by_sektor(kesesuaian_per_sektor)
     def gaji_per_level(self, gaji_per_level: pd.Series):
         return plot_gaji_per_level(gaji_per_level)
 
+    def _draw_png(self, plot_name: str, data: tuple, dpi: int) -> bytes:
+        fig = getattr(self, plot_name)(*data)
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format='png', dpi=dpi, bbox_inches='tight')
+        plt.close(fig)
+        return buffer.getvalue()
+
+    def submit_png(self, jobs: JobQueue, plot_name: str, *data, dpi: int = PLOT_DPI, trace_memory: bool = False) -> Future:
+        """Merender plot_name menjadi PNG di jalur plot JobQueue; hit cache langsung selesai tanpa job."""
+        key = make_cache_key('plot', _hash_plot_input(*data), {'plot': plot_name, 'dpi': dpi})
+        cached = self.cache.get(key)
+        if cached is not None:
+            return completed_future(cached)
+
+        def draw() -> bytes:
+            png = self._draw_png(plot_name, data, dpi)
+            self.cache.put(key, png)
+            return png
+        return jobs.submit(key, draw, lane='plot', trace_memory=trace_memory)
+
+    def chart_data(self, plot_name: str, *data) -> Tuple[str, pd.DataFrame]:
+        """Data pra-agregasi (jenis grafik, DataFrame) untuk st.bar_chart/st.line_chart."""
+        if plot_name == 'median_salary_trend':
+            return 'line', data[0].set_index('angkatan_lulus')
+        if plot_name == 'ttfj_hist':
+            ttfj_values, weights = data[0], (data[1] if len(data) > 1 else None)
+            counts, edges = np.histogram(ttfj_values, bins=15, weights=weights)
+            labels = [f"{lo:.1f}–{hi:.1f}" for lo, hi in zip(edges[:-1], edges[1:])]
+            return 'bar', pd.DataFrame({'Jumlah Responden': counts}, index=pd.Index(labels, name='TTFJ (bulan)'))
+        return 'bar', data[0].to_frame()
+
+@st.cache_resource(show_spinner=False)
+def get_profile_registry() -> ProfileRegistry:
+    """Agregat profil per proses server, dipakai bersama oleh semua sesi."""
+    return ProfileRegistry()
+
 # --- Arsitektur Aplikasi Utama ---
 class DashboardApp:
     """Orkestrasi UI Streamlit dengan layanan OOP."""
@@ -184,16 +2456,170 @@ class DashboardApp:
         self.dataset_path = dataset_path
         self.loader = DataLoader()
         self.analytics = AnalyticsService()
-        self.viz = VisualizationService()
-        self.df_raw = None
-        self.df_cleaned = None
+        self.viz = VisualizationService(get_plot_cache())
+        self.chart_backend = CHART_BACKENDS[0]
+        self.result = None
+        self.quality = None
+        self.cube = None
+        self.inference = None
+        self.fingerprint = None
+        self.cache = get_result_cache()
+        self.jobs = get_job_queue()
+        # Future per bagian halaman ('quality', 'cube'/'result', ...) dan semua job yang disentuh rerun ini
+        self.pending: Dict[str, Future] = {}
+        self._job_futures: Dict[int, Future] = {}
+        self._charts: List[Tuple[object, Future]] = []
+        # Nilai toggle dibaca dari rerun sebelumnya karena widget-nya ada di panel admin di akhir halaman
+        self.profiler = Profiler(st.session_state.get('profile_trace_memory', PROFILE_TRACE_MEMORY), get_profile_registry())
+
+    @profiled()
+    def _load_raw(self, source) -> pd.DataFrame:
+        # Frame hasil snapshot memory-mapped dipakai bersama lewat ResultCache, bukan st.cache_data
+        # yang menyalin ulang DataFrame di setiap rerun.
+        key = make_cache_key('raw', self.fingerprint)
+        if isinstance(source, str):
+            return self.cache.get_or_compute(key, lambda: self.loader.load(source, REQUIRED_COLUMNS, self.fingerprint))
+        return self.cache.get_or_compute(key, lambda: self.loader.read_csv(source, REQUIRED_COLUMNS))
+
+    def _track(self, future: Future) -> Future:
+        self._job_futures[id(future)] = future
+        return future
+
+    def _submit(self, key: str, compute: Callable, *deps: Future, cached: bool = True) -> Future:
+        """Job latar belakang ber-kunci; bila cached, hasilnya juga disimpan di ResultCache dengan kunci sama."""
+        job = (lambda *args: self.cache.get_or_compute(key, lambda: compute(*args))) if cached else compute
+        return self._track(self.jobs.submit(key, job, *deps, trace_memory=self.profiler.trace_memory))
+
+    @profiled()
+    def _submit_in_memory(self, source) -> None:
+        """Menjadwalkan ingest -> profil hash baris -> pembersihan -> (laporan kualitas, kubus) begitu dataset dipilih."""
+        raw = self._submit(make_cache_key('raw', self.fingerprint), lambda: self._load_raw(source), cached=False)
+        profile = self._submit(make_cache_key('profile', self.fingerprint), profile_data, raw)
+        clean = self._submit(
+            make_cache_key('clean', self.fingerprint, CLEANING_PARAMS),
+            lambda df_raw, data_profile: clean_data(df_raw, profile=data_profile, **CLEANING_PARAMS), raw, profile,
+        )
+        self.pending['clean'] = clean
+        self.pending['quality'] = self._submit(
+            make_cache_key('quality', self.fingerprint, CLEANING_PARAMS), build_quality_report, raw, clean, profile,
+        )
+        self.pending['cube'] = self._submit(make_cache_key('cube', self.fingerprint, CLEANING_PARAMS), AnalyticsCube, clean)
+
+    def _append_wave(self, dataset: IncrementalDataset, wave) -> IncrementalDataset:
+        # State di cache dipakai bersama antar sesi, jadi gelombang baru ditambahkan ke salinannya
+        updated = copy.deepcopy(dataset)
+        wave.seek(0)
+        self.loader.append_wave(updated, wave, REQUIRED_COLUMNS, label=wave.name)
+        return updated
+
+    @profiled()
+    def _submit_incremental(self, source, waves) -> None:
+        """Menjadwalkan data dasar + gelombang baru; setiap prefiks rantai gelombang di-cache dan disimpan ke disk terpisah."""
+        def build_base() -> IncrementalDataset:
+            dataset = IncrementalDataset()
+            self.loader.append_wave(dataset, source, REQUIRED_COLUMNS, label="Data dasar")
+            return dataset
+
+        base_fingerprint = self.fingerprint
+        dataset = self._submit(
+            make_cache_key('incremental', base_fingerprint),
+            lambda: IncrementalDataset.load_or_build(base_fingerprint, build_base),
+        )
+        for wave in waves:
+            wave_fingerprint = fingerprint_bytes((self.fingerprint + fingerprint_bytes(wave.getvalue())).encode('utf-8'))
+            dataset = self._submit(
+                make_cache_key('incremental', wave_fingerprint),
+                lambda previous, wave=wave, chain=wave_fingerprint: IncrementalDataset.load_or_build(
+                    chain, lambda: self._append_wave(previous, wave)),
+                dataset,
+            )
+            self.fingerprint = wave_fingerprint
+        self.pending['dataset'] = dataset
+        self.pending['quality'] = self._submit(
+            make_cache_key('incremental-quality', self.fingerprint, CLEANING_PARAMS),
+            lambda built: built.quality_report(**CLEANING_PARAMS), dataset, cached=False,
+        )
+        self.pending['result'] = self._submit(
+            make_cache_key('analytics', self.fingerprint, CLEANING_PARAMS),
+            lambda built: built.finalize(**CLEANING_PARAMS), dataset,
+        )
+
+    def _display_wave_summaries(self) -> None:
+        for summary in self.pending['dataset'].result().waves[1:]:
+            st.sidebar.caption(
+                f"**{summary.label}**: {summary.rows_added} baris ditambahkan dari {summary.rows_read} "
+                f"({summary.duplicate_rows} duplikat, {summary.known_alumni_rows} alumni_id sudah ada, "
+                f"{summary.invalid_rows} tidak valid)."
+            )
+
+    def _sidebar_filters(self, cube: AnalyticsCube) -> Dict[str, list]:
+        """Kontrol filter di sidebar; dimensi tanpa pilihan tidak dibatasi."""
+        st.sidebar.header("Filter")
+        selections: Dict[str, list] = {}
+        angkatan = cube.labels['angkatan_lulus'].tolist()
+        if len(angkatan) > 1:
+            low, high = st.sidebar.select_slider(
+                "Rentang angkatan lulus", options=angkatan, value=(angkatan[0], angkatan[-1])
+            )
+            if (low, high) != (angkatan[0], angkatan[-1]):
+                selections['angkatan_lulus'] = [a for a in angkatan if low <= a <= high]
+        for dim, label in (("sektor", "Sektor"), ("level_jabatan", "Level jabatan"), ("status_saat_ini", "Status saat ini")):
+            chosen = st.sidebar.multiselect(f"{label} (kosong = semua)", options=cube.labels[dim].tolist())
+            if chosen:
+                selections[dim] = chosen
+        magang = st.sidebar.radio("Magang", options=["Semua", "Pernah magang", "Tidak magang"], horizontal=True)
+        if magang != "Semua":
+            selections['magang'] = [magang == "Pernah magang"]
+        return selections
+
+    @profiled()
+    def _submit_streaming(self, source) -> None:
+        # Hanya agregat dan cuplikan baris yang disimpan; DataFrame penuh tidak pernah dibentuk
+        key = make_cache_key('stream', self.fingerprint, CLEANING_PARAMS)
+        stream = self._submit(
+            key, lambda: stream_clean_and_aggregate(self.loader.iter_chunks(source, REQUIRED_COLUMNS), **CLEANING_PARAMS),
+        )
+        self.pending['quality'] = self._submit(key + '-quality', lambda pair: pair[0], stream, cached=False)
+        self.pending['result'] = self._submit(key + '-result', lambda pair: pair[1], stream, cached=False)
+
+    def _submit_inference(self, selections: Dict[str, list]) -> None:
+        """Menjadwalkan CI bootstrap & uji permutasi untuk baris hasil filter; di-cache per sidik jari + filter."""
+        params = {**CLEANING_PARAMS, 'filter': selections, 'resamples': INFERENCE_RESAMPLES,
+                  'alpha': INFERENCE_ALPHA, 'seed': INFERENCE_SEED}
+        self.pending['inference'] = self._submit(
+            make_cache_key('inference', self.fingerprint, params),
+            lambda df_cleaned: compute_inference(select_rows(df_cleaned, selections)), self.pending['clean'],
+        )
+
+    def _await(self, name: str, message: str):
+        """Menunggu satu bagian hasil job latar belakang; galat job diteruskan ke pemanggil."""
+        future = self.pending[name]
+        if not future.done():
+            with st.spinner(message):
+                return future.result()
+        return future.result()
     
+    ISSUE_LABELS = {
+        'missing': 'Missing Value',
+        'di_luar_rentang': 'Di Luar Rentang Skema',
+        'di_luar_domain': 'Di Luar Domain Skema',
+    }
+
+    @profiled()
     def _display_data_quality_report(self):
         st.header("1. Laporan Kualitas Data")
         
         st.subheader("1.1. Statistik Data Awal")
-        st.info(f"Dataset awal memiliki **{self.df_raw.shape[0]} baris** dan **{self.df_raw.shape[1]} kolom**.")
-        st.dataframe(self.df_raw.head())
+        quality = self.quality
+        st.info(f"Dataset awal memiliki **{quality.raw_rows} baris** dan **{quality.raw_columns} kolom**.")
+        st.dataframe(quality.raw_head)
+        with st.expander("Laporan Memori (dtype bawaan vs skema ringkas)"):
+            report = quality.memory
+            if report is None:
+                st.info("Laporan memori tidak tersedia pada mode streaming karena dataset tidak dimuat utuh.")
+            else:
+                st.write(f"Pemakaian memori turun dari **{report.loc['TOTAL', 'bytes_sebelum'] / 1024 ** 2:.1f} MB** menjadi **{report.loc['TOTAL', 'bytes_sesudah'] / 1024 ** 2:.1f} MB** (**{report.loc['TOTAL', 'rasio']:.1f}x** lebih kecil).")
+                st.dataframe(report)
 
         st.subheader("1.2. Analisis Missing Value & Duplikat")
         
@@ -201,138 +2627,275 @@ class DashboardApp:
         st.markdown("""
             **Penjelasan Keputusan Penanganan Data:**
             * **Duplikat Data**: Baris duplikat akan **dihapus** karena mengindikasikan entri ganda. Ini penting untuk memastikan setiap responden unik dan mencegah distorsi statistik.
+            * **Konflik `alumni_id`**: Baris berbeda dengan `alumni_id` yang sama hanya **dilaporkan**, karena tidak dapat dipastikan baris mana yang benar.
             * **Missing Value**: Baris dengan missing value pada kolom `ttfj_bulan` atau `gaji_awal_idr` akan **dihapus**. Nilai-nilai ini tidak relevan untuk alumni yang tidak bekerja atau melanjutkan studi, dan menghapusnya adalah cara paling akurat untuk menjaga integritas data saat menganalisis performa kerja.
             * **Nilai Tidak Wajar**:
                 * **`ttfj_bulan < 0`**: Baris ini akan **dihapus** karena waktu tidak mungkin negatif, yang merupakan kesalahan data.
+                * **Di luar rentang skema** (mis. `ipk` > 4 atau `nps_0_10` > 10): Baris ini akan **dihapus** karena nilainya tidak mungkin valid; jumlahnya tetap dilaporkan per kolom.
                 * **`gaji_awal_idr` ekstrem**: Nilai-nilai ini akan dinormalisasi menggunakan teknik **winsorization** (diclamp) di antara persentil ke-5 dan ke-95. Ini menjaga data tetap relevan tanpa terdistorsi oleh outlier yang ekstrem.
         """)
         
         st.info("Berikut adalah ringkasan sebelum proses pembersihan:")
-        missing_values = self.df_raw.isnull().sum()
-        missing_values_table = missing_values[missing_values > 0].reset_index().rename(columns={0: 'Jumlah Missing Value', 'index': 'Kolom'})
-        if not missing_values_table.empty:
-            st.warning("Ditemukan Missing Value pada kolom:")
-            st.dataframe(missing_values_table)
+        issues = quality.column_issues
+        issues_table = issues[issues.sum(axis=1) > 0]
+        if not issues_table.empty:
+            st.warning("Ditemukan missing value atau nilai tidak valid pada kolom:")
+            st.dataframe(issues_table.rename_axis('Kolom').rename(columns=self.ISSUE_LABELS))
         else:
-            st.info("Tidak ada missing value yang terdeteksi.")
+            st.info("Tidak ada missing value maupun nilai di luar rentang/domain skema yang terdeteksi.")
             
-        duplicate_count = self.df_raw.duplicated().sum()
+        duplicate_count = quality.duplicate_count
         if duplicate_count > 0:
             st.warning(f"Ditemukan {duplicate_count} baris duplikat.")
         else:
             st.info("Tidak ada baris duplikat yang terdeteksi.")
+        if quality.id_conflicts:
+            st.warning(f"Ditemukan {quality.id_conflicts} baris dengan `alumni_id` yang sudah dipakai baris lain berisi data berbeda ({quality.conflicting_ids} id). Baris ini tidak dihapus otomatis; periksa kembali sumber datanya.")
+        elif quality.id_conflicts == 0:
+            st.info("Tidak ada konflik `alumni_id` (id sama dengan isi berbeda).")
+        if quality.removed_rows:
+            st.write("Baris yang dibuang per aturan pembersihan:")
+            st.dataframe(pd.Series(quality.removed_rows, name='Jumlah Baris').rename_axis('Aturan'))
         
         st.markdown("---")
         st.success("Proses pembersihan data telah selesai! Data final siap untuk analisis.")
-        st.write(f"Data bersih memiliki dimensi: **{self.df_cleaned.shape[0]} baris** dan **{self.df_cleaned.shape[1]} kolom**.")
-        st.dataframe(self.df_cleaned.head())
+        st.write(f"Data bersih memiliki dimensi: **{quality.clean_rows} baris** dan **{quality.clean_columns} kolom**.")
+        st.dataframe(quality.clean_head)
         st.markdown("---")
 
+    @profiled()
     def _display_descriptive_and_performance(self):
         st.header("2. Statistik Deskriptif & Analisis Kinerja")
         
         st.subheader("2.1. Ringkasan Statistik Utama")
-        summary = self.analytics.summary(self.df_cleaned)
-        st.metric(label="Total Responden", value=summary['total_responden'])
+        summary = self.result
+        st.metric(label="Total Responden", value=summary.total_responden)
         col1, col2, col3 = st.columns(3)
         with col1:
-            st.metric(label="IPK Median", value=f"{summary['ipk_median']:.2f}")
+            st.metric(label="IPK Median", value=f"{summary.ipk_median:.2f}")
         with col2:
-            st.metric(label="TTFJ Median (Bekerja/Wirausaha)", value=f"{summary['ttfj_median_employed']:.2f} bulan")
+            st.metric(label="TTFJ Median (Bekerja/Wirausaha)", value="-" if np.isnan(summary.ttfj_median_employed) else f"{summary.ttfj_median_employed:.2f} bulan")
         with col3:
-            st.metric(label="Gaji Awal Median (Bekerja/Wirausaha)", value=f"Rp {summary['gaji_median_employed']:,.2f}")
-        st.dataframe(self.df_cleaned[['angkatan_lulus', 'status_saat_ini']].value_counts().reset_index().rename(columns={0: 'Jumlah'}))
+            st.metric(label="Gaji Awal Median (Bekerja/Wirausaha)", value="-" if np.isnan(summary.gaji_median_employed) else f"Rp {summary.gaji_median_employed:,.2f}")
+        st.dataframe(summary.status_per_angkatan)
         
         st.subheader("2.2. Analisis Kinerja")
-        perf = self.analytics.performance(self.df_cleaned)
+        perf = self.result
         col1_perf, col2_perf, col3_perf, col4_perf = st.columns(4)
         with col1_perf:
-            st.metric(label="Proporsi TTFJ ≤ 6 Bulan", value=f"{perf['proporsi_ttjf_6']:.2f}%")
+            st.metric(label="Proporsi TTFJ ≤ 6 Bulan", value=f"{perf.proporsi_ttjf_6:.2f}%")
         with col2_perf:
-            st.metric(label="TTFJ Median Angkatan Terendah", value=f"{perf['ttjf_per_angkatan'].min():.2f} bulan")
+            st.metric(label="TTFJ Median Angkatan Terendah", value=f"{perf.ttjf_per_angkatan.min():.2f} bulan")
         with col3_perf:
-            st.metric(label="Gaji Median Angkatan Tertinggi", value=f"Rp {perf['gaji_per_angkatan'].max():,.2f}")
+            st.metric(label="Gaji Median Angkatan Tertinggi", value=f"Rp {perf.gaji_per_angkatan.max():,.2f}")
         with col4_perf:
-            st.metric(label="Rasio Kesesuaian Bidang ≥ 4", value=f"{perf['proporsi_bidang_sesuai']:.2f}%")
-        st.metric(label="NPS (Net Promoter Score) Prodi", value=f"{perf['nps']:.2f}%")
+            st.metric(label="Rasio Kesesuaian Bidang ≥ 4", value=f"{perf.proporsi_bidang_sesuai:.2f}%")
+        st.metric(label="NPS (Net Promoter Score) Prodi", value=f"{perf.nps:.2f}%")
         st.markdown("---")
 
+    def _render_chart(self, plot_name: str, *data):
+        if data[0].empty:
+            st.info("Tidak ada data untuk grafik ini pada filter yang dipilih.")
+        elif self.chart_backend == CHART_BACKENDS[1]:
+            kind, chart_data = self.viz.chart_data(plot_name, *data)
+            if kind == 'line':
+                st.line_chart(chart_data)
+            else:
+                st.bar_chart(chart_data)
+        else:
+            # Placeholder diisi oleh _display_pending_charts begitu job render selesai
+            placeholder = st.empty()
+            placeholder.caption("⏳ Grafik sedang dirender di latar belakang...")
+            self._charts.append((placeholder, self._track(self.viz.submit_png(self.jobs, plot_name, *data, trace_memory=self.profiler.trace_memory))))
+
+    def _display_pending_charts(self) -> None:
+        """Mengisi placeholder grafik sesuai urutan selesainya job render."""
+        for future in as_completed({future for _, future in self._charts}):
+            for placeholder, chart_future in self._charts:
+                if chart_future is not future:
+                    continue
+                if future.exception() is not None:
+                    placeholder.error(f"Grafik gagal dirender: {future.exception()}")
+                else:
+                    placeholder.image(future.result())
+        self._charts = []
+
+    @profiled()
     def _display_visualizations(self):
         st.header("3. Visualisasi Data")
         
         st.subheader("3.1. Distribusi Status Saat Ini")
-        status_counts = self.df_cleaned['status_saat_ini'].value_counts()
-        fig = self.viz.status_distribution(status_counts)
-        st.pyplot(fig)
+        self._render_chart('status_distribution', self.result.distribusi_status)
         st.write("Insight: Grafik ini menunjukkan proporsi alumni yang sudah bekerja, melanjutkan studi, atau belum bekerja. Sebagian besar alumni dari angkatan yang ada sudah memiliki pekerjaan.")
-        plt.close(fig)
         
         st.subheader("3.2. Tren Gaji Awal Median Berdasarkan Angkatan")
-        median_gaji_angkatan = self.df_cleaned.groupby('angkatan_lulus')['gaji_awal_idr'].median().reset_index()
-        fig = self.viz.median_salary_trend(median_gaji_angkatan)
-        st.pyplot(fig)
+        median_gaji_angkatan = self.result.gaji_per_angkatan.reset_index()
+        self._render_chart('median_salary_trend', median_gaji_angkatan)
         st.write("Insight: Grafik ini menunjukkan tren gaji awal median dari waktu ke waktu, yang dapat mencerminkan kondisi pasar kerja atau peningkatan kompetensi lulusan. Terlihat fluktuasi yang perlu dianalisis lebih lanjut.")
-        plt.close(fig)
         
         st.subheader("3.3. Distribusi Waktu Tunggu Kerja (TTFJ)")
-        ttfj_df = self.df_cleaned[self.df_cleaned['status_saat_ini'].isin(['Bekerja', 'Wirausaha'])]
-        fig = self.viz.ttfj_hist(ttfj_df['ttfj_bulan'])
-        st.pyplot(fig)
+        ttfj_distribution = self.result.ttfj_distribution
+        self._render_chart('ttfj_hist', ttfj_distribution.index.to_series(), ttfj_distribution)
         st.write("Insight: Histogram ini menunjukkan sebaran waktu yang dibutuhkan alumni untuk mendapatkan pekerjaan pertama. Puncak distribusi berada di 0-5 bulan, menunjukkan sebagian besar lulusan cepat diserap oleh pasar kerja.")
-        plt.close(fig)
         
         st.subheader("3.4. Rasio Kesesuaian Bidang per Sektor")
-        df_employed = self.df_cleaned[self.df_cleaned['status_saat_ini'].isin(['Bekerja', 'Wirausaha'])]
-        kesesuaian_per_sektor = df_employed.groupby('sektor')['kesesuaian_bidang_1_5'].apply(lambda x: (x >= 4).sum() / len(x) * 100).sort_values(ascending=False)
-        fig = self.viz.kesesuaian_by_sektor(kesesuaian_per_sektor)
-        st.pyplot(fig)
+        self._render_chart('kesesuaian_by_sektor', self.result.kesesuaian_per_sektor)
         st.write("Insight: Grafik ini menyoroti sektor mana yang paling relevan dengan latar belakang pendidikan alumni. Sektor TIK dan Energi memiliki rasio kesesuaian tertinggi.")
-        plt.close(fig)
 
+    @profiled()
     def _display_comparison_analysis(self):
         st.header("4. Analisis Perbandingan")
         
         st.subheader("4.1. TTFJ: Alumni Magang vs Non-Magang")
-        comp = self.analytics.comparison(self.df_cleaned)
-        st.write(f"Median TTFJ untuk alumni yang pernah magang: **{comp['ttfj_magang']:.2f}** bulan")
-        st.write(f"Median TTFJ untuk alumni yang tidak pernah magang: **{comp['ttfj_non_magang']:.2f}** bulan")
-        if comp['ttfj_magang'] < comp['ttfj_non_magang']:
+        comp = self.result
+        for label, value in (("pernah magang", comp.ttfj_magang), ("tidak pernah magang", comp.ttfj_non_magang)):
+            shown = "tidak ada data" if np.isnan(value) else f"**{value:.2f}** bulan"
+            st.write(f"Median TTFJ untuk alumni yang {label}: {shown}")
+        comparison = self.inference.comparisons.get('ttfj_magang') if self.inference is not None else None
+        if comparison is not None:
+            st.caption(_evidence(comparison, _fmt_bulan))
+        if np.isnan(comp.ttfj_magang) or np.isnan(comp.ttfj_non_magang):
+            st.info("Temuan: Perbandingan tidak tersedia karena salah satu kelompok (magang/tidak magang) kosong pada filter ini.")
+        elif comp.ttfj_magang < comp.ttfj_non_magang and (comparison is None or comparison.significant):
             st.success("Temuan: Alumni yang pernah magang mendapatkan pekerjaan lebih cepat.")
         else:
             st.warning("Temuan: Alumni yang tidak pernah magang mendapatkan pekerjaan lebih cepat atau perbedaannya kecil.")
         
         st.subheader("4.2. Gaji Awal Berdasarkan Level Jabatan")
-        gaji_per_level = self.analytics.comparison(self.df_cleaned)['gaji_per_level']
-        fig = self.viz.gaji_per_level(gaji_per_level)
-        st.pyplot(fig)
+        gaji_per_level = self.result.gaji_per_level
+        self._render_chart('gaji_per_level', gaji_per_level)
         st.write("Temuan Penting:")
-        st.markdown(f"- **Gap terbesar**: Terlihat gap gaji terbesar antara level **{gaji_per_level.index[0]}** dan **{gaji_per_level.index[-1]}**, menunjukkan lonjakan kompensasi yang signifikan seiring pengalaman dan kenaikan jabatan.")
+        if not gaji_per_level.empty:
+            st.markdown(f"- **Gap terbesar**: Terlihat gap gaji terbesar antara level **{gaji_per_level.index[0]}** dan **{gaji_per_level.index[-1]}**, menunjukkan lonjakan kompensasi yang signifikan seiring pengalaman dan kenaikan jabatan.")
         st.markdown("- **Pola Lintas Jabatan**: Terdapat pola kenaikan gaji yang konsisten dari level Intern/Apprentice hingga Senior, menegaskan bahwa pengalaman kerja dan posisi memengaruhi pendapatan awal.")
-        plt.close(fig)
+        if self.inference is not None:
+            self._display_inference()
+
+    KPI_LABELS = {
+        'ipk_median': 'IPK median',
+        'ttfj_median_employed': 'TTFJ median (bulan)',
+        'gaji_median_employed': 'Gaji awal median (Rp)',
+        'proporsi_ttjf_6': 'Proporsi TTFJ ≤ 6 bulan (%)',
+        'proporsi_bidang_sesuai': 'Rasio kesesuaian bidang ≥ 4 (%)',
+        'nps': 'NPS (%)',
+    }
+    COMPARISON_LABELS = {
+        'ttfj_magang': 'TTFJ median: magang vs tidak magang',
+        'ttfj_angkatan': 'TTFJ median: angkatan terbaru vs terlama',
+        'gaji_angkatan': 'Gaji awal median: angkatan terbaru vs terlama',
+        'gaji_level': 'Gaji awal median: level tertinggi vs terendah',
+        'kesesuaian_sektor': 'Kesesuaian bidang (%): sektor teratas vs lainnya',
+    }
+
+    def _display_inference(self):
+        inference = self.inference
+        level = f"{1 - inference.alpha:.0%}"
+        st.subheader("4.3. Uji Signifikansi (Bootstrap & Permutasi)")
+        st.write(f"Interval kepercayaan {level} dari {inference.n_resamples:,} resample bootstrap (persentil) dan "
+                 f"p-value uji permutasi dua sisi; perbedaan dianggap signifikan bila p < {inference.alpha:g}.")
+        st.dataframe(pd.DataFrame(
+            [(self.KPI_LABELS[key], est.value, est.ci_low, est.ci_high, est.n) for key, est in inference.kpis.items()],
+            columns=['Metrik', 'Estimasi', f'CI {level} bawah', f'CI {level} atas', 'n'],
+        ), hide_index=True)
+        st.dataframe(pd.DataFrame(
+            [(self.COMPARISON_LABELS[key], c.label_a, c.label_b, c.a.value, c.b.value, c.difference.value,
+              c.difference.ci_low, c.difference.ci_high, c.p_value, "Ya" if c.significant else "Tidak")
+             for key, c in inference.comparisons.items()],
+            columns=['Perbandingan', 'A', 'B', 'Nilai A', 'Nilai B', 'Selisih (A - B)',
+                     f'CI {level} bawah', f'CI {level} atas', 'p-value', 'Signifikan'],
+        ), hide_index=True)
+        with st.expander("CI median per angkatan"):
+            col1, col2 = st.columns(2)
+            col1.write("**TTFJ (bulan)**")
+            col1.dataframe(inference.ttfj_per_angkatan)
+            col2.write("**Gaji awal (Rp)**")
+            col2.dataframe(inference.gaji_per_angkatan)
 
+    @profiled()
     def _display_recommendations(self):
         st.header("5. Rekomendasi Prioritas Berbasis Data")
         st.write("Berdasarkan temuan di atas, berikut adalah tiga rekomendasi prioritas untuk Program Studi:")
-        st.markdown("""
-            1.  **Penguatan Kemitraan Industri**: Mengingat TTFJ median untuk alumni yang magang adalah **2.55 bulan**, jauh lebih cepat dibandingkan dengan yang tidak magang (**5.7 bulan**), prodi dapat memperluas kemitraan dengan perusahaan untuk menyediakan lebih banyak peluang magang, terutama melalui kanal "Konversi Magang".
-            2.  **Fokus pada Sektor Relevan**: Rasio kesesuaian bidang menunjukkan sektor **TIK** dan **Energi** memiliki relevansi tertinggi. Prodi dapat memprioritaskan kurikulum atau sertifikasi yang berfokus pada sektor-sektor ini untuk meningkatkan kesiapan lulusan.
-            3.  **Peningkatan Kompetensi Khusus**: Dengan gaji awal yang sangat bervariasi antar level jabatan, prodi dapat menekankan pengembangan kompetensi yang dibutuhkan untuk posisi `Middle` dan `Senior` sejak dini, untuk mempersiapkan lulusan dengan daya tawar gaji yang lebih tinggi.
-        """)
+        recommendations = build_recommendations(self.result, self.inference)
+        st.markdown("\n".join(f"{number}. {text}" for number, text in enumerate(recommendations, start=1)))
         st.markdown("---")
 
+    @profiled()
     def _display_executive_summary(self):
         st.header("Ringkasan Eksekutif")
         st.write("Dasbor ini menyajikan analisis komprehensif dari data tracer study alumni. "
                  "Kami mengidentifikasi metrik kunci yang memengaruhi kesuksesan lulusan, "
                  "mengukur kinerja program studi, dan memberikan rekomendasi strategis.")
-        st.markdown("""
-            - **KPI Utama**: Waktu Tunggu Kerja (TTFJ) median adalah 4.0 bulan dan median gaji awal berada di kisaran Rp 7.500.000. Rasio kesesuaian bidang mencapai 70.3%.
-            - **Satu Risiko Utama**: Terdapat kesenjangan gaji yang signifikan antar angkatan dan level jabatan, menunjukkan ketidakstabilan pasar kerja atau variasi kualitas lulusan.
-            - **Langkah 90 Hari**: Fokus pada program mentoring dan workshop industri untuk mengurangi TTFJ, serta perluasan kemitraan dengan sektor TIK dan Energi yang menunjukkan kinerja tertinggi.
-        """)
+        st.markdown("\n".join(f"- {point}" for point in build_executive_summary(self.result, self.inference)))
         st.markdown("---")
     
+    def _display_cache_stats(self):
+        with st.sidebar.expander("Statistik Cache"):
+            stats = self.cache.stats()
+            st.write(f"Sidik jari dataset: `{self.fingerprint}`")
+            st.write(f"Hit: **{stats['hits'] + stats['disk_hits']}** · Miss: **{stats['misses']}** · Rasio hit: **{stats['hit_rate']:.0%}**")
+            st.write(f"Memori: **{stats['memory_bytes'] / 1024 ** 2:.1f} / {stats['max_bytes'] / 1024 ** 2:.0f} MB** ({stats['entries']} entri, {stats['evictions']} eviksi)")
+            if stats['disk_dir']:
+                st.write(f"Disk (`{stats['disk_dir']}`): **{stats['disk_hits']}** hit · **{stats['disk_evictions']}** eviksi · **{stats['disk_errors']}** gagal tulis")
+            plot_stats = self.viz.cache.stats()
+            st.write(f"Cache grafik: **{plot_stats['hits']}** hit · **{plot_stats['misses']}** miss · **{plot_stats['memory_bytes'] / 1024 ** 2:.1f} MB**")
+            job_stats = self.jobs.stats()
+            st.write(f"Job latar belakang: **{job_stats['in_flight']}** berjalan · **{job_stats['deduplicated']}** digabung dengan job sesi lain · **{job_stats['failed']}** gagal")
+            st.json({'hasil': stats, 'grafik': plot_stats, 'job': job_stats}, expanded=False)
+
+    def _display_profile(self):
+        """Panel admin: profil tahap rerun ini dan agregat jalur panas seluruh sesi."""
+        registry = get_profile_registry()
+        registry.observe(self.profiler.records)
+        # Tahap job latar belakang sudah dicatat registry oleh JobQueue; di sini hanya ditampilkan
+        for future in self._job_futures.values():
+            if future.done():
+                self.profiler.records.extend(getattr(future, 'stage_records', []))
+        json_lines = self.profiler.to_json_lines(fingerprint=self.fingerprint)
+        if PROFILE_LOG_PATH:
+            try:
+                with open(PROFILE_LOG_PATH, 'a', encoding='utf-8') as handle:
+                    handle.write(json_lines)
+            except OSError:
+                pass  # log profil bersifat opsional; dashboard tetap berjalan
+        with st.expander("🛠️ Panel Admin: Profil Kinerja", expanded=False):
+            st.checkbox(
+                "Lacak puncak memori (tracemalloc) mulai rerun berikutnya",
+                key='profile_trace_memory',
+                value=self.profiler.trace_memory,
+                help="Menambah overhead pada setiap alokasi; aktifkan hanya saat menelusuri masalah memori.",
+            )
+            frame = self.profiler.to_frame()
+            if not frame.empty:
+                table = pd.DataFrame({
+                    'Tahap': ['\u2003' * depth + stage for depth, stage in zip(frame['depth'], frame['stage'])],
+                    'Wall (ms)': (frame['wall_seconds'] * 1000).round(1),
+                    'CPU (ms)': (frame['cpu_seconds'] * 1000).round(1),
+                    'Puncak (MB)': (frame['peak_bytes'].astype(float) / 1024 ** 2).round(2),
+                    'Baris masuk': frame['rows_in'].astype('Int64'),
+                    'Baris keluar': frame['rows_out'].astype('Int64'),
+                    'Cache hit': frame['cache_hits'],
+                    'Cache miss': frame['cache_misses'],
+                    'Galat': frame['error'],
+                })
+                st.write("**Rerun ini**")
+                st.dataframe(table, hide_index=True)
+            aggregate = registry.to_frame()
+            if not aggregate.empty:
+                st.write("**Jalur panas (semua sesi sejak server dimulai)**")
+                st.dataframe(aggregate.head(15))
+            col1, col2 = st.columns(2)
+            col1.download_button("Unduh JSON lines (rerun ini)", json_lines,
+                                 file_name="profil_tahap.jsonl", mime="application/x-ndjson")
+            col2.download_button("Unduh metrik Prometheus", registry.to_prometheus(),
+                                 file_name="tracer_metrics.prom", mime="text/plain")
+
     def run(self):
+        with self.profiler.activate():
+            self._run()
+        self._display_profile()
+
+    @profiled("DashboardApp.run")
+    def _run(self):
         st.title("Proyek UTS: Analisis Data Tracer Study Alumni Teknik Elektro UNSIKA")
         st.markdown("---")
         
@@ -344,37 +2907,90 @@ class DashboardApp:
             index=0,
         )
 
+        self.chart_backend = st.sidebar.selectbox(
+            "Backend grafik",
+            options=CHART_BACKENDS,
+            index=0,
+            help="Native mengirim data pra-agregasi ke browser sehingga server tidak merender gambar.",
+        )
+
+        streaming = st.sidebar.checkbox(
+            "Mode streaming (file besar)",
+            value=False,
+            help="Membaca CSV per chunk sehingga memori tetap terbatas; median dihitung sebagai perkiraan.",
+        )
+
+        inference = st.sidebar.checkbox(
+            "Mode inferensi statistik",
+            value=False,
+            help=f"Menambahkan CI bootstrap ({INFERENCE_RESAMPLES:,} resample) dan p-value uji permutasi; "
+                 "rekomendasi hanya menyatakan perbedaan yang lolos uji signifikansi.",
+        )
+
         try:
-            with st.spinner('Memuat dan memproses data...'):
-                if data_source == "File default":
-                    # Gunakan path bawaan
-                    self.df_raw = self.loader.load(self.dataset_path, REQUIRED_COLUMNS)
-                elif data_source == "Unggah CSV":
-                    uploaded = st.sidebar.file_uploader("Unggah file CSV", type=["csv"])
-                    if uploaded is None:
-                        st.info("Silakan unggah file CSV pada sidebar untuk melanjutkan.")
-                        st.stop()
-                    df_uploaded = pd.read_csv(uploaded, dtype={'alumni_id': str})
-                    validate_dataset_columns(df_uploaded, REQUIRED_COLUMNS)
-                    self.df_raw = df_uploaded
-                else:  # Path manual
-                    manual_path = st.sidebar.text_input(
-                        "Masukkan path lengkap file CSV",
-                        value=self.dataset_path,
-                    )
-                    if not manual_path:
-                        st.info("Masukkan path file CSV pada sidebar untuk melanjutkan.")
-                        st.stop()
-                    self.df_raw = self.loader.load(manual_path, REQUIRED_COLUMNS)
-
-                self.df_cleaned = clean_data(self.df_raw.copy())
+            if data_source == "File default":
+                # Gunakan path bawaan
+                source = self.dataset_path
+                self.fingerprint = fingerprint_file(source)
+            elif data_source == "Unggah CSV":
+                uploaded = st.sidebar.file_uploader("Unggah file CSV", type=["csv"])
+                if uploaded is None:
+                    st.info("Silakan unggah file CSV pada sidebar untuk melanjutkan.")
+                    st.stop()
+                uploaded.seek(0)
+                source = uploaded
+                self.fingerprint = fingerprint_bytes(uploaded.getvalue())
+            else:  # Path manual
+                manual_path = st.sidebar.text_input(
+                    "Masukkan path lengkap file CSV",
+                    value=self.dataset_path,
+                )
+                if not manual_path:
+                    st.info("Masukkan path file CSV pada sidebar untuk melanjutkan.")
+                    st.stop()
+                source = manual_path
+                self.fingerprint = fingerprint_file(manual_path)
 
+            waves = st.sidebar.file_uploader(
+                "Gelombang survei baru (append)",
+                type=["csv"],
+                accept_multiple_files=True,
+                help="Gelombang ditambahkan ke agregat yang tersimpan tanpa memproses ulang data sebelumnya.",
+            )
+            # Semua tahap dijadwalkan sekarang; setiap bagian halaman dirender begitu job-nya selesai
+            if waves:
+                self._submit_incremental(source, waves)
+            elif streaming:
+                self._submit_streaming(source)
+            else:
+                self._submit_in_memory(source)
+
+            self.quality = self._await('quality', 'Memuat dan memeriksa kualitas data...')
             self._display_data_quality_report()
-            self._display_descriptive_and_performance()
-            self._display_visualizations()
-            self._display_comparison_analysis()
-            self._display_recommendations()
-            self._display_executive_summary()
+            if 'cube' in self.pending:
+                self.cube = self._await('cube', 'Menyiapkan agregat untuk filter...')
+                selections = self._sidebar_filters(self.cube)
+                self.result = self.cube.query(selections)
+                if inference:
+                    self._submit_inference(selections)
+            else:
+                self.result = self._await('result', 'Menghitung KPI...')
+                st.sidebar.caption("Filter dan mode inferensi hanya tersedia pada mode di memori (tanpa streaming/append).")
+            if 'dataset' in self.pending:
+                self._display_wave_summaries()
+
+            if self.result.total_responden == 0:
+                st.warning("Tidak ada responden yang cocok dengan kombinasi filter di sidebar.")
+            else:
+                self._display_descriptive_and_performance()
+                self._display_visualizations()
+                if 'inference' in self.pending:
+                    self.inference = self._await('inference', 'Menghitung interval kepercayaan dan uji signifikansi...')
+                self._display_comparison_analysis()
+                self._display_recommendations()
+                self._display_executive_summary()
+                self._display_pending_charts()
+            self._display_cache_stats()
 
         except FileNotFoundError as fnf:
             st.error(
@@ -387,5 +3003,8 @@ class DashboardApp:
 
 # --- Blok Eksekusi Utama ---
 if __name__ == "__main__":
+    # Konfigurasi halaman hanya saat dijalankan via `streamlit run`, agar modul dapat diimpor
+    # tanpa efek samping oleh batch_report.py dan benchmark.
+    st.set_page_config(layout="wide", page_title="Analisis Tracer Study Alumni Teknik Elektro UNSIKA")
     app = DashboardApp(DATASET_PATH)
     app.run()
\ No newline at end of file
@@ -0,0 +1,281 @@
+"""Pembuat laporan batch (headless) untuk tracer study alumni.
+
+Memakai ulang clean_data, compute_analytics, dan fungsi plot_* dari dashboard
+tanpa sesi Streamlit, lalu menyebar dataset/partisi ke ProcessPoolExecutor dan
+menulis laporan statis JSON/HTML/PDF per program studi atau angkatan.
+
+Contoh:
+    python batch_report.py data/*.csv --out laporan --workers 8
+    python batch_report.py gabungan.csv --partition-by program_studi --formats json,html
+"""
+import argparse
+import base64
+import html
+import io
+import json
+import math
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, fields
+from typing import Dict, List, Optional, Tuple
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_pdf import PdfPages
+import numpy as np
+import pandas as pd
+
+import analisis_tracer_alumni_teknik_elektro_unsika as tracer
+
+REPORT_FORMATS: List[str] = ["json", "html", "pdf"]
+
+@dataclass(frozen=True)
+class ReportJob:
+    """Satu unit kerja: satu file dataset, opsional dibatasi ke satu nilai partisi."""
+    name: str
+    path: str
+    fingerprint: str
+    partition_by: Optional[str]
+    partition_value: object
+    out_dir: str
+    formats: Tuple[str, ...]
+
+def _slug(text: str) -> str:
+    return re.sub(r"[^0-9A-Za-z]+", "_", text).strip("_") or "laporan"
+
+def _json_value(value):
+    if isinstance(value, (np.integer,)):
+        return int(value)
+    if isinstance(value, (float, np.floating)):
+        return None if math.isnan(value) else float(value)
+    if isinstance(value, (np.bool_,)):
+        return bool(value)
+    return value
+
+def result_to_dict(result: tracer.AnalyticsResult) -> dict:
+    """Mengubah AnalyticsResult menjadi dict yang dapat diserialisasi ke JSON."""
+    payload = {}
+    for f in fields(result):
+        value = getattr(result, f.name)
+        if isinstance(value, pd.DataFrame):
+            payload[f.name] = [{k: _json_value(v) for k, v in row.items()} for row in value.to_dict(orient="records")]
+        elif isinstance(value, pd.Series):
+            payload[f.name] = {str(k): _json_value(v) for k, v in value.items()}
+        else:
+            payload[f.name] = _json_value(value)
+    return payload
+
+def quality_to_dict(quality: tracer.DataQualityReport) -> dict:
+    return {
+        "raw_rows": quality.raw_rows,
+        "raw_columns": quality.raw_columns,
+        "missing_values": {str(k): int(v) for k, v in quality.missing_values.items() if v},
+        "duplicate_count": quality.duplicate_count,
+        "id_conflicts": quality.id_conflicts,
+        "conflicting_ids": quality.conflicting_ids,
+        "column_issues": {
+            str(col): {issue: int(count) for issue, count in row.items()}
+            for col, row in quality.column_issues.iterrows() if row.any()
+        },
+        "removed_rows": quality.removed_rows,
+        "clean_rows": quality.clean_rows,
+        "clean_columns": quality.clean_columns,
+    }
+
+def build_figures(result: tracer.AnalyticsResult) -> List[Tuple[str, plt.Figure]]:
+    """Membuat grafik yang sama dengan dashboard; grafik dengan data kosong dilewati."""
+    plots = [
+        ("Distribusi Status Saat Ini", tracer.plot_status_distribution, (result.distribusi_status,)),
+        ("Tren Gaji Awal Median per Angkatan", tracer.plot_median_salary_trend, (result.gaji_per_angkatan.reset_index(),)),
+        ("Distribusi TTFJ", tracer.plot_ttfj_hist, (result.ttfj_distribution.index.to_series(), result.ttfj_distribution)),
+        ("Rasio Kesesuaian Bidang per Sektor", tracer.plot_kesesuaian_by_sektor, (result.kesesuaian_per_sektor,)),
+        ("Gaji Awal Median per Level Jabatan", tracer.plot_gaji_per_level, (result.gaji_per_level,)),
+    ]
+    return [(title, plot(*data)) for title, plot, data in plots if not data[0].empty]
+
+def _kpi_text(value: float, text: str) -> str:
+    """Teks KPI, atau "-" seperti dashboard bila nilainya NaN (mis. partisi tanpa alumni bekerja)."""
+    return "-" if np.isnan(value) else text
+
+def _kpi_rows(result: tracer.AnalyticsResult) -> List[Tuple[str, str]]:
+    return [
+        ("Total Responden", f"{result.total_responden}"),
+        ("IPK Median", _kpi_text(result.ipk_median, f"{result.ipk_median:.2f}")),
+        ("TTFJ Median (Bekerja/Wirausaha)", _kpi_text(result.ttfj_median_employed, f"{result.ttfj_median_employed:.2f} bulan")),
+        ("Gaji Awal Median (Bekerja/Wirausaha)", _kpi_text(result.gaji_median_employed, f"Rp {result.gaji_median_employed:,.2f}")),
+        ("Proporsi TTFJ ≤ 6 Bulan", _kpi_text(result.proporsi_ttjf_6, f"{result.proporsi_ttjf_6:.2f}%")),
+        ("Rasio Kesesuaian Bidang ≥ 4", _kpi_text(result.proporsi_bidang_sesuai, f"{result.proporsi_bidang_sesuai:.2f}%")),
+        ("NPS Prodi", _kpi_text(result.nps, f"{result.nps:.2f}%")),
+        ("Median TTFJ Magang / Non-Magang",
+         f"{_kpi_text(result.ttfj_magang, f'{result.ttfj_magang:.2f}')} / "
+         f"{_kpi_text(result.ttfj_non_magang, f'{result.ttfj_non_magang:.2f}')} bulan"),
+    ]
+
+def _figure_png(fig: plt.Figure) -> bytes:
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", dpi=120, bbox_inches="tight")
+    return buffer.getvalue()
+
+def write_html(path: str, title: str, result: tracer.AnalyticsResult, quality: tracer.DataQualityReport,
+               figures: List[Tuple[str, plt.Figure]]) -> None:
+    rows = "".join(f"<tr><th>{html.escape(k)}</th><td>{html.escape(v)}</td></tr>" for k, v in _kpi_rows(result))
+    images = "".join(
+        f"<h3>{html.escape(name)}</h3><img alt='{html.escape(name)}' src='data:image/png;base64,"
+        f"{base64.b64encode(_figure_png(fig)).decode('ascii')}'/>"
+        for name, fig in figures
+    )
+    document = f"""<!DOCTYPE html>
+<html lang="id"><head><meta charset="utf-8"><title>{html.escape(title)}</title>
+<style>body{{font-family:sans-serif;max-width:960px;margin:auto}}img{{max-width:100%}}th{{text-align:left;padding-right:1em}}</style>
+</head><body>
+<h1>{html.escape(title)}</h1>
+<p>Data awal {quality.raw_rows} baris ({quality.duplicate_count} duplikat, {quality.id_conflicts} konflik alumni_id); data bersih {quality.clean_rows} baris.</p>
+<h2>KPI Utama</h2><table>{rows}</table>
+<h2>Visualisasi</h2>{images}
+</body></html>"""
+    with open(path, "w", encoding="utf-8") as handle:
+        handle.write(document)
+
+def write_pdf(path: str, title: str, result: tracer.AnalyticsResult, figures: List[Tuple[str, plt.Figure]]) -> None:
+    with PdfPages(path) as pdf:
+        cover = plt.figure(figsize=(8.27, 11.69))
+        cover.text(0.08, 0.92, title, fontsize=16, weight="bold")
+        for i, (label, value) in enumerate(_kpi_rows(result)):
+            cover.text(0.08, 0.85 - i * 0.04, f"{label}: {value}", fontsize=11)
+        pdf.savefig(cover)
+        plt.close(cover)
+        for _, fig in figures:
+            pdf.savefig(fig, bbox_inches="tight")
+
+def build_report(job: ReportJob) -> dict:
+    """Dijalankan di proses worker: muat snapshot, bersihkan, hitung, dan tulis laporan."""
+    started = time.perf_counter()
+    columns = tracer.REQUIRED_COLUMNS + ([job.partition_by] if job.partition_by and job.partition_by not in tracer.REQUIRED_COLUMNS else [])
+    df_raw = tracer.DataLoader.load(job.path, columns, job.fingerprint)
+    if job.partition_by:
+        df_raw = df_raw[df_raw[job.partition_by] == job.partition_value].reset_index(drop=True)
+    profile = tracer.profile_data(df_raw)
+    df_cleaned = tracer.clean_data(df_raw, profile=profile, **tracer.CLEANING_PARAMS)
+    result = tracer.compute_analytics(df_cleaned)
+    quality = tracer.build_quality_report(df_raw, df_cleaned, profile)
+
+    report_dir = os.path.join(job.out_dir, _slug(job.name))
+    os.makedirs(report_dir, exist_ok=True)
+    title = f"Laporan Tracer Study Alumni — {job.name}"
+    payload = {"name": job.name, "source": job.path, "quality": quality_to_dict(quality), "analytics": result_to_dict(result)}
+    if "json" in job.formats:
+        with open(os.path.join(report_dir, "report.json"), "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, ensure_ascii=False, indent=2)
+    if "html" in job.formats or "pdf" in job.formats:
+        figures = build_figures(result) if result.total_responden else []
+        try:
+            if "html" in job.formats:
+                write_html(os.path.join(report_dir, "report.html"), title, result, quality, figures)
+            if "pdf" in job.formats:
+                write_pdf(os.path.join(report_dir, "report.pdf"), title, result, figures)
+        finally:
+            for _, fig in figures:
+                plt.close(fig)
+    return {
+        "name": job.name,
+        "dir": report_dir,
+        "total_responden": result.total_responden,
+        "ttfj_median_employed": _json_value(result.ttfj_median_employed),
+        "gaji_median_employed": _json_value(result.gaji_median_employed),
+        "nps": _json_value(result.nps),
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+
+def plan_jobs(paths: List[str], out_dir: str, formats: Tuple[str, ...], partition_by: Optional[str]) -> List[ReportJob]:
+    """Menyusun daftar job; snapshot kolumnar dibuat di sini agar worker cukup membuka memory-map."""
+    jobs = []
+    columns = tracer.REQUIRED_COLUMNS + ([partition_by] if partition_by and partition_by not in tracer.REQUIRED_COLUMNS else [])
+    for path in paths:
+        fingerprint = tracer.fingerprint_file(path)
+        base_name = os.path.splitext(os.path.basename(path))[0]
+        if not partition_by:
+            tracer.DataLoader.load(path, columns, fingerprint)
+            jobs.append(ReportJob(base_name, path, fingerprint, None, None, out_dir, formats))
+            continue
+        values = tracer.DataLoader.load(path, columns, fingerprint)[partition_by].dropna().unique().tolist()
+        for value in sorted(values):
+            name = f"{base_name} {partition_by}={value}" if len(paths) > 1 else f"{partition_by}={value}"
+            jobs.append(ReportJob(name, path, fingerprint, partition_by, value, out_dir, formats))
+    return jobs
+
+def run_batch(jobs: List[ReportJob], workers: int) -> Tuple[List[dict], Dict[str, str]]:
+    """Menjalankan job secara paralel; mengembalikan ringkasan sukses dan pesan galat per job."""
+    summaries, failures = [], {}
+    if workers <= 1:
+        for job in jobs:
+            try:
+                summaries.append(build_report(job))
+            except Exception as exc:  # satu job gagal tidak boleh menghentikan job lain maupun penulisan indeks
+                failures[job.name] = f"{type(exc).__name__}: {exc}"
+                print(f"[GAGAL] {job.name}: {failures[job.name]}", file=sys.stderr)
+        return summaries, failures
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(build_report, job): job for job in jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                summary = future.result()
+            except Exception as exc:  # termasuk BrokenProcessPool bila worker mati
+                failures[job.name] = f"{type(exc).__name__}: {exc}"
+                print(f"[GAGAL] {job.name}: {failures[job.name]}", file=sys.stderr)
+                continue
+            summaries.append(summary)
+            print(f"[OK] {summary['name']} ({summary['total_responden']} responden, {summary['seconds']} dtk)")
+    return summaries, failures
+
+def write_index(out_dir: str, summaries: List[dict], failures: Dict[str, str]) -> None:
+    summaries = sorted(summaries, key=lambda s: s["name"])
+    with open(os.path.join(out_dir, "index.json"), "w", encoding="utf-8") as handle:
+        json.dump({"reports": summaries, "failures": failures}, handle, ensure_ascii=False, indent=2)
+    rows = "".join(
+        f"<tr><td><a href='{html.escape(os.path.relpath(s['dir'], out_dir))}/report.html'>{html.escape(s['name'])}</a></td>"
+        f"<td>{s['total_responden']}</td><td>{s['ttfj_median_employed']}</td><td>{s['gaji_median_employed']}</td><td>{s['nps']}</td></tr>"
+        for s in summaries
+    )
+    with open(os.path.join(out_dir, "index.html"), "w", encoding="utf-8") as handle:
+        handle.write(
+            "<!DOCTYPE html><html lang='id'><head><meta charset='utf-8'><title>Indeks Laporan Tracer</title></head><body>"
+            "<h1>Indeks Laporan Tracer Study</h1><table><tr><th>Laporan</th><th>Responden</th><th>TTFJ Median</th>"
+            f"<th>Gaji Median</th><th>NPS</th></tr>{rows}</table></body></html>"
+        )
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Laporan batch tracer study alumni tanpa Streamlit.")
+    parser.add_argument("inputs", nargs="+", help="File CSV dataset (satu per program studi, atau satu file gabungan).")
+    parser.add_argument("--out", default="laporan", help="Direktori keluaran (default: laporan).")
+    parser.add_argument("--partition-by", default=None, help="Kolom untuk memecah dataset, mis. program_studi atau angkatan_lulus.")
+    parser.add_argument("--formats", default=",".join(REPORT_FORMATS), help="Daftar format dipisah koma: json,html,pdf.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Jumlah proses worker.")
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    formats = tuple(fmt.strip().lower() for fmt in args.formats.split(",") if fmt.strip())
+    unknown = [fmt for fmt in formats if fmt not in REPORT_FORMATS]
+    if unknown:
+        print(f"Format tidak dikenal: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+    os.makedirs(args.out, exist_ok=True)
+    started = time.perf_counter()
+    try:
+        jobs = plan_jobs(args.inputs, args.out, formats, args.partition_by)
+    except (ValueError, OSError) as exc:
+        print(f"Gagal memuat dataset: {exc}", file=sys.stderr)
+        return 1
+    summaries, failures = run_batch(jobs, min(args.workers, len(jobs)) if jobs else 1)
+    write_index(args.out, summaries, failures)
+    print(f"{len(summaries)} laporan ditulis ke {args.out} dalam {time.perf_counter() - started:.1f} dtk"
+          + (f"; {len(failures)} gagal" if failures else ""))
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
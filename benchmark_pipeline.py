@@ -0,0 +1,301 @@
+"""Benchmark pipeline load/clean/compute/plot dashboard tracer alumni.
+
+Membangkitkan data tracer sintetis secara deterministik (seed), lalu mengukur
+waktu dan puncak memori (tracemalloc) setiap tahap: DataLoader, profile_data, clean_data,
+setiap metode AnalyticsService, dan setiap metode VisualizationService.
+Hasil dibandingkan dengan baseline JSON untuk menandai regresi. Seluruhnya
+berjalan offline; dataset sintetis disimpan di --data-dir dan dipakai ulang.
+
+Contoh:
+    python benchmark_pipeline.py --sizes 10k,1m,10m --save-baseline
+    python benchmark_pipeline.py --sizes 10k,1m --repeat 5 --threshold 0.2
+"""
+import argparse
+import gc
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Callable, List, Optional, Tuple
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+
+import analisis_tracer_alumni_teknik_elektro_unsika as tracer
+
+DEFAULT_SIZES = "10k,1m,10m"
+DEFAULT_BASELINE = "benchmark_baseline.json"
+GENERATOR_BLOCK_ROWS = 1_000_000
+# Selisih waktu/memori absolut di bawah ambang ini dianggap derau pengukuran, bukan regresi
+NOISE_FLOOR_SECONDS = 0.005
+NOISE_FLOOR_BYTES = 1 << 20
+
+STATUS_CHOICES = (["Bekerja", "Wirausaha", "Studi Lanjut", "Belum Bekerja"], [0.6, 0.1, 0.15, 0.15])
+SEKTOR_CHOICES = ["TIK", "Energi", "Manufaktur", "Pemerintahan", "Pendidikan"]
+LEVEL_CHOICES = ["Intern/Apprentice", "Junior", "Middle", "Senior"]
+LEVEL_SALARY_FACTOR = np.array([0.7, 1.0, 1.3, 1.7])
+
+@dataclass
+class StageResult:
+    """Hasil pengukuran satu tahap pada satu ukuran dataset."""
+    rows: int
+    stage: str
+    seconds_min: float
+    seconds_median: float
+    peak_bytes: int
+    rows_out: Optional[int] = None
+
+# --- Generator Data Sintetis ---
+def _generate_block(rng: np.random.Generator, start_id: int, n_unique: int, duplicate_rate: float) -> pd.DataFrame:
+    status = rng.choice(STATUS_CHOICES[0], n_unique, p=STATUS_CHOICES[1])
+    level_codes = rng.integers(0, len(LEVEL_CHOICES), n_unique)
+    magang = rng.random(n_unique) < 0.55
+    ttfj = np.round(rng.gamma(2.0, 2.0, n_unique) * np.where(magang, 0.8, 1.1), 1)
+    gaji = np.round(rng.lognormal(15.8, 0.35, n_unique) * LEVEL_SALARY_FACTOR[level_codes], -3)
+    # Pencilan gaji (salah ketik nol berlebih / kurang) dan TTFJ negatif seperti pada data survei asli
+    outlier_high = rng.random(n_unique) < 0.005
+    gaji[outlier_high] *= rng.integers(8, 15, int(outlier_high.sum()))
+    outlier_low = rng.random(n_unique) < 0.002
+    gaji[outlier_low] = np.round(gaji[outlier_low] / 100, -3)
+    ttfj[rng.random(n_unique) < 0.01] = -1.0
+    ttfj[rng.random(n_unique) < 0.05] = np.nan
+    gaji[rng.random(n_unique) < 0.05] = np.nan
+    df = pd.DataFrame({
+        "alumni_id": pd.Series(np.arange(start_id, start_id + n_unique)).astype(str).str.zfill(8).radd("ALM"),
+        "angkatan_lulus": rng.integers(2015, 2025, n_unique).astype(np.int16),
+        "status_saat_ini": status,
+        "ipk": np.round(rng.normal(3.25, 0.3, n_unique).clip(2.0, 4.0), 2),
+        "magang": magang.astype(np.int8),
+        "sertifikasi": (rng.random(n_unique) < 0.4).astype(np.int8),
+        "projects_count": rng.poisson(3, n_unique).astype(np.int16),
+        "ttfj_bulan": ttfj,
+        "gaji_awal_idr": gaji,
+        "kesesuaian_bidang_1_5": rng.integers(1, 6, n_unique).astype(np.int8),
+        "relevansi_kurikulum_1_5": rng.integers(1, 6, n_unique).astype(np.int8),
+        "sektor": rng.choice(SEKTOR_CHOICES, n_unique),
+        "level_jabatan": np.asarray(LEVEL_CHOICES)[level_codes],
+        "nps_0_10": rng.integers(0, 11, n_unique).astype(np.int8),
+    }, columns=tracer.REQUIRED_COLUMNS)
+    # Duplikat persis (responden mengirim formulir dua kali) disisipkan di posisi acak
+    n_dup = int(round(n_unique * duplicate_rate))
+    if n_dup:
+        df = pd.concat([df, df.iloc[rng.integers(0, n_unique, n_dup)]], ignore_index=True)
+        df = df.iloc[rng.permutation(len(df))].reset_index(drop=True)
+    return df
+
+def generate_tracer_data(n_rows: int, seed: int = 42, duplicate_rate: float = 0.02,
+                         block_rows: int = GENERATOR_BLOCK_ROWS):
+    """Menghasilkan DataFrame sintetis per blok (total n_rows baris, termasuk duplikat).
+
+    Setiap blok memakai generator turunan (seed, nomor blok), sehingga isi data
+    sama persis untuk seed yang sama tanpa menampung seluruh dataset di memori.
+    """
+    produced, block_index = 0, 0
+    while produced < n_rows:
+        total = min(block_rows, n_rows - produced)
+        n_unique = max(1, int(round(total / (1 + duplicate_rate))))
+        rng = np.random.default_rng([seed, block_index])
+        block = _generate_block(rng, produced, n_unique, duplicate_rate).iloc[:total]
+        if len(block) < total:
+            block = pd.concat([block, block.iloc[: total - len(block)]], ignore_index=True)
+        yield block
+        produced += total
+        block_index += 1
+
+def write_synthetic_csv(path: str, n_rows: int, seed: int = 42) -> None:
+    """Menulis dataset sintetis ke CSV secara atomik (blok demi blok lewat pyarrow)."""
+    tmp_path = path + ".tmp"
+    writer = None
+    try:
+        for block in generate_tracer_data(n_rows, seed):
+            table = pa.Table.from_pandas(block, preserve_index=False)
+            if writer is None:
+                writer = pa_csv.CSVWriter(tmp_path, table.schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+    os.replace(tmp_path, path)
+
+def ensure_dataset(data_dir: str, n_rows: int, seed: int) -> str:
+    os.makedirs(data_dir, exist_ok=True)
+    path = os.path.join(data_dir, f"tracer_sintetis_{n_rows}_seed{seed}.csv")
+    if not os.path.exists(path):
+        print(f"Membangkitkan {n_rows:,} baris sintetis -> {path}")
+        write_synthetic_csv(path, n_rows, seed)
+    return path
+
+# --- Pengukuran ---
+def measure(func: Callable[[], object], repeat: int) -> Tuple[List[float], int, object]:
+    """Mengukur waktu `repeat` kali tanpa tracemalloc, lalu satu kali lagi untuk puncak memori."""
+    timings, output = [], None
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        output = func()
+        timings.append(time.perf_counter() - started)
+        del output
+    # tracemalloc memperlambat alokasi, sehingga puncak memori diukur pada putaran terpisah
+    gc.collect()
+    tracemalloc.start()
+    try:
+        output = func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return timings, peak, output
+
+def _render_figure(method: Callable, *data) -> None:
+    fig = method(*data)
+    fig.savefig(io.BytesIO(), format="png", dpi=tracer.PLOT_DPI, bbox_inches="tight")
+    plt.close(fig)
+
+def _rows_of(output) -> Optional[int]:
+    return len(output) if isinstance(output, pd.DataFrame) else None
+
+def benchmark_size(path: str, rows: int, repeat: int) -> List[StageResult]:
+    results: List[StageResult] = []
+
+    def run(stage: str, func: Callable[[], object]):
+        timings, peak, output = measure(func, repeat)
+        result = StageResult(rows, stage, min(timings), statistics.median(timings), peak, _rows_of(output))
+        results.append(result)
+        print(f"  {stage:<45} {result.seconds_median:>9.4f} dtk  {peak / 2**20:>9.1f} MiB")
+        return output
+
+    fingerprint = tracer.fingerprint_file(path)
+    run("DataLoader.read_csv", lambda: tracer.DataLoader.read_csv(path, tracer.REQUIRED_COLUMNS))
+    # Snapshot ditulis sekali di luar pengukuran; tahap load mengukur jalur start ulang (memory-mapped)
+    snapshot = tracer.DataLoader.snapshot_path(path, fingerprint)
+    if not os.path.exists(snapshot):
+        tracer.DataLoader.load(path, tracer.REQUIRED_COLUMNS, fingerprint)
+    df_raw = run("DataLoader.load", lambda: tracer.DataLoader.load(path, tracer.REQUIRED_COLUMNS, fingerprint))
+    # Frame diikat sebagai argumen default: lambda tidak bergantung pada nama df_raw yang dihapus di bawah
+    profile = run("profile_data", lambda df=df_raw: tracer.profile_data(df))
+    df_cleaned = run("clean_data", lambda df=df_raw: tracer.clean_data(df, profile=profile, **tracer.CLEANING_PARAMS))
+    del df_raw
+
+    analytics = tracer.AnalyticsService()
+    for name in ("summary", "performance", "comparison", "compute"):
+        output = run(f"AnalyticsService.{name}", lambda method=getattr(analytics, name): method(df_cleaned))
+    result: tracer.AnalyticsResult = output
+
+    viz = tracer.VisualizationService()
+    plot_inputs = {
+        "status_distribution": (result.distribusi_status,),
+        "median_salary_trend": (result.gaji_per_angkatan.reset_index(),),
+        "ttfj_hist": (result.ttfj_distribution.index.to_series(), result.ttfj_distribution),
+        "kesesuaian_by_sektor": (result.kesesuaian_per_sektor,),
+        "gaji_per_level": (result.gaji_per_level,),
+    }
+    for name, data in plot_inputs.items():
+        run(f"VisualizationService.{name}", lambda method=getattr(viz, name), data=data: _render_figure(method, *data))
+    return results
+
+# --- Baseline & Regresi ---
+def _key(result: dict) -> str:
+    return f"{result['rows']}:{result['stage']}"
+
+def compare_to_baseline(results: List[StageResult], baseline: dict, threshold: float,
+                        memory_threshold: float) -> List[str]:
+    """Daftar pesan regresi: waktu median atau puncak memori melewati baseline + ambang."""
+    reference = {_key(entry): entry for entry in baseline.get("results", [])}
+    regressions = []
+    for result in results:
+        base = reference.get(_key(asdict(result)))
+        if base is None:
+            continue
+        slower = result.seconds_median - base["seconds_median"]
+        if slower > NOISE_FLOOR_SECONDS and result.seconds_median > base["seconds_median"] * (1 + threshold):
+            regressions.append(
+                f"{result.stage} @ {result.rows:,} baris: {base['seconds_median']:.4f} -> {result.seconds_median:.4f} dtk "
+                f"(+{slower / base['seconds_median']:.0%})")
+        grown = result.peak_bytes - base["peak_bytes"]
+        if grown > NOISE_FLOOR_BYTES and result.peak_bytes > base["peak_bytes"] * (1 + memory_threshold):
+            regressions.append(
+                f"{result.stage} @ {result.rows:,} baris: memori {base['peak_bytes'] / 2**20:.1f} -> "
+                f"{result.peak_bytes / 2**20:.1f} MiB")
+    return regressions
+
+def _parse_size(text: str) -> int:
+    text = text.strip().lower().replace("_", "")
+    multiplier = {"k": 1_000, "m": 1_000_000}.get(text[-1:], 1)
+    return int(float(text.rstrip("km")) * multiplier)
+
+def _environment() -> dict:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "pyarrow": pa.__version__,
+        "cpu_count": os.cpu_count(),
+    }
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark pipeline dashboard tracer alumni (offline).")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="Ukuran dataset dipisah koma, mis. 10k,1m,10m.")
+    parser.add_argument("--seed", type=int, default=42, help="Seed generator data sintetis.")
+    parser.add_argument("--repeat", type=int, default=3, help="Jumlah pengulangan pengukuran waktu per tahap.")
+    parser.add_argument("--data-dir", default=".bench_data", help="Direktori dataset sintetis dan snapshot.")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="File baseline JSON untuk perbandingan.")
+    parser.add_argument("--save-baseline", action="store_true", help="Simpan hasil sebagai baseline baru.")
+    parser.add_argument("--output", default=None, help="Tulis hasil lengkap ke file JSON ini.")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Ambang regresi waktu relatif (default 0.25).")
+    parser.add_argument("--memory-threshold", type=float, default=0.25, help="Ambang regresi memori relatif.")
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    try:
+        sizes = [_parse_size(size) for size in args.sizes.split(",") if size.strip()]
+    except ValueError:
+        print(f"Ukuran tidak valid: {args.sizes}", file=sys.stderr)
+        return 2
+    # Snapshot Feather benchmark dipisah dari snapshot dataset asli
+    tracer.SNAPSHOT_DIR = os.path.join(args.data_dir, "snapshots")
+
+    results: List[StageResult] = []
+    for rows in sizes:
+        path = ensure_dataset(args.data_dir, rows, args.seed)
+        print(f"\n== {rows:,} baris ==")
+        results.extend(benchmark_size(path, rows, max(1, args.repeat)))
+
+    payload = {"environment": _environment(), "seed": args.seed, "repeat": args.repeat,
+               "results": [asdict(result) for result in results]}
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, indent=2)
+
+    exit_code = 0
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, encoding="utf-8") as handle:
+            baseline = json.load(handle)
+        if baseline.get("environment", {}).get("platform") != payload["environment"]["platform"]:
+            print("\nPeringatan: baseline direkam di mesin/platform lain; perbandingan waktu kurang akurat.")
+        regressions = compare_to_baseline(results, baseline, args.threshold, args.memory_threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regresi terhadap {args.baseline}:")
+            for message in regressions:
+                print(f"  - {message}")
+            exit_code = 1
+        else:
+            print(f"\nTidak ada regresi terhadap {args.baseline}.")
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, indent=2)
+        print(f"\nBaseline disimpan ke {args.baseline}.")
+    return exit_code
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""Uji kesetaraan kernel statistik kustom dengan pandas.
+
+Kernel kuantil/median berbasis np.partition dan histogram, serta AnalyticsCube.query,
+menggantikan operasi pandas di jalur panas; hasilnya harus identik bit demi bit.
+Jalankan dengan: python -m pytest -q
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+import analisis_tracer_alumni_teknik_elektro_unsika as tracer
+from benchmark_pipeline import generate_tracer_data
+
+QS = [0.013, 0.05, 0.058, 0.25, 0.5, 0.75, 0.95]  # 0.013 dan 0.058 tidak kembali utuh lewat q * 100 / 100
+
+
+def _values(rng: np.random.Generator, n: int) -> np.ndarray:
+    """Nilai dengan banyak duplikat (seperti ttfj berpresisi 0.1) dan sebagian NaN."""
+    values = np.round(rng.gamma(2.0, 2.0, n), 1)
+    values[rng.random(n) < 0.1] = np.nan
+    return values
+
+
+def _histogram(values: np.ndarray, codes: np.ndarray, n_groups: int):
+    """Matriks histogram (grup x nilai unik terurut) dari baris, sebagai masukan histogram_quantiles."""
+    valid = (codes >= 0) & ~np.isnan(values)
+    uniques, inverse = np.unique(values[valid], return_inverse=True)
+    hist = np.zeros((n_groups, len(uniques)), dtype=np.int64)
+    np.add.at(hist, (codes[valid], inverse), 1)
+    return hist, uniques
+
+
+@pytest.fixture(scope="module")
+def clean_df() -> pd.DataFrame:
+    raw = pd.concat(list(generate_tracer_data(5000, seed=7)), ignore_index=True)
+    return tracer.clean_data(tracer.apply_schema(raw), **tracer.CLEANING_PARAMS)
+
+
+@pytest.mark.parametrize("n", [1, 2, 7, 100, 1001])
+def test_quantiles_and_median_match_series(n):
+    values = _values(np.random.default_rng(n), n)
+    series = pd.Series(values)
+    np.testing.assert_array_equal(tracer.quantiles(values, QS), series.quantile(QS).to_numpy())
+    expected = series.median()
+    assert tracer.median(values) == expected or (np.isnan(expected) and np.isnan(tracer.median(values)))
+
+
+def test_median_with_mask_matches_series():
+    rng = np.random.default_rng(1)
+    values = _values(rng, 500)
+    mask = rng.random(500) < 0.3
+    assert tracer.median(values, mask) == pd.Series(values[mask]).median()
+
+
+def test_as_quantiles_matches_series_quantile_bounds():
+    # Batas winsorization clean_data harus sama persis dengan Series.quantile
+    values = np.random.default_rng(2).lognormal(15.8, 0.35, 999)
+    bounds = pd.Series(values).quantile([0.013, 0.058]).to_numpy()
+    np.testing.assert_array_equal(tracer.quantiles(values, [0.013, 0.058]), bounds)
+    assert tracer._as_quantiles([0.013])[0] != 0.013
+
+
+@pytest.mark.parametrize("n_groups", [1, 5, 40])
+def test_group_and_histogram_quantiles_match_pandas(n_groups):
+    rng = np.random.default_rng(n_groups)
+    values = _values(rng, 3000)
+    codes = rng.integers(-1, n_groups, 3000)
+    codes[codes == n_groups - 1] = -1  # grup terakhir kosong
+    # Acuannya Series.quantile per grup (interpolasi groupby().quantile berbeda di digit terakhir)
+    expected = np.array([pd.Series(values[codes == g]).quantile(QS).to_numpy() for g in range(n_groups)])
+    expected_median = pd.Series(values)[codes >= 0].groupby(codes[codes >= 0]).median().reindex(range(n_groups)).to_numpy()
+    hist, uniques = _histogram(values, codes, n_groups)
+
+    np.testing.assert_array_equal(tracer.group_quantiles(values, codes, n_groups, QS), expected)
+    np.testing.assert_array_equal(tracer.histogram_quantiles(hist, uniques, QS), expected)
+    np.testing.assert_array_equal(
+        tracer.group_quantiles(values, codes, n_groups, [0.5], average_middle=True)[:, 0], expected_median)
+    np.testing.assert_array_equal(
+        tracer.histogram_quantiles(hist, uniques, [0.5], average_middle=True)[:, 0], expected_median)
+
+
+def test_grouped_median_matches_groupby(clean_df):
+    columns = ['ipk', 'ttfj_bulan', 'gaji_awal_idr']
+    for by in ['angkatan_lulus', 'level_jabatan', 'sektor']:
+        expected = clean_df.groupby(by, observed=True)[columns].median()
+        pd.testing.assert_frame_equal(tracer.grouped_median(clean_df, by, columns), expected,
+                                      check_exact=True, check_index_type=False, check_categorical=False)
+
+
+def _assert_results_equal(actual: tracer.AnalyticsResult, expected: tracer.AnalyticsResult) -> None:
+    for name in tracer.AnalyticsResult.__dataclass_fields__:
+        a, b = getattr(actual, name), getattr(expected, name)
+        if isinstance(a, pd.DataFrame):
+            pd.testing.assert_frame_equal(a.reset_index(drop=True), b.reset_index(drop=True), check_exact=True,
+                                          check_categorical=False, check_index_type=False, obj=name)
+        elif isinstance(a, pd.Series):
+            pd.testing.assert_series_equal(a, b, check_exact=True, check_categorical=False,
+                                           check_index_type=False, obj=name)
+        else:
+            assert a == b or (np.isnan(a) and np.isnan(b)), (name, a, b)
+
+
+def test_cube_query_matches_compute_analytics(clean_df):
+    cube = tracer.AnalyticsCube(clean_df)
+    selections = [
+        {},
+        {'sektor': [clean_df['sektor'].iloc[0]]},
+        {'status_saat_ini': ['Studi Lanjut']},
+        {'status_saat_ini': ['Bekerja', 'Wirausaha'], 'magang': [True]},
+        {'angkatan_lulus': [2016, 2017, 2018], 'level_jabatan': list(clean_df['level_jabatan'].unique()[:2])},
+        {'sektor': ['tidak ada']},
+    ]
+    rng = np.random.default_rng(3)
+    for _ in range(10):
+        selection = {}
+        for dim in tracer.CUBE_DIMENSIONS:
+            if rng.random() < 0.5:
+                labels = list(cube.labels[dim])
+                picked = rng.choice(len(labels), rng.integers(1, len(labels) + 1), replace=False)
+                selection[dim] = [labels[i] for i in picked]
+        selections.append(selection)
+    for selection in selections:
+        _assert_results_equal(cube.query(selection),
+                              tracer.compute_analytics(tracer.select_rows(clean_df, selection)))